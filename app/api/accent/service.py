@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from bson import ObjectId
 from bson.errors import InvalidId
 from .models import Accent, AccentCreate, AccentUpdate
+from ..cache import ACCENT_CACHE, invalidate_cache
 
 class AccentService:
     def __init__(self, db: AsyncIOMotorDatabase):
@@ -14,8 +15,11 @@ class AccentService:
         query = {}
         if language_code:
             query["language_code"] = language_code
-        cursor = self.collection.find(query)
-        return [Accent(**doc) async for doc in cursor]
+
+        async def _load():
+            return [Accent(**doc) async for doc in self.collection.find(query)]
+
+        return list(await ACCENT_CACHE.get_or_load(f"list:{language_code or '*'}", _load))
 
     def _parse_object_id(self, accent_id: str) -> ObjectId:
         try:
@@ -37,6 +41,7 @@ class AccentService:
         if exists:
             raise HTTPException(status_code=409, detail="accent already exists")
         result = await self.collection.insert_one(payload.model_dump())
+        await invalidate_cache(ACCENT_CACHE)
         return await self.get_accent(str(result.inserted_id))
 
     async def update_accent(self, accent_id: str, payload: AccentUpdate) -> Accent:
@@ -47,6 +52,7 @@ class AccentService:
         result = await self.collection.update_one({"_id": oid}, {"$set": update_data})
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="accent not found")
+        await invalidate_cache(ACCENT_CACHE)
         return await self.get_accent(accent_id)
 
     async def delete_accent(self, accent_id: str) -> None:
@@ -54,6 +60,7 @@ class AccentService:
         result = await self.collection.delete_one({"_id": oid})
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="accent not found")
+        await invalidate_cache(ACCENT_CACHE)
 
     async def ensure_defaults(self, defaults: List[AccentCreate]) -> List[Accent]:
         results = []
@@ -66,4 +73,5 @@ class AccentService:
                 return_document=True
             )
             results.append(Accent(**result))
+        await invalidate_cache(ACCENT_CACHE)
         return results
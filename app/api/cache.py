@@ -0,0 +1,92 @@
+"""
+참조 데이터 캐시와 워커 간 무효화
+
+쓰기 경로는 `await invalidate_cache(CACHE, key)`를 호출합니다. 현재 워커의 캐시를
+즉시 비우고 이벤트 버스(cache 토픽)로 다른 워커에도 무효화를 전파합니다.
+메시지를 놓치더라도 TTL이 지나면 다시 조회됩니다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Hashable, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.api.events import EventTopic, event_bus
+from app.utils.cache import TTLCache, cache_registry
+from app.utils.metrics import INSTANCE_ID
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_CACHE = TTLCache("languages", ttl=600)
+ACCENT_CACHE = TTLCache("accents", ttl=600)
+# 잡 콜백마다 읽는 프로젝트 제목/보이스 설정
+PROJECT_META_CACHE = TTLCache("project_meta", ttl=120, maxsize=4096)
+PROJECT_META_FIELDS = ("title", "voice_config")
+
+_listener_task: Optional[asyncio.Task] = None
+
+
+async def invalidate_cache(cache: TTLCache, key: Optional[Hashable] = None) -> None:
+    """현재 워커 캐시를 비우고 다른 워커로 무효화 전파 (key가 없으면 전체)"""
+    cache.invalidate(key)
+    await event_bus.publish(
+        EventTopic.CACHE,
+        cache.name,
+        "invalidate",
+        {"key": key, "origin": INSTANCE_ID},
+    )
+
+
+async def get_project_meta(
+    db: AsyncIOMotorDatabase, project_id: str
+) -> Optional[Dict[str, Any]]:
+    """프로젝트 title/voice_config (없으면 None)"""
+    try:
+        project_oid = ObjectId(project_id)
+    except (InvalidId, TypeError):
+        return None
+
+    async def _load():
+        return await db["projects"].find_one(
+            {"_id": project_oid}, {field: 1 for field in PROJECT_META_FIELDS}
+        )
+
+    return await PROJECT_META_CACHE.get_or_load(str(project_oid), _load)
+
+
+async def _listen_invalidations() -> None:
+    subscription = event_bus.subscribe([EventTopic.CACHE])
+    try:
+        while True:
+            envelope = await subscription.get()
+            data = envelope.get("data") or {}
+            if data.get("origin") == INSTANCE_ID:
+                continue
+            cache = cache_registry.get(envelope.get("key"))
+            if cache is not None:
+                cache.invalidate(data.get("key"))
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+def start_cache_invalidation_listener() -> None:
+    global _listener_task
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.create_task(
+            _listen_invalidations(), name="cache-invalidation"
+        )
+
+
+async def stop_cache_invalidation_listener() -> None:
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    try:
+        await _listener_task
+    except asyncio.CancelledError:
+        pass
+    _listener_task = None
@@ -0,0 +1,7 @@
+"""
+통합 이벤트 버스 모듈
+"""
+from .bus import EventBus, EventSubscription, event_bus
+from .models import EventTopic
+
+__all__ = ["EventBus", "EventSubscription", "EventTopic", "event_bus"]
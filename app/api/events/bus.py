@@ -0,0 +1,269 @@
+"""
+통합 이벤트 버스
+
+모든 프로듀서(API 콜백, RQ 워커)는 `events:{topic}:{key}` Redis 채널에
+JSON 봉투 하나를 발행하고, 각 API 프로세스는 `events:*` 패턴 구독 하나로
+수신해 토픽/키 필터가 일치하는 로컬 구독 큐로 분배합니다.
+어느 워커가 콜백을 받든 모든 워커의 SSE 클라이언트에 전달됩니다.
+
+봉투 형식:
+    {"topic": "progress", "key": "<project_id>", "event": "target-progress", "data": {...}}
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from app.config.redis import get_async_redis
+from app.utils.metrics import COUNT_BUCKETS, metrics_registry
+from .models import PUBLIC_TOPICS, EventTopic
+
+logger = logging.getLogger(__name__)
+
+EVENT_CHANNEL_PREFIX = "events:"
+EVENT_CHANNEL_PATTERN = f"{EVENT_CHANNEL_PREFIX}*"
+QUEUE_MAXSIZE = 100
+RECONNECT_DELAY = 1.0
+
+EVENTS_PUBLISHED = metrics_registry.counter(
+    "event_bus_published_total", "Events published to the bus", ["topic"]
+)
+EVENTS_DELIVERED = metrics_registry.counter(
+    "event_bus_delivered_total", "Events dequeued by subscribers", ["topic"]
+)
+EVENTS_DROPPED = metrics_registry.counter(
+    "event_bus_dropped_total", "Events dropped or degraded", ["topic", "reason"]
+)
+EVENT_DELIVERY_LATENCY = metrics_registry.histogram(
+    "event_bus_delivery_latency_seconds",
+    "Latency from publish to subscriber dequeue",
+    ["topic"],
+)
+EVENT_FANOUT = metrics_registry.histogram(
+    "event_bus_fanout",
+    "Local subscriptions an event was dispatched to",
+    ["topic"],
+    buckets=COUNT_BUCKETS,
+)
+
+
+def event_channel(topic: EventTopic, key: str) -> str:
+    return f"{EVENT_CHANNEL_PREFIX}{topic.value}:{key}"
+
+
+def encode_event(topic: EventTopic, key: str, event: str, data: Any) -> str:
+    envelope = {
+        "topic": topic.value,
+        "key": key,
+        "event": event,
+        "data": data,
+        "ts": time.time(),  # 발행 시각 (전달 지연 측정용)
+    }
+    return json.dumps(envelope, ensure_ascii=False, default=str)
+
+
+class EventSubscription:
+    """구독 하나 = 필터 + 큐 하나 (SSE 연결 1개에 대응)"""
+
+    def __init__(
+        self,
+        topics: Optional[Iterable[EventTopic]] = None,
+        keys: Optional[Iterable[str]] = None,
+        maxsize: int = QUEUE_MAXSIZE,
+    ):
+        self.topics: Tuple[EventTopic, ...] = tuple(topics or PUBLIC_TOPICS)
+        self.keys: Optional[Tuple[str, ...]] = tuple(keys) if keys else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def get(self) -> Dict[str, Any]:
+        envelope = await self.queue.get()
+        topic = envelope.get("topic")
+        EVENTS_DELIVERED.inc(topic=topic)
+        published_at = envelope.get("ts")
+        if published_at:
+            EVENT_DELIVERY_LATENCY.observe(
+                max(time.time() - published_at, 0), topic=topic
+            )
+        return envelope
+
+
+class EventBus:
+    """프로세스 단위 이벤트 버스 (Redis 패턴 구독 1개 공유)"""
+
+    def __init__(self, pattern: str = EVENT_CHANNEL_PATTERN):
+        self.pattern = pattern
+        # (topic, key) -> 구독, key=None 은 해당 토픽 전체 구독
+        self._index: Dict[Tuple[EventTopic, Optional[str]], Set[EventSubscription]] = (
+            defaultdict(set)
+        )
+        self._task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+    def subscribe(
+        self,
+        topics: Optional[Iterable[EventTopic]] = None,
+        keys: Optional[Iterable[str]] = None,
+        maxsize: int = QUEUE_MAXSIZE,
+    ) -> EventSubscription:
+        """토픽/키 필터로 구독 등록 (첫 구독 시 Redis 리스너 시작)"""
+        subscription = EventSubscription(topics, keys, maxsize)
+        for index_key in self._index_keys(subscription):
+            self._index[index_key].add(subscription)
+        self._ensure_running()
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        for index_key in self._index_keys(subscription):
+            listeners = self._index.get(index_key)
+            if listeners is None:
+                continue
+            listeners.discard(subscription)
+            # 리스너가 없으면 삭제하여 메모리 누수 방지
+            if not listeners:
+                del self._index[index_key]
+
+    def subscriber_count(
+        self, topic: Optional[EventTopic] = None, key: Optional[str] = None
+    ) -> int:
+        subscriptions: Set[EventSubscription] = set()
+        for (index_topic, index_key), listeners in self._index.items():
+            if topic is not None and index_topic != topic:
+                continue
+            if key is not None and index_key not in (key, None):
+                continue
+            subscriptions.update(listeners)
+        return len(subscriptions)
+
+    def subscribed_keys(self, topic: EventTopic) -> list[str]:
+        return [
+            index_key
+            for (index_topic, index_key) in self._index
+            if index_topic == topic and index_key is not None
+        ]
+
+    def subscriber_gauge(self) -> Dict[Tuple[str, str], float]:
+        """(topic, key)별 구독 수 (토픽 전체 구독은 key='*')"""
+        return {
+            (topic.value, key if key is not None else "*"): len(listeners)
+            for (topic, key), listeners in self._index.items()
+        }
+
+    @staticmethod
+    def _index_keys(subscription: EventSubscription):
+        keys = subscription.keys or (None,)
+        return [(topic, key) for topic in subscription.topics for key in keys]
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+    async def publish(
+        self, topic: EventTopic, key: str, event: str, data: Any
+    ) -> None:
+        """이벤트 발행 (Redis 장애 시 현재 프로세스 구독자에게만 전달)"""
+        message = encode_event(topic, key, event, data)
+        EVENTS_PUBLISHED.inc(topic=topic.value)
+        try:
+            await get_async_redis().publish(event_channel(topic, key), message)
+        except RedisError as exc:
+            logger.warning(f"Event bus publish failed, delivering locally: {exc}")
+            EVENTS_DROPPED.inc(topic=topic.value, reason="publish_failed_local_only")
+            self._dispatch(json.loads(message))
+
+    @staticmethod
+    def publish_sync(
+        redis_conn: Redis, topic: EventTopic, key: str, event: str, data: Any
+    ) -> None:
+        """동기 프로듀서(RQ 워커)용 발행"""
+        redis_conn.publish(
+            event_channel(topic, key), encode_event(topic, key, event, data)
+        )
+
+    # ------------------------------------------------------------------
+    # 수신 루프
+    # ------------------------------------------------------------------
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="event-bus-subscriber")
+
+    async def _run(self) -> None:
+        """패턴 구독 루프 (연결이 끊기면 재연결)"""
+        while True:
+            pubsub = get_async_redis().pubsub()
+            try:
+                await pubsub.psubscribe(self.pattern)
+                logger.info(f"Event bus subscribed to {self.pattern}")
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    try:
+                        envelope = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        logger.warning(f"Invalid event payload on {message['channel']}")
+                        EVENTS_DROPPED.inc(topic="unknown", reason="invalid_payload")
+                        continue
+                    self._dispatch(envelope)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"Event bus subscriber error: {exc}")
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def _dispatch(self, envelope: Dict[str, Any]) -> None:
+        try:
+            topic = EventTopic(envelope.get("topic"))
+        except ValueError:
+            EVENTS_DROPPED.inc(topic="unknown", reason="unknown_topic")
+            return
+        key = envelope.get("key")
+
+        targets = self._index.get((topic, key), set()) | self._index.get(
+            (topic, None), set()
+        )
+        EVENT_FANOUT.observe(len(targets), topic=topic.value)
+        for subscription in targets:
+            queue = subscription.queue
+            try:
+                queue.put_nowait(envelope)
+            except asyncio.QueueFull:
+                # 소비하지 못하는 클라이언트는 가장 오래된 이벤트를 버림
+                logger.warning(f"Event queue full for {topic.value}:{key}")
+                EVENTS_DROPPED.inc(topic=topic.value, reason="queue_full")
+                try:
+                    queue.get_nowait()
+                    queue.put_nowait(envelope)
+                except (asyncio.QueueEmpty, asyncio.QueueFull):
+                    pass
+
+
+# 프로세스 전역 이벤트 버스
+event_bus = EventBus()
+
+metrics_registry.gauge(
+    "event_bus_subscribers",
+    "Active subscriptions per topic and key (project_id / voice_sample_id)",
+    ["topic", "key"],
+    collect=event_bus.subscriber_gauge,
+)
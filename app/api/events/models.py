@@ -0,0 +1,19 @@
+"""
+통합 이벤트 버스 모델
+"""
+
+from enum import Enum
+
+
+class EventTopic(str, Enum):
+    """이벤트 토픽 (key의 의미는 토픽별로 다름)"""
+
+    UPLOAD = "upload"  # 인제스트 진행도 (key: project_id)
+    PIPELINE = "pipeline"  # 파이프라인 단계 (key: project_id)
+    PROGRESS = "progress"  # 타겟/프로젝트 진행도, 세그먼트 오디오 (key: project_id)
+    VOICE_SAMPLE = "voice-sample"  # 음성 샘플 처리 상태 (key: voice_sample_id)
+    CACHE = "cache"  # 내부용: 워커 간 캐시 무효화 (key: 캐시 이름)
+
+
+# SSE 클라이언트에 노출되는 토픽
+PUBLIC_TOPICS = tuple(topic for topic in EventTopic if topic is not EventTopic.CACHE)
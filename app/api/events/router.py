@@ -0,0 +1,94 @@
+"""
+통합 이벤트 SSE 엔드포인트 (업로드/파이프라인/진행도/음성 샘플 멀티플렉싱)
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Query, Request
+from sse_starlette.sse import EventSourceResponse
+
+from .bus import event_bus
+from .models import PUBLIC_TOPICS, EventTopic
+
+events_router = APIRouter(prefix="/events", tags=["Events"])
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 30  # 30초마다 하트비트
+
+
+@events_router.get("/stream")
+async def stream_events(
+    request: Request,
+    topics: Optional[List[EventTopic]] = Query(
+        None, description="구독할 토픽 (없으면 전체)"
+    ),
+    keys: Optional[List[str]] = Query(
+        None,
+        description="구독할 키 (project_id 또는 voice_sample_id, 없으면 전체)",
+    ),
+):
+    """
+    하나의 SSE 연결로 여러 토픽의 이벤트를 구독
+
+    Query Parameters:
+    - topics: upload | pipeline | progress | voice-sample (반복 지정 가능)
+    - keys: 토픽별 키 (upload/pipeline/progress는 project_id, voice-sample은 voice_sample_id)
+
+    SSE 이벤트 이름은 토픽이며 data는 다음 형식입니다:
+    {
+        "topic": "progress",
+        "key": "project_123",
+        "event": "target-progress",
+        "data": {...}
+    }
+    """
+    # 내부 토픽은 SSE로 노출하지 않음
+    topics = [topic for topic in topics or [] if topic in PUBLIC_TOPICS] or None
+    logger.info(f"New event stream connection: topics={topics}, keys={keys}")
+
+    async def event_generator():
+        # 제너레이터 안에서 구독해야 시작 전 연결 종료 시에도 구독이 남지 않음
+        subscription = event_bus.subscribe(topics, keys)
+        try:
+            yield {
+                "event": "connected",
+                "data": json.dumps(
+                    {
+                        "topics": [topic.value for topic in subscription.topics],
+                        "keys": list(subscription.keys or []),
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                ),
+            }
+
+            while True:
+                if await request.is_disconnected():
+                    break
+
+                try:
+                    envelope = await asyncio.wait_for(
+                        subscription.get(), timeout=HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield {
+                        "event": "heartbeat",
+                        "data": json.dumps({"timestamp": datetime.now().isoformat()}),
+                    }
+                    continue
+
+                yield {
+                    "event": envelope["topic"],
+                    "data": json.dumps(envelope, ensure_ascii=False, default=str),
+                }
+
+        except asyncio.CancelledError:
+            logger.info("Event stream cancelled")
+            raise
+        finally:
+            event_bus.unsubscribe(subscription)
+
+    return EventSourceResponse(event_generator(), ping=15)
@@ -8,6 +8,8 @@ from typing import Optional
 from bson import ObjectId
 
 from ..deps import DbDep
+from ..project.summary import increment_issue_count, refresh_issue_count
+from ..segment.read_model import invalidate_editor_project, refresh_editor_translations
 from .models import IssueCreate, IssueOut, IssueType, IssueSeverity
 
 logger = logging.getLogger(__name__)
@@ -30,8 +32,14 @@ class IssueService:
         Returns:
             생성된 이슈의 ID
         """
+        issue_id = await self._insert_issue(issue_data)
+        await refresh_editor_translations(self.db, [issue_data.segment_translation_id])
+        return issue_id
+
+    async def _insert_issue(self, issue_data: IssueCreate) -> str:
         doc = issue_data.model_dump()
         result = await self.collection.insert_one(doc)
+        await increment_issue_count(self.db, doc.get("project_id"))
         return str(result.inserted_id)
 
     async def create_issues_from_metadata(
@@ -74,7 +82,7 @@ class IssueService:
                     score=stt_score,
                     details={"message": f"STT quality score is low: {stt_score}"},
                 )
-                issue_id = await self.create_issue(issue)
+                issue_id = await self._insert_issue(issue)
                 created_issue_ids.append(issue_id)
                 logger.info(
                     f"Created STT quality issue: project_id={project_id}, "
@@ -93,7 +101,7 @@ class IssueService:
                     score=tts_score,
                     details={"message": f"TTS quality score is low: {tts_score}"},
                 )
-                issue_id = await self.create_issue(issue)
+                issue_id = await self._insert_issue(issue)
                 created_issue_ids.append(issue_id)
                 logger.info(
                     f"Created TTS quality issue: project_id={project_id}, "
@@ -114,7 +122,7 @@ class IssueService:
                         "message": f"Duration difference is too large: {sync_diff}s"
                     },
                 )
-                issue_id = await self.create_issue(issue)
+                issue_id = await self._insert_issue(issue)
                 created_issue_ids.append(issue_id)
                 logger.info(
                     f"Created sync duration issue: project_id={project_id}, "
@@ -134,13 +142,15 @@ class IssueService:
                     "message": "Speaker identification failed, using default voice"
                 },
             )
-            issue_id = await self.create_issue(issue)
+            issue_id = await self._insert_issue(issue)
             created_issue_ids.append(issue_id)
             logger.info(
                 f"Created speaker identification issue: project_id={project_id}, "
                 f"segment_translation_id={segment_translation_id}"
             )
 
+        if created_issue_ids:
+            await refresh_editor_translations(self.db, [segment_translation_id])
         return created_issue_ids
 
     async def get_issues_by_project(
@@ -196,11 +206,19 @@ class IssueService:
         except Exception:
             return False
 
-        result = await self.collection.update_one(
+        issue = await self.collection.find_one_and_update(
             {"_id": issue_oid},
             {"$set": {"resolved": resolved, "updated_at": datetime.now()}},
+            {"segment_translation_id": 1, "resolved": 1},
         )
-        return result.modified_count > 0
+        if issue is None:
+            return False
+        modified = issue.get("resolved") != resolved
+        if modified:
+            await refresh_editor_translations(
+                self.db, [issue.get("segment_translation_id")]
+            )
+        return modified
 
     async def delete_issues_by_project(self, project_id: str) -> int:
         """
@@ -213,6 +231,8 @@ class IssueService:
             삭제된 이슈 수
         """
         result = await self.collection.delete_many({"project_id": project_id})
+        await refresh_issue_count(self.db, project_id)
+        await invalidate_editor_project(self.db, project_id)
         return result.deleted_count
 
     async def delete_issues_by_segment_translation(
@@ -227,9 +247,15 @@ class IssueService:
         Returns:
             삭제된 이슈 수
         """
+        sample = await self.collection.find_one(
+            {"segment_translation_id": segment_translation_id}, {"project_id": 1}
+        )
         result = await self.collection.delete_many(
             {"segment_translation_id": segment_translation_id}
         )
+        if sample and result.deleted_count:
+            await refresh_issue_count(self.db, sample.get("project_id"))
+            await refresh_editor_translations(self.db, [segment_translation_id])
         return result.deleted_count
 
     def _get_quality_severity(self, score: float) -> IssueSeverity:
@@ -8,13 +8,11 @@ from ..deps import DbDep
 from ..pipeline.service import update_pipeline_stage
 from ..pipeline.models import PipelineUpdate, PipelineStatus
 from ..project.models import ProjectTargetStatus
+from ..events import event_bus, EventTopic
 
 
 async def dispatch_pipeline(project_id: str, update_payload):
     """파이프라인 상태 변경을 SSE로 브로드캐스트"""
-    from ..pipeline.router import project_channels
-
-    listeners = project_channels.get(project_id, set())
     event = {
         "project_id": project_id,
         "stage": update_payload.get("stage_id"),
@@ -22,8 +20,7 @@ async def dispatch_pipeline(project_id: str, update_payload):
         "progress": update_payload.get("progress"),
         "timestamp": datetime.now().isoformat() + "Z",
     }
-    for queue in list(listeners):
-        await queue.put(event)
+    await event_bus.publish(EventTopic.PIPELINE, project_id, "stage", event)
 
 
 async def dispatch_target_update(
@@ -33,9 +30,6 @@ async def dispatch_target_update(
     progress: int,
 ):
     """project_target 업데이트를 SSE로 브로드캐스트"""
-    from ..pipeline.router import project_channels
-
-    listeners = project_channels.get(project_id, set())
     event = {
         "project_id": project_id,
         "type": "target_update",
@@ -44,8 +38,24 @@ async def dispatch_target_update(
         "progress": progress,
         "timestamp": datetime.now().isoformat() + "Z",
     }
-    for queue in list(listeners):
-        await queue.put(event)
+    await event_bus.publish(EventTopic.PIPELINE, project_id, "stage", event)
+
+
+async def dispatch_voice_sample_status(
+    voice_sample_id: str,
+    audio_sample_url: Optional[str] = None,
+    error: Optional[str] = None,
+):
+    """음성 샘플 처리 상태를 SSE로 브로드캐스트"""
+    event = {
+        "sample_id": voice_sample_id,
+        "audio_sample_url": audio_sample_url,
+        "has_audio_sample": audio_sample_url is not None,
+        "timestamp": datetime.now().isoformat() + "Z",
+    }
+    if error:
+        event["error"] = error
+    await event_bus.publish(EventTopic.VOICE_SAMPLE, voice_sample_id, "status", event)
 
 
 async def update_pipeline(db: DbDep, project_id: str, payload: dict):
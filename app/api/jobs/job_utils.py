@@ -6,6 +6,8 @@ from typing import Optional
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.utils.ids import to_ref
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,7 +85,7 @@ async def find_segment_ids_from_metadata(
 
             segment_doc = await db["project_segments"].find_one(
                 {
-                    "project_id": project_oid,
+                    "project_id": to_ref(project_oid),
                     "segment_index": segment_index,
                 }
             )
@@ -23,6 +23,7 @@ class JobCreate(BaseModel):
 
 class JobHistoryEntry(BaseModel):
     status: JobStatus
+    stage: Optional[str] = None
     ts: datetime
     message: Optional[str] = None
 
@@ -12,6 +12,7 @@ from ..voice_samples.service import VoiceSampleService
 from ..voice_samples.models import VoiceSampleUpdate
 from ..project.models import ProjectTargetUpdate, ProjectTargetStatus, ProjectUpdate
 from ..project.service import ProjectService
+from ..cache import get_project_meta
 from app.utils.project_utils import extract_language_code
 from app.utils.speaker_voices import build_speaker_voices_dict
 
@@ -24,6 +25,7 @@ from ..progress import (
     TaskStatus,
 )
 
+from .event_dispatcher import dispatch_voice_sample_status
 from .segment_handler import (
     # check_and_create_segments,
     process_md_completion,
@@ -121,6 +123,12 @@ async def set_job_status(job_id: str, payload: JobUpdateStatus, db: DbDep) -> Jo
                                     owner,
                                 )
 
+                            # 상태 스트림 구독자에게 처리 완료 알림
+                            if audio_sample_url:
+                                await dispatch_voice_sample_status(
+                                    voice_sample_id, audio_sample_url
+                                )
+
                 except Exception as owner_exc:
                     logger.error(
                         f"Failed to get owner for voice sample {voice_sample_id}: {owner_exc}"
@@ -129,6 +137,11 @@ async def set_job_status(job_id: str, payload: JobUpdateStatus, db: DbDep) -> Jo
                 logger.error(
                     f"Failed to update audio_sample_url for voice sample {voice_sample_id}: {exc}"
                 )
+        elif result.status == "failed":
+            await dispatch_voice_sample_status(
+                metadata["voice_sample_id"],
+                error=result.error or "Voice sample processing failed",
+            )
 
     # state 없을 때 리턴
     if not metadata or "stage" not in metadata:
@@ -168,9 +181,9 @@ async def set_job_status(job_id: str, payload: JobUpdateStatus, db: DbDep) -> Jo
     # 프로젝트 정보 조회 (제목 가져오기)
     project_title = None
     try:
-        project_doc = await db["projects"].find_one({"_id": ObjectId(project_id)})
-        if project_doc:
-            project_title = project_doc.get("title")
+        project_meta = await get_project_meta(db, project_id)
+        if project_meta:
+            project_title = project_meta.get("title")
     except Exception as exc:
         logger.warning(f"Failed to get project title: {exc}")
 
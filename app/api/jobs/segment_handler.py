@@ -24,6 +24,8 @@ from .job_utils import (
 )
 from ..progress.dispatcher import dispatch_audio_completed
 from app.config.redis import distributed_lock
+from app.utils.ids import to_ref
+from ..segment.read_model import rebuild_editor_language
 
 logger = logging.getLogger(__name__)
 
@@ -407,6 +409,14 @@ async def process_md_completion(
                 f"No segments in metadata for project {project_id}, language {target_lang}"
             )
 
+    # 3. 에디터 read model 재구성 (세그먼트/번역/이슈가 한꺼번에 바뀜)
+    try:
+        await rebuild_editor_language(db, project_id, target_lang)
+    except Exception as exc:
+        logger.error(
+            f"Failed to rebuild editor read model for {project_id}/{target_lang}: {exc}"
+        )
+
 
 async def tts_complete_processing(db: DbDep, project_id: str, segments: list):
     """기존 호환성 유지를 위한 함수"""
@@ -450,7 +460,7 @@ async def process_segment_tts_completed(
                 segment_index = seg_result.get("index")
                 if segment_index is not None:
                     segment_doc = await db["project_segments"].find_one(
-                        {"project_id": project_oid, "segment_index": segment_index}
+                        {"project_id": to_ref(project_oid), "segment_index": segment_index}
                     )
                     if segment_doc:
                         segment_id = str(segment_doc["_id"])
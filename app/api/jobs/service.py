@@ -18,8 +18,11 @@ from pymongo.errors import PyMongoError
 
 from app.config.s3 import session as aws_session  # reuse configured AWS session
 
+from app.utils.metrics import DURATION_BUCKETS, metrics_registry
+
 from .models import JobCreate, JobRead, JobUpdateStatus
 from ..project.models import ProjectPublic
+from ..cache import get_project_meta
 from app.api.deps import DbDep
 
 JOB_COLLECTION = "jobs"
@@ -35,6 +38,20 @@ _sqs_client = _session.client("sqs", region_name=AWS_REGION)
 logger = logging.getLogger(__name__)
 
 
+JOB_STAGE_DURATION = metrics_registry.histogram(
+    "job_stage_duration_seconds",
+    "Time from the previous job history entry to this stage",
+    ["task", "stage"],
+    buckets=DURATION_BUCKETS,
+)
+JOB_DURATION = metrics_registry.histogram(
+    "job_duration_seconds",
+    "Time from job creation to done/failed",
+    ["task", "status"],
+    buckets=DURATION_BUCKETS,
+)
+
+
 class SqsPublishError(Exception):
     """Raised when the job message cannot be enqueued to SQS."""
 
@@ -305,7 +322,15 @@ async def update_job_status(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid job_id"
         ) from exc
 
-    now = datetime.now()
+    raw_metadata = (
+        payload.metadata.model_dump()
+        if hasattr(payload.metadata, "model_dump")
+        else payload.metadata
+    )
+    stage = raw_metadata.get("stage") if isinstance(raw_metadata, dict) else None
+
+    # create_job과 같은 UTC 기준 (history 간 소요 시간 계산에 함께 쓰임)
+    now = datetime.utcnow()
     update_operations: dict[str, Any] = {
         "$set": {
             "status": payload.status,
@@ -314,6 +339,7 @@ async def update_job_status(
         "$push": {
             "history": {
                 "status": payload.status,
+                "stage": stage,
                 "ts": now,
                 "message": message or payload.message,
             }
@@ -340,6 +366,8 @@ async def update_job_status(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
         )
 
+    _observe_job_timing(updated, payload.status, stage, now)
+
     project_updates: dict[str, Any] = {}
     metadata = payload.metadata if isinstance(payload.metadata, dict) else None
     if metadata:
@@ -387,6 +415,28 @@ async def update_job_status(
     return _serialize_job(updated)
 
 
+def _observe_job_timing(
+    job: dict[str, Any], job_status: str, stage: Optional[str], now: datetime
+) -> None:
+    """job history로 단계 간 소요 시간과 전체 소요 시간을 기록"""
+    task = job.get("task") or "pipeline"
+    history = job.get("history") or []
+    # 방금 추가한 항목 바로 앞의 기록 (없으면 생성 시각)
+    previous_ts = history[-2]["ts"] if len(history) >= 2 else job.get("created_at")
+    if previous_ts:
+        JOB_STAGE_DURATION.observe(
+            max((now - previous_ts).total_seconds(), 0),
+            task=task,
+            stage=stage or job_status,
+        )
+    if job_status in ("done", "failed") and job.get("created_at"):
+        JOB_DURATION.observe(
+            max((now - job["created_at"]).total_seconds(), 0),
+            task=task,
+            status=job_status,
+        )
+
+
 async def mark_job_failed(
     db: AsyncIOMotorDatabase,
     job_id: str,
@@ -455,11 +505,9 @@ async def start_jobs_for_targets(
     # 프로젝트의 보이스 설정 조회
     voice_config = None
     try:
-        project_doc = await db["projects"].find_one(
-            {"_id": ObjectId(project.project_id)}
-        )
-        if project_doc and "voice_config" in project_doc:
-            voice_config = project_doc["voice_config"]
+        project_meta = await get_project_meta(db, project.project_id)
+        if project_meta and "voice_config" in project_meta:
+            voice_config = project_meta["voice_config"]
     except Exception as exc:
         logger.warning(
             "Failed to load voice_config for project %s: %s", project.project_id, exc
@@ -534,11 +582,9 @@ async def start_job(project: ProjectPublic, db: DbDep):
     # 프로젝트의 보이스 설정 조회
     voice_config = None
     try:
-        project_doc = await db["projects"].find_one(
-            {"_id": ObjectId(project.project_id)}
-        )
-        if project_doc and "voice_config" in project_doc:
-            voice_config = project_doc["voice_config"]
+        project_meta = await get_project_meta(db, project.project_id)
+        if project_meta and "voice_config" in project_meta:
+            voice_config = project_meta["voice_config"]
     except Exception as exc:
         logger.warning(
             "Failed to load voice_config for project %s: %s", project.project_id, exc
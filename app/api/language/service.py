@@ -2,6 +2,7 @@ from typing import List
 from fastapi import HTTPException
 from .models import LanguageCreate, LanguageUpdate, Language
 from ..deps import DbDep
+from ..cache import LANGUAGE_CACHE, invalidate_cache
 
 
 class LanguageService:
@@ -9,11 +10,24 @@ class LanguageService:
         self.collection = db.get_collection("languages")
 
     async def list_languages(self) -> List[Language]:
-        docs = await self.collection.find({}, {"_id": 0}).sort("sort", 1).to_list(None)
-        return [Language(**doc) for doc in docs]
+        async def _load():
+            docs = (
+                await self.collection.find({}, {"_id": 0}).sort("sort", 1).to_list(None)
+            )
+            return [Language(**doc) for doc in docs]
+
+        return list(await LANGUAGE_CACHE.get_or_load("list", _load))
+
+    async def get_language_doc(self, code: str) -> dict | None:
+        """언어 문서 (캐시)"""
+
+        async def _load():
+            return await self.collection.find_one({"language_code": code}, {"_id": 0})
+
+        return await LANGUAGE_CACHE.get_or_load(f"code:{code}", _load)
 
     async def get_language(self, code: str) -> Language:
-        doc = await self.collection.find_one({"language_code": code}, {"_id": 0})
+        doc = await self.get_language_doc(code)
         if not doc:
             raise HTTPException(status_code=404, detail="language not found")
         return Language(**doc)
@@ -25,6 +39,7 @@ class LanguageService:
         if exists:
             raise HTTPException(status_code=409, detail="language already exists")
         await self.collection.insert_one(payload.model_dump())
+        await invalidate_cache(LANGUAGE_CACHE)
         return await self.get_language(payload.language_code)
 
     async def update_language(self, code: str, payload: LanguageUpdate) -> Language:
@@ -34,12 +49,14 @@ class LanguageService:
         )
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="language not found")
+        await invalidate_cache(LANGUAGE_CACHE)
         return await self.get_language(code)
 
     async def delete_language(self, code: str) -> None:
         result = await self.collection.delete_one({"language_code": code})
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="language not found")
+        await invalidate_cache(LANGUAGE_CACHE)
 
     async def ensure_defaults(self, defaults: List[LanguageCreate]) -> List[Language]:
         for language in defaults:
@@ -48,4 +65,5 @@ class LanguageService:
                 {"$set": language.model_dump()},
                 upsert=True,
             )
+        await invalidate_cache(LANGUAGE_CACHE)
         return await self.list_languages()
@@ -0,0 +1,82 @@
+"""
+LLM 백엔드 모듈
+
+번역(segment/translate_service), 교정(translate/rag), 제안(suggesion/service)이
+같은 백엔드를 사용합니다. LLM_BACKEND 환경변수로 선택합니다.
+
+- vertex (기본): Vertex AI Gemini
+- http: 로컬 대역 서버 (LLM_HTTP_BASE_URL, script/llm_standin.py)
+- stub: 프로세스 내 결정적 스텁 (LLM_STUB_LATENCY_MS, LLM_STUB_CHUNK_LATENCY_MS)
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from .base import LLMBackend, LLMRequest
+from .gemini import LocalHttpBackend, VertexBackend
+from .stub import StubBackend
+
+logger = logging.getLogger(__name__)
+
+_backend: Optional[LLMBackend] = None
+_backend_lock = threading.Lock()
+
+
+def create_llm_backend(kind: Optional[str] = None) -> LLMBackend:
+    kind = (kind or os.getenv("LLM_BACKEND") or "vertex").strip().lower()
+    if kind == "stub":
+        return StubBackend(
+            latency=float(os.getenv("LLM_STUB_LATENCY_MS", "0")) / 1000,
+            chunk_latency=float(os.getenv("LLM_STUB_CHUNK_LATENCY_MS", "0")) / 1000,
+        )
+    if kind == "http":
+        return LocalHttpBackend(os.getenv("LLM_HTTP_BASE_URL", "http://127.0.0.1:8089"))
+    if kind in {"vertex", "gemini"}:
+        return VertexBackend()
+    raise ValueError(f"Unknown LLM_BACKEND: {kind}")
+
+
+def get_llm_backend() -> LLMBackend:
+    """프로세스 전역 백엔드 (설정 오류는 캐시하지 않아 다음 호출에서 다시 시도)"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = create_llm_backend()
+    return _backend
+
+
+def set_llm_backend(backend: Optional[LLMBackend]) -> None:
+    """벤치마크/테스트에서 백엔드 교체 (None이면 다음 호출 때 환경변수로 다시 생성)"""
+    global _backend
+    _backend = backend
+
+
+async def warm_up_llm_backend() -> None:
+    """기동 시 자격증명/커넥션 준비 (실패해도 기동은 계속, 첫 요청에서 재시도)"""
+    try:
+        await get_llm_backend().warm_up()
+        logger.info("LLM backend ready")
+    except Exception as exc:
+        logger.warning(f"LLM backend warm-up failed: {exc}")
+
+
+async def close_llm_backend() -> None:
+    if _backend is not None:
+        await _backend.aclose()
+
+
+__all__ = [
+    "LLMBackend",
+    "LLMRequest",
+    "LocalHttpBackend",
+    "StubBackend",
+    "VertexBackend",
+    "close_llm_backend",
+    "create_llm_backend",
+    "get_llm_backend",
+    "set_llm_backend",
+    "warm_up_llm_backend",
+]
@@ -0,0 +1,103 @@
+"""
+LLM 백엔드 공통 인터페이스
+
+번역/교정/제안은 모두 LLMRequest 하나를 만들어 backend.generate / backend.stream을
+호출합니다. 요청 시간/실패/첫 토큰까지 걸린 시간은 백엔드 이름과 task 라벨로 기록됩니다.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from app.utils.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+LLM_REQUEST_DURATION = metrics_registry.histogram(
+    "llm_request_duration_seconds",
+    "LLM call latency by backend and task (streams: until the last chunk)",
+    ["backend", "task"],
+)
+LLM_FIRST_TOKEN = metrics_registry.histogram(
+    "llm_first_token_seconds",
+    "Time to the first streamed chunk by backend and task",
+    ["backend", "task"],
+)
+LLM_REQUEST_FAILURES = metrics_registry.counter(
+    "llm_request_failures_total",
+    "Failed LLM calls by backend and task",
+    ["backend", "task"],
+)
+
+
+@dataclass
+class LLMRequest:
+    """
+    백엔드에 무관한 생성 요청
+
+    task: "translate" | "correct" | "correct_batch" | "suggest" (메트릭 라벨, 스텁 응답 형식)
+    model: None이면 백엔드 기본 모델
+    """
+
+    task: str
+    prompt: str
+    system: Optional[str] = None
+    model: Optional[str] = None
+    temperature: float = 0.1
+    max_output_tokens: Optional[int] = None
+    json_output: bool = False
+
+
+class LLMBackend(ABC):
+    """하위 클래스는 _generate / _stream만 구현"""
+
+    name = "base"
+
+    async def generate(self, request: LLMRequest) -> str:
+        started = time.perf_counter()
+        try:
+            text = await self._generate(request)
+        except Exception:
+            LLM_REQUEST_FAILURES.inc(backend=self.name, task=request.task)
+            raise
+        LLM_REQUEST_DURATION.observe(
+            time.perf_counter() - started, backend=self.name, task=request.task
+        )
+        return text
+
+    async def stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """생성되는 대로 텍스트 조각 반환"""
+        started = time.perf_counter()
+        first = True
+        try:
+            async for chunk in self._stream(request):
+                if first:
+                    LLM_FIRST_TOKEN.observe(
+                        time.perf_counter() - started,
+                        backend=self.name,
+                        task=request.task,
+                    )
+                    first = False
+                yield chunk
+        except Exception:
+            LLM_REQUEST_FAILURES.inc(backend=self.name, task=request.task)
+            raise
+        LLM_REQUEST_DURATION.observe(
+            time.perf_counter() - started, backend=self.name, task=request.task
+        )
+
+    async def warm_up(self) -> None:
+        """기동 시 자격증명/커넥션 준비 (기본: 할 일 없음)"""
+
+    async def aclose(self) -> None:
+        """종료 시 커넥션 정리 (기본: 할 일 없음)"""
+
+    @abstractmethod
+    async def _generate(self, request: LLMRequest) -> str:
+        """응답 전체 텍스트"""
+
+    @abstractmethod
+    def _stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """텍스트 조각을 내는 async generator"""
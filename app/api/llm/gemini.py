@@ -0,0 +1,255 @@
+"""
+Gemini generateContent REST 백엔드
+
+- VertexBackend: Vertex AI 엔드포인트 + 서비스 계정/ADC 토큰
+- LocalHttpBackend: 같은 요청 형식을 받는 로컬 대역 서버 (script/llm_standin.py, 인증 없음)
+
+둘 다 프로세스 전역 httpx 클라이언트 하나로 keep-alive 커넥션을 재사용합니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from importlib.util import find_spec
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+import google.auth
+import httpx
+from google.auth.transport.requests import Request
+from google.oauth2 import service_account
+
+from app.config.env import GOOGLE_APPLICATION_CREDENTIALS
+
+from .base import LLMBackend, LLMRequest
+
+logger = logging.getLogger(__name__)
+
+GEMINI_MODEL_DEFAULT = "gemini-2.5-flash"
+GEMINI_LOCATION_DEFAULT = "us-central1"
+GEMINI_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+# 만료까지 이 시간 이내로 남으면 미리 갱신
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+# h2 패키지가 있을 때만 HTTP/2 사용 (없으면 HTTP/1.1 keep-alive)
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def _env_str(key: str) -> Optional[str]:
+    value = os.getenv(key)
+    return value if value else None
+
+
+class _GeminiCredentials:
+    """자격증명을 프로세스에서 한 번 만들고 만료 임박 시에만 갱신"""
+
+    def __init__(self, load: Callable[[], Any]) -> None:
+        self._load = load
+        self._credentials: Any = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @staticmethod
+    def _is_fresh(credentials: Any) -> bool:
+        if credentials is None or not credentials.token:
+            return False
+        expiry = credentials.expiry  # google.auth는 naive UTC 사용
+        if expiry is None:
+            return True
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return expiry - TOKEN_REFRESH_MARGIN > now
+
+    async def token(self, force_refresh: bool = False) -> str:
+        if not force_refresh and self._is_fresh(self._credentials):
+            return self._credentials.token
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # 대기하는 동안 다른 요청이 이미 갱신했을 수 있음
+            if self._credentials is None:
+                self._credentials = await asyncio.to_thread(self._load)
+            if force_refresh or not self._is_fresh(self._credentials):
+                await asyncio.to_thread(self._credentials.refresh, Request())
+        if not self._credentials.token:
+            raise RuntimeError("Failed to obtain access token for Gemini call.")
+        return self._credentials.token
+
+
+class GeminiRestBackend(LLMBackend):
+    """{model_base}/{model}:generateContent 형식의 엔드포인트 호출"""
+
+    name = "gemini-rest"
+
+    def __init__(
+        self,
+        model_base: str,
+        default_model: str,
+        credentials: Optional[_GeminiCredentials] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        self.model_base = model_base.rstrip("/")
+        self.default_model = default_model
+        self._credentials = credentials
+        self._client = client
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=int(os.getenv("GEMINI_HTTP_MAX_CONNECTIONS", "20")),
+                    max_keepalive_connections=10,
+                    keepalive_expiry=120.0,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def warm_up(self) -> None:
+        if self._credentials is not None:
+            await self._credentials.token()
+
+    async def _headers(self, request: LLMRequest, force_refresh: bool = False) -> Dict[str, str]:
+        if self._credentials is None:
+            return {}
+        token = await self._credentials.token(force_refresh=force_refresh)
+        return {"Authorization": f"Bearer {token}"}
+
+    def _url(self, request: LLMRequest, method: str) -> str:
+        return f"{self.model_base}/{request.model or self.default_model}:{method}"
+
+    @staticmethod
+    def _payload(request: LLMRequest) -> Dict[str, Any]:
+        config: Dict[str, Any] = {"temperature": float(request.temperature)}
+        if request.max_output_tokens:
+            config["maxOutputTokens"] = request.max_output_tokens
+        if request.json_output:
+            config["responseMimeType"] = "application/json"
+        payload: Dict[str, Any] = {
+            "contents": [{"role": "user", "parts": [{"text": request.prompt}]}],
+            "generationConfig": config,
+        }
+        if request.system:
+            payload["systemInstruction"] = {
+                "role": "system",
+                "parts": [{"text": request.system}],
+            }
+        return payload
+
+    @staticmethod
+    def _candidate_text(data: Dict[str, Any]) -> str:
+        candidates = data.get("candidates") or []
+        if not candidates:
+            return ""
+        parts: List[Dict[str, Any]] = candidates[0].get("content", {}).get("parts", [])
+        return "".join(
+            part.get("text", "") for part in parts if not part.get("thought")
+        )
+
+    async def _generate(self, request: LLMRequest) -> str:
+        client = self._get_client()
+        url = self._url(request, "generateContent")
+        payload = self._payload(request)
+        resp = await client.post(url, headers=await self._headers(request), json=payload)
+        if resp.status_code == 401 and self._credentials is not None:
+            # 토큰이 만료 전에 폐기된 경우 한 번만 강제 갱신 후 재시도
+            resp = await client.post(
+                url, headers=await self._headers(request, force_refresh=True), json=payload
+            )
+        resp.raise_for_status()
+        data = resp.json()
+        if not data.get("candidates"):
+            raise ValueError(f"Gemini returned no candidates: {data}")
+        return self._candidate_text(data)
+
+    async def _stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        client = self._get_client()
+        url = self._url(request, "streamGenerateContent")
+        payload = self._payload(request)
+        for attempt in range(2):
+            headers = await self._headers(request, force_refresh=attempt > 0)
+            async with client.stream(
+                "POST", url, params={"alt": "sse"}, headers=headers, json=payload
+            ) as resp:
+                if resp.status_code == 401 and self._credentials is not None and attempt == 0:
+                    continue
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    text = self._candidate_text(json.loads(line[5:]))
+                    if text:
+                        yield text
+                return
+
+
+def _load_vertex_credentials(sa_path: Optional[str]) -> Callable[[], Any]:
+    def load() -> Any:
+        if sa_path and os.path.isfile(sa_path):
+            return service_account.Credentials.from_service_account_file(
+                sa_path, scopes=GEMINI_SCOPES
+            )
+        credentials, _ = google.auth.default(scopes=GEMINI_SCOPES)
+        return credentials
+
+    return load
+
+
+class VertexBackend(GeminiRestBackend):
+    """Vertex AI Gemini (번역/교정/제안이 같은 자격증명과 커넥션을 공유)"""
+
+    name = "vertex"
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
+        # 서비스 계정 JSON (여러 키명 지원)
+        sa_path = (
+            _env_str("VERTEX_SERVICE_ACCOUNT_JSON")
+            or _env_str("VERTEX_SA_PATH")
+            or GOOGLE_APPLICATION_CREDENTIALS
+        )
+        project_id = _env_str("VERTEX_PROJECT_ID") or _env_str("GCP_PROJECT")
+        if not project_id and sa_path and os.path.isfile(sa_path):
+            # 프로젝트 ID가 없으면 JSON에서 복구 시도
+            try:
+                with open(sa_path, "r", encoding="utf-8") as f:
+                    project_id = json.load(f).get("project_id")
+            except Exception:
+                pass
+        if not project_id:
+            raise RuntimeError(
+                "VERTEX_PROJECT_ID is required (or set in service account JSON)."
+            )
+        location = (
+            _env_str("VERTEX_LOCATION")
+            or _env_str("GCP_LOCATION")
+            or GEMINI_LOCATION_DEFAULT
+        )
+        super().__init__(
+            model_base=(
+                f"https://{location}-aiplatform.googleapis.com/v1/projects/"
+                f"{project_id}/locations/{location}/publishers/google/models"
+            ),
+            default_model=_env_str("GEMINI_MODEL_VERSION") or GEMINI_MODEL_DEFAULT,
+            credentials=_GeminiCredentials(_load_vertex_credentials(sa_path)),
+            client=client,
+        )
+
+
+class LocalHttpBackend(GeminiRestBackend):
+    """로컬 대역 서버 (task는 스텁 응답 형식을 고르도록 헤더로 전달)"""
+
+    name = "http"
+
+    def __init__(self, base_url: str, client: Optional[httpx.AsyncClient] = None) -> None:
+        super().__init__(
+            model_base=f"{base_url.rstrip('/')}/models",
+            default_model=_env_str("GEMINI_MODEL_VERSION") or GEMINI_MODEL_DEFAULT,
+            client=client,
+        )
+
+    async def _headers(self, request: LLMRequest, force_refresh: bool = False) -> Dict[str, str]:
+        return {"X-LLM-Task": request.task}
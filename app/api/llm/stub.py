@@ -0,0 +1,116 @@
+"""
+결정적(deterministic) 로컬 스텁 백엔드
+
+모델 비용 없이 우리 쪽 오버헤드(프롬프트 구성, 배칭, 파싱, DB/이벤트)만 측정하거나
+부하 테스트를 할 때 사용합니다. 같은 요청에는 항상 같은 응답을 돌려주며,
+응답 형식은 각 호출부의 파서가 그대로 받아들일 수 있도록 task별로 맞춥니다.
+
+- translate: 입력 항목마다 "[<target>] <원문>"
+- correct / correct_batch: 초안(DRAFT)을 그대로 교정 결과로 반환
+- suggest: 번역문(Translated Text)을 그대로 반환
+"""
+
+import asyncio
+import json
+import re
+from typing import AsyncIterator, List
+
+from .base import LLMBackend, LLMRequest
+
+# 스트리밍 시 한 조각에 담는 글자 수
+STUB_CHUNK_CHARS = 16
+
+_TARGET_LANG = re.compile(r"^Target language: (.+)$", re.MULTILINE)
+_TRANSLATE_ITEM = re.compile(r"^\[\d+\] seg_idx=(-?\d+) text=", re.MULTILINE)
+_BATCH_ITEM = re.compile(
+    r"\[ITEM id=(?P<id>[^\]]+)\]\n\[SOURCE\]\n.*?\n\[DRAFT\]\n(?P<draft>.*?)(?=\n\n\[ITEM id=|\n\n\[GLOSSARY\]|\Z)",
+    re.DOTALL,
+)
+_DRAFT = re.compile(r"\[DRAFT\]\n(.*?)(?:\n\n\[GLOSSARY\]|\Z)", re.DOTALL)
+_SUGGEST_DRAFT = re.compile(r"\[Translated Text\]: (.*)")
+
+
+def _translate(prompt: str) -> str:
+    match = _TARGET_LANG.search(prompt)
+    target = match.group(1).strip() if match else "xx"
+    inputs = prompt.split("\n\nReturn JSON ONLY", 1)[0]
+    heads = list(_TRANSLATE_ITEM.finditer(inputs))
+    results = []
+    for i, head in enumerate(heads):
+        end = heads[i + 1].start() - 1 if i + 1 < len(heads) else len(inputs)
+        text = inputs[head.end() : end]
+        results.append({"seg_idx": int(head.group(1)), "translation": f"[{target}] {text}"})
+    return json.dumps(results, ensure_ascii=False)
+
+
+def _correct(prompt: str) -> str:
+    match = _DRAFT.search(prompt)
+    draft = match.group(1).strip() if match else ""
+    return json.dumps(
+        {"corrected_text": draft, "message": "", "notes": ""}, ensure_ascii=False
+    )
+
+
+def _correct_batch(prompt: str) -> str:
+    results = [
+        {
+            "id": match.group("id"),
+            "corrected_text": match.group("draft").strip(),
+            "message": "",
+            "notes": "",
+        }
+        for match in _BATCH_ITEM.finditer(prompt)
+    ]
+    return json.dumps({"results": results}, ensure_ascii=False)
+
+
+def _suggest(prompt: str) -> str:
+    match = _SUGGEST_DRAFT.search(prompt)
+    return match.group(1).strip() if match else ""
+
+
+_RESPONDERS = {
+    "translate": _translate,
+    "correct": _correct,
+    "correct_batch": _correct_batch,
+    "suggest": _suggest,
+}
+
+
+def stub_completion(task: str, prompt: str) -> str:
+    """task별 고정 응답 (모르는 task는 프롬프트를 그대로 반환)"""
+    responder = _RESPONDERS.get(task)
+    return responder(prompt) if responder else prompt
+
+
+def split_chunks(text: str, size: int = STUB_CHUNK_CHARS) -> List[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)] or [""]
+
+
+class StubBackend(LLMBackend):
+    """
+    latency: 첫 조각까지의 지연(초), chunk_latency: 이후 조각마다의 지연(초)
+
+    generate는 latency + (조각 수 - 1) * chunk_latency 뒤에 한 번에 반환합니다.
+    """
+
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0, chunk_latency: float = 0.0) -> None:
+        self.latency = latency
+        self.chunk_latency = chunk_latency
+
+    async def _generate(self, request: LLMRequest) -> str:
+        text = stub_completion(request.task, request.prompt)
+        delay = self.latency + (len(split_chunks(text)) - 1) * self.chunk_latency
+        # 지연이 0이어도 한 번은 양보해 실제 I/O처럼 다른 태스크가 끼어들 수 있게 함
+        await asyncio.sleep(delay)
+        return text
+
+    async def _stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        chunks = split_chunks(stub_completion(request.task, request.prompt))
+        await asyncio.sleep(self.latency)
+        for i, chunk in enumerate(chunks):
+            if i:
+                await asyncio.sleep(self.chunk_latency)
+            yield chunk
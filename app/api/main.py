@@ -21,6 +21,8 @@ from .mux.router import router as mux_router
 from .progress.router import progress_router
 from .accent.router import router as accent_router
 from .credits.router import credits_router
+from .events.router import events_router
+from .metrics.router import metrics_router
 
 api_router = APIRouter(prefix="/api")
 
@@ -48,3 +50,5 @@ api_router.include_router(mux_router)
 api_router.include_router(progress_router)
 api_router.include_router(accent_router)
 api_router.include_router(credits_router)
+api_router.include_router(events_router)
+api_router.include_router(metrics_router)
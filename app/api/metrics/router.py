@@ -0,0 +1,35 @@
+"""
+Prometheus 형식 메트릭 엔드포인트
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.utils.metrics import render_prometheus
+from .service import merged_metrics
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="전체 워커 합산 메트릭 (Prometheus 텍스트 포맷)",
+)
+async def get_metrics() -> PlainTextResponse:
+    """
+    이벤트 버스와 작업 파이프라인 메트릭
+
+    - event_bus_published_total / event_bus_delivered_total: 토픽별 발행/전달 수
+    - event_bus_delivery_latency_seconds: 발행 → 구독자 수신 지연
+    - event_bus_fanout: 이벤트당 로컬 구독 분배 수
+    - event_bus_dropped_total: 사유별 유실/저하 이벤트 수
+    - event_bus_subscribers: 토픽/키(프로젝트)별 구독 수
+    - job_stage_duration_seconds: 작업 단계 간 소요 시간 (job history 기준)
+    - job_duration_seconds: 작업 생성 → 완료/실패까지 소요 시간
+    """
+    merged = await merged_metrics()
+    return PlainTextResponse(
+        render_prometheus(merged),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
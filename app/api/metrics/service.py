@@ -0,0 +1,104 @@
+"""
+워커 간 메트릭 집계 서비스
+
+각 API 워커는 주기적으로 자신의 메트릭 스냅샷을 Redis 해시에 기록하고,
+/metrics 요청을 받은 워커는 살아있는 모든 워커의 스냅샷을 합산합니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from redis.exceptions import RedisError
+
+from app.config.redis import get_async_redis
+from app.utils.metrics import INSTANCE_ID, merge_snapshots, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+METRICS_HASH_KEY = "metrics:instances"
+METRICS_FLUSH_INTERVAL = 10  # 초
+# 이 시간 이상 갱신이 없는 워커 스냅샷은 종료된 것으로 간주
+METRICS_STALE_AFTER = METRICS_FLUSH_INTERVAL * 3
+
+_reporter_task: Optional[asyncio.Task] = None
+
+
+async def flush_metrics() -> None:
+    """현재 워커의 스냅샷을 Redis에 기록"""
+    payload = json.dumps(
+        {"ts": time.time(), "metrics": metrics_registry.snapshot()}, default=str
+    )
+    await get_async_redis().hset(METRICS_HASH_KEY, INSTANCE_ID, payload)
+
+
+async def collect_snapshots() -> List[Dict[str, Any]]:
+    """살아있는 모든 워커의 스냅샷 (현재 워커는 최신 값 사용)"""
+    snapshots = [metrics_registry.snapshot()]
+    try:
+        redis = get_async_redis()
+        raw = await redis.hgetall(METRICS_HASH_KEY)
+    except RedisError as exc:
+        logger.warning(f"Failed to read worker metrics, using local only: {exc}")
+        return snapshots
+
+    now = time.time()
+    stale = []
+    for instance_id, value in raw.items():
+        if isinstance(instance_id, bytes):
+            instance_id = instance_id.decode()
+        if instance_id == INSTANCE_ID:
+            continue
+        try:
+            entry = json.loads(value)
+        except (TypeError, ValueError):
+            stale.append(instance_id)
+            continue
+        if now - entry.get("ts", 0) > METRICS_STALE_AFTER:
+            stale.append(instance_id)
+            continue
+        snapshots.append(entry["metrics"])
+
+    if stale:
+        try:
+            await redis.hdel(METRICS_HASH_KEY, *stale)
+        except RedisError:
+            pass
+    return snapshots
+
+
+async def merged_metrics() -> Dict[str, Any]:
+    return merge_snapshots(await collect_snapshots())
+
+
+async def _report_loop() -> None:
+    while True:
+        try:
+            await flush_metrics()
+        except Exception as exc:
+            logger.warning(f"Failed to flush metrics: {exc}")
+        await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+
+
+def start_metrics_reporter() -> None:
+    global _reporter_task
+    if _reporter_task is None or _reporter_task.done():
+        _reporter_task = asyncio.create_task(_report_loop(), name="metrics-reporter")
+
+
+async def stop_metrics_reporter() -> None:
+    global _reporter_task
+    if _reporter_task is None:
+        return
+    _reporter_task.cancel()
+    try:
+        await _reporter_task
+    except asyncio.CancelledError:
+        pass
+    _reporter_task = None
+    try:
+        await get_async_redis().hdel(METRICS_HASH_KEY, INSTANCE_ID)
+    except RedisError:
+        pass
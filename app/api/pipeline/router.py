@@ -3,10 +3,10 @@ from typing import Any, Dict
 import asyncio, json
 from datetime import datetime
 from sse_starlette.sse import EventSourceResponse
-from collections import defaultdict
 from app.api.deps import DbDep
 from .service import get_pipeline_status, update_pipeline_stage
 from .models import PipelineUpdate, ProjectPipeline
+from ..events import event_bus, EventTopic
 import logging
 
 pipeline_router = APIRouter(prefix="/pipeline", tags=["Pipeline"])
@@ -42,15 +42,12 @@ def _serialize_datetime(obj: Any) -> Any:
     return obj
 
 
-project_channels = defaultdict(set)  # project_id -> events queue
-
-
 @pipeline_router.get("/{project_id}/events")
 async def pipeline_events(project_id: str, request: Request):
-    queue = asyncio.Queue()
-    project_channels[project_id].add(queue)
-
     async def event_generator():
+        # 통합 이벤트 버스의 pipeline 토픽 구독
+        # 제너레이터 안에서 구독해야 시작 전 연결 종료 시에도 구독이 남지 않음
+        subscription = event_bus.subscribe([EventTopic.PIPELINE], [project_id])
         try:
             # 주기적인 하트비트를 위한 카운터
             heartbeat_interval = 30  # 30초마다 하트비트
@@ -66,8 +63,8 @@ async def pipeline_events(project_id: str, request: Request):
 
                 try:
                     # 타임아웃을 사용하여 queue.get() 무한 대기 방지
-                    data = await asyncio.wait_for(queue.get(), timeout=5.0)
-                    yield {"event": "stage", "data": json.dumps(data)}
+                    envelope = await asyncio.wait_for(subscription.get(), timeout=5.0)
+                    yield {"event": "stage", "data": json.dumps(envelope["data"])}
                     last_heartbeat = 0  # 데이터 전송 시 하트비트 카운터 리셋
                 except asyncio.TimeoutError:
                     # 타임아웃 시 하트비트 전송 (연결 유지 확인)
@@ -87,10 +84,7 @@ async def pipeline_events(project_id: str, request: Request):
         except Exception as e:
             logger.error(f"Error in events stream for project {project_id}: {e}")
         finally:
-            project_channels[project_id].discard(queue)
-            # 채널에 리스너가 없으면 삭제하여 메모리 누수 방지
-            if not project_channels[project_id]:
-                del project_channels[project_id]
+            event_bus.unsubscribe(subscription)
             logger.info(f"Cleaned up events connection for project {project_id}")
 
     return EventSourceResponse(event_generator())
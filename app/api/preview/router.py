@@ -12,6 +12,8 @@ from pydantic import BaseModel, Field
 
 from app.config.s3 import s3
 from ..deps import DbDep
+from ..repositories import LegacySegmentRepository
+from app.utils.ids import to_ref, try_object_id
 from .model import (
     PreviewCreateBody,
     PreviewCreateResponse,
@@ -84,48 +86,36 @@ async def _load_segment_doc(
 ) -> Optional[dict]:
     """
     segments 컬렉션에서 세그먼트 한 건을 찾아온다.
-    우선순위: (_id == seg) → (segment_id == seg) → (segment_id == ObjectId(seg)) → (segment_index == int(seg))
+    우선순위: (_id == seg) → (segment_id == seg) → (segment_index == int(seg))
+    후보 조건을 $or 한 번으로 조회한 뒤 우선순위대로 고른다.
     """
     try:
-        pid = ObjectId(project_id)
-    except InvalidId as exc:
+        project_ref = to_ref(project_id)
+    except ValueError as exc:
         raise HTTPException(status_code=400, detail="invalid project_id") from exc
 
-    coll = db["segments"]
-
-    # 1) _id 일치
+    seg_oid = try_object_id(seg_id_or_index)
+    candidates: list[Dict[str, Any]] = [{"segment_id": seg_id_or_index}]
+    if seg_oid is not None:
+        candidates[:0] = [{"_id": seg_oid}, {"segment_id": seg_oid}]
     try:
-        seg_oid = ObjectId(seg_id_or_index)
-        doc = await coll.find_one({"_id": seg_oid, "project_id": pid})
-        if doc:
-            return doc
-    except InvalidId:
-        pass
-
-    # 2) segment_id 문자열
-    doc = await coll.find_one({"segment_id": seg_id_or_index, "project_id": pid})
-    if doc:
-        return doc
-
-    # 3) segment_id ObjectId
-    try:
-        seg_oid2 = ObjectId(seg_id_or_index)
-        doc = await coll.find_one({"segment_id": seg_oid2, "project_id": pid})
-        if doc:
-            return doc
-    except InvalidId:
-        pass
-
-    # 4) segment_index 정수
-    try:
-        idx = int(seg_id_or_index)
-        doc = await coll.find_one({"segment_index": idx, "project_id": pid})
-        if doc:
-            return doc
+        seg_index: Optional[int] = int(seg_id_or_index)
+        candidates.append({"segment_index": seg_index})
     except (TypeError, ValueError):
-        pass
+        seg_index = None
+
+    docs = await LegacySegmentRepository(db).find(
+        {"project_id": project_ref, "$or": candidates}
+    ).to_list(len(candidates))
+
+    def _priority(doc: dict) -> int:
+        if seg_oid is not None and doc["_id"] == seg_oid:
+            return 0
+        if doc.get("segment_id") in (seg_oid, seg_id_or_index):
+            return 1
+        return 2
 
-    return None
+    return min(docs, key=_priority) if docs else None
 
 
 def _extract_asset_keys(seg: dict) -> Dict[str, Optional[str]]:
@@ -5,9 +5,9 @@
 from typing import Optional, Dict, Any
 from datetime import datetime
 import logging
-import asyncio
 
 from .models import ProgressEvent, ProgressEventType, TaskStatus, get_progress_for_stage
+from ..events import event_bus, EventTopic
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +37,6 @@ async def broadcast_progress_event(
         metadata: 추가 메타데이터
         project_title: 프로젝트 제목 (선택)
     """
-    from .router import global_event_channels, project_event_channels
-
     # stage에서 진행도와 표시 이름 추출
     stage_name = None
     if stage and not progress:
@@ -66,9 +64,6 @@ async def broadcast_progress_event(
     if metadata:
         event_data["metadata"] = metadata
 
-    # 이벤트 객체
-    event = {"event": event_type.value, "data": event_data}
-
     # 로그
     logger.info(
         f"Broadcasting {event_type.value} for project {project_id}"
@@ -76,46 +71,9 @@ async def broadcast_progress_event(
         f"status={status.value}, progress={progress}%, stage={stage}"
     )
 
-    # 1. 프로젝트별 구독자에게 전송
-    project_listeners = list(project_event_channels.get(project_id, set()))
-    dead_project_queues = []
-    for queue in project_listeners:
-        try:
-            # 큐가 가득 차면 즉시 실패 (죽은 연결로 간주)
-            queue.put_nowait(event)
-        except asyncio.QueueFull:
-            logger.warning(f"Queue full for project listener, marking as dead")
-            dead_project_queues.append(queue)
-        except Exception as e:
-            logger.error(f"Failed to send event to project listener: {e}")
-            dead_project_queues.append(queue)
-
-    # 죽은 큐 제거
-    for dead_queue in dead_project_queues:
-        project_event_channels.get(project_id, set()).discard(dead_queue)
-
-    # 2. 글로벌 구독자에게 전송
-    global_listeners = list(global_event_channels)
-    dead_global_queues = []
-    for queue in global_listeners:
-        try:
-            # 큐가 가득 차면 즉시 실패 (죽은 연결로 간주)
-            queue.put_nowait(event)
-        except asyncio.QueueFull:
-            logger.warning(f"Queue full for global listener, marking as dead")
-            dead_global_queues.append(queue)
-        except Exception as e:
-            logger.error(f"Failed to send event to global listener: {e}")
-            dead_global_queues.append(queue)
-
-    # 죽은 큐 제거
-    for dead_queue in dead_global_queues:
-        global_event_channels.discard(dead_queue)
-
-    logger.debug(
-        f"Event sent to {len(project_listeners) - len(dead_project_queues)} project listeners "
-        f"and {len(global_listeners) - len(dead_global_queues)} global listeners. "
-        f"Removed {len(dead_project_queues) + len(dead_global_queues)} dead connections"
+    # 통합 이벤트 버스로 발행 (모든 API 워커의 구독자에게 전달)
+    await event_bus.publish(
+        EventTopic.PROGRESS, project_id, event_type.value, event_data
     )
 
 
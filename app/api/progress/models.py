@@ -28,6 +28,8 @@ class ProgressEventType(str, Enum):
     HEARTBEAT = "heartbeat"  # 연결 유지
     AUDIO_COMPLETED = "audio-completed"  # 세그먼트 오디오 생성 완료
     AUDIO_FAILED = "audio-failed"  # 세그먼트 오디오 생성 실패
+    BULK_TRANSLATION = "bulk-translation"  # 언어 전체 번역 진행도
+    GLOSSARY_SUGGESTION = "glossary-suggestion"  # 프로젝트 용어 교정 제안 진행도
 
 
 class ProgressEvent(BaseModel):
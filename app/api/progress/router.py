@@ -4,32 +4,24 @@
 
 from fastapi import APIRouter, Request, Query
 from sse_starlette.sse import EventSourceResponse
-from typing import Optional, Set
+from typing import Optional
 import asyncio
 import json
 from datetime import datetime
 import logging
-from collections import defaultdict
 
 from .models import ProgressEventType
+from ..events import event_bus, EventTopic
+from ..events.bus import EVENTS_DELIVERED
+from ..metrics.service import merged_metrics
+from app.utils.metrics import metrics_registry, sample_total
 
 progress_router = APIRouter(prefix="/progress", tags=["Progress"])
 logger = logging.getLogger(__name__)
 
-# 글로벌 이벤트 채널 (모든 클라이언트가 구독)
-# 각 Queue는 하나의 클라이언트 연결을 나타냄
-global_event_channels: Set[asyncio.Queue] = set()
-
-# 프로젝트별 이벤트 채널 (특정 프로젝트만 구독)
-# key: project_id, value: Set[Queue]
-project_event_channels = defaultdict(set)
-
-# 통계 정보
-stats = {
-    "total_connections": 0,
-    "active_connections": 0,
-    "total_events_sent": 0,
-}
+PROGRESS_CONNECTIONS = metrics_registry.counter(
+    "progress_sse_connections_total", "Progress SSE connections opened"
+)
 
 
 @progress_router.get("/events")
@@ -66,28 +58,20 @@ async def progress_events(
         "timestamp": "2024-01-01T00:00:00Z"
     }
     """
-    queue = asyncio.Queue(maxsize=100)  # 큐 크기 제한 추가
+    # 통계 업데이트
+    PROGRESS_CONNECTIONS.inc()
 
-    # 구독 설정
-    if project_id:
-        # 특정 프로젝트만 구독
-        project_event_channels[project_id].add(queue)
-        logger.info(
-            f"New SSE connection for project {project_id}. "
-            f"Project listeners: {len(project_event_channels[project_id])}"
+    async def event_generator():
+        # 통합 이벤트 버스의 progress 토픽 구독 (project_id 없으면 전체)
+        # 제너레이터 안에서 구독해야 시작 전 연결 종료 시에도 구독이 남지 않음
+        subscription = event_bus.subscribe(
+            [EventTopic.PROGRESS], [project_id] if project_id else None
         )
-    else:
-        # 전체 이벤트 구독
-        global_event_channels.add(queue)
         logger.info(
-            f"New global SSE connection. Total global listeners: {len(global_event_channels)}"
+            f"New SSE connection for progress events"
+            f"{f' for project {project_id}' if project_id else ' (global)'}. "
+            f"Progress listeners: {event_bus.subscriber_count(EventTopic.PROGRESS)}"
         )
-
-    # 통계 업데이트
-    stats["total_connections"] += 1
-    stats["active_connections"] += 1
-
-    async def event_generator():
         try:
             # 연결 즉시 초기 상태 전송
             yield {
@@ -116,7 +100,7 @@ async def progress_events(
 
                 try:
                     # 큐에서 이벤트 가져오기 (1초 타임아웃으로 단축)
-                    event_data = await asyncio.wait_for(queue.get(), timeout=1.0)
+                    envelope = await asyncio.wait_for(subscription.get(), timeout=1.0)
 
                     # 연결 해제 재확인 (이벤트 전송 전)
                     if await request.is_disconnected():
@@ -124,11 +108,8 @@ async def progress_events(
                         break
 
                     # 이벤트 타입과 데이터 추출
-                    event_type = event_data.get("event", "message")
-                    data = event_data.get("data", {})
-
-                    # 통계 업데이트
-                    stats["total_events_sent"] += 1
+                    event_type = envelope.get("event", "message")
+                    data = envelope.get("data", {})
 
                     # SSE 형식으로 전송
                     yield {
@@ -148,10 +129,12 @@ async def progress_events(
                                 {
                                     "timestamp": datetime.now().isoformat(),
                                     "stats": {
-                                        "activeConnections": stats[
-                                            "active_connections"
-                                        ],
-                                        "totalEventsSent": stats["total_events_sent"],
+                                        "activeConnections": event_bus.subscriber_count(
+                                            EventTopic.PROGRESS
+                                        ),
+                                        "totalEventsSent": EVENTS_DELIVERED.value(
+                                            topic=EventTopic.PROGRESS.value
+                                        ),
                                     },
                                 }
                             ),
@@ -178,23 +161,12 @@ async def progress_events(
             }
         finally:
             # 정리 작업
-            stats["active_connections"] -= 1
-
-            if project_id:
-                project_event_channels[project_id].discard(queue)
-                # 채널에 리스너가 없으면 삭제하여 메모리 누수 방지
-                if not project_event_channels[project_id]:
-                    del project_event_channels[project_id]
-                logger.info(
-                    f"Cleaned up connection for project {project_id}. "
-                    f"Remaining project listeners: {len(project_event_channels.get(project_id, set()))}"
-                )
-            else:
-                global_event_channels.discard(queue)
-                logger.info(
-                    f"Cleaned up global connection. "
-                    f"Remaining global listeners: {len(global_event_channels)}"
-                )
+            event_bus.unsubscribe(subscription)
+            logger.info(
+                f"Cleaned up progress connection"
+                f"{f' for project {project_id}' if project_id else ' (global)'}. "
+                f"Remaining progress listeners: {event_bus.subscriber_count(EventTopic.PROGRESS)}"
+            )
 
     return EventSourceResponse(
         event_generator(),
@@ -205,17 +177,27 @@ async def progress_events(
 @progress_router.get("/stats")
 async def get_progress_stats():
     """
-    진행도 이벤트 시스템 통계 조회
+    진행도 이벤트 시스템 통계 조회 (모든 API 워커 합산)
+
+    상세 지표는 /api/metrics (Prometheus 포맷)를 참고하세요.
     """
+    merged = await merged_metrics()
+    progress = EventTopic.PROGRESS.value
+    subscribers = merged.get("event_bus_subscribers", {}).get("samples", {})
     return {
-        "total_connections": stats["total_connections"],
-        "active_connections": stats["active_connections"],
-        "global_listeners": len(global_event_channels),
-        "project_listeners": sum(
-            len(listeners) for listeners in project_event_channels.values()
+        "total_connections": int(sample_total(merged, "progress_sse_connections_total")),
+        "active_connections": int(
+            sample_total(merged, "event_bus_subscribers", topic=progress)
+        ),
+        "monitored_projects": sorted(
+            {key for (topic, key) in subscribers if topic == progress and key != "*"}
+        ),
+        "total_events_sent": int(
+            sample_total(merged, "event_bus_delivered_total", topic=progress)
+        ),
+        "dropped_events": int(
+            sample_total(merged, "event_bus_dropped_total", topic=progress)
         ),
-        "monitored_projects": list(project_event_channels.keys()),
-        "total_events_sent": stats["total_events_sent"],
     }
 
 
@@ -0,0 +1,312 @@
+"""
+프로젝트 삭제 cascade job
+
+DELETE /projects/{id}는 프로젝트 문서만 즉시 지우고 202를 반환합니다.
+S3 객체(projects/{id}/)와 하위 컬렉션 정리는 백그라운드 job이 수행하며,
+진행 상태는 project_deletions 컬렉션(_id = project_id)에 기록됩니다.
+
+- S3: list_objects_v2 페이지(최대 1,000 키)마다 delete_objects를 병렬 호출
+- Mongo: 세그먼트/번역은 배치 단위, 나머지 컬렉션은 project_id 인덱스로 delete_many
+- 워커가 중단되면 lease가 만료된 job을 다음 기동 시 이어서 수행 (모든 단계가 멱등)
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from app.api.cache import PROJECT_META_CACHE, invalidate_cache
+from app.api.events import EventTopic, event_bus
+from app.config.env import settings
+from app.config.s3 import s3
+
+from .models import ProjectDeletionStatus
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DELETION_COLLECTION = "project_deletions"
+S3_DELETE_BATCH_SIZE = 1000  # delete_objects 1회 최대 키 수
+S3_DELETE_CONCURRENCY = 4
+SEGMENT_DELETE_BATCH_SIZE = 1000
+# 이 시간 동안 진행이 갱신되지 않으면 다른 워커가 이어받음
+DELETION_LEASE = timedelta(minutes=5)
+
+# project_id로 바로 지우는 컬렉션 (세그먼트/번역은 별도 배치 단계)
+CASCADE_COLLECTIONS = (
+    "editor_segments",
+    "issues",
+    "segments",
+    "jobs",
+    "assets",
+    "project_targets",
+    "pipelines",
+)
+DELETION_STEPS = ("s3", "project_segments", *CASCADE_COLLECTIONS)
+
+_running: Dict[str, asyncio.Task] = {}
+
+
+async def request_project_deletion(
+    db: AsyncIOMotorDatabase, project_id: str
+) -> Optional[Dict[str, Any]]:
+    """
+    프로젝트 삭제 job 등록 (프로젝트가 없고 진행 중인 job도 없으면 None)
+
+    이미 등록된 job이 있으면 그대로 반환하고, 실패한 job은 다시 대기열에 넣습니다.
+    """
+    project_oid = ObjectId(project_id)
+    project_ref = str(project_oid)
+    deletions = db[PROJECT_DELETION_COLLECTION]
+
+    existing = await deletions.find_one({"_id": project_ref})
+    if existing and existing["status"] != ProjectDeletionStatus.FAILED:
+        return existing
+
+    now = datetime.now()
+    job = await deletions.find_one_and_update(
+        {"_id": project_ref},
+        {
+            "$set": {
+                "status": ProjectDeletionStatus.QUEUED,
+                "progress": 0,
+                "steps": {},
+                "error": None,
+                "requested_at": now,
+                "lease_until": now,
+            },
+            "$unset": {"finished_at": ""},
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+    # job을 먼저 남긴 뒤 프로젝트를 지워, 중간에 죽어도 하위 데이터가 고아로 남지 않게 함
+    result = await db["projects"].delete_one({"_id": project_oid})
+    if result.deleted_count == 0 and existing is None:
+        await deletions.delete_one({"_id": project_ref})
+        return None
+
+    await invalidate_cache(PROJECT_META_CACHE, project_ref)
+    start_project_deletion(db, project_ref)
+    return job
+
+
+async def get_project_deletion(
+    db: AsyncIOMotorDatabase, project_id: str
+) -> Optional[Dict[str, Any]]:
+    try:
+        project_ref = str(ObjectId(project_id))
+    except (InvalidId, TypeError):
+        return None
+    return await db[PROJECT_DELETION_COLLECTION].find_one({"_id": project_ref})
+
+
+def start_project_deletion(db: AsyncIOMotorDatabase, project_id: str) -> None:
+    task = _running.get(project_id)
+    if task is not None and not task.done():
+        return
+    task = asyncio.create_task(
+        _run_deletion(db, project_id), name=f"project-deletion:{project_id}"
+    )
+    _running[project_id] = task
+    task.add_done_callback(lambda _: _running.pop(project_id, None))
+
+
+async def resume_project_deletions(db: AsyncIOMotorDatabase) -> int:
+    """대기 중이거나 lease가 만료된 삭제 job 재개"""
+    resumed = 0
+    cursor = db[PROJECT_DELETION_COLLECTION].find(
+        {
+            "status": {
+                "$in": [ProjectDeletionStatus.QUEUED, ProjectDeletionStatus.RUNNING]
+            },
+            "lease_until": {"$lt": datetime.now()},
+        },
+        {"_id": 1},
+    )
+    async for doc in cursor:
+        start_project_deletion(db, doc["_id"])
+        resumed += 1
+    if resumed:
+        logger.info(f"Project deletions resumed: {resumed}")
+    return resumed
+
+
+async def stop_project_deletions() -> None:
+    """종료 시 진행 중인 job 취소 (lease 만료 후 다음 기동에서 재개)"""
+    tasks = list(_running.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _run_deletion(db: AsyncIOMotorDatabase, project_id: str) -> None:
+    deletions = db[PROJECT_DELETION_COLLECTION]
+    now = datetime.now()
+    # 여러 워커가 같은 job을 동시에 수행하지 않도록 lease로 선점
+    claimed = await deletions.find_one_and_update(
+        {
+            "_id": project_id,
+            "status": {
+                "$in": [ProjectDeletionStatus.QUEUED, ProjectDeletionStatus.RUNNING]
+            },
+            "lease_until": {"$lte": now},
+        },
+        {
+            "$set": {
+                "status": ProjectDeletionStatus.RUNNING,
+                "started_at": now,
+                "lease_until": now + DELETION_LEASE,
+            }
+        },
+        return_document=ReturnDocument.AFTER,
+    )
+    if claimed is None:
+        return
+
+    steps: Dict[str, int] = dict(claimed.get("steps") or {})
+
+    async def _report(step: str, count: int) -> None:
+        steps[step] = count
+        progress = int(len(steps) / len(DELETION_STEPS) * 100)
+        await deletions.update_one(
+            {"_id": project_id},
+            {
+                "$set": {
+                    f"steps.{step}": count,
+                    "progress": progress,
+                    "lease_until": datetime.now() + DELETION_LEASE,
+                }
+            },
+        )
+        await event_bus.publish(
+            EventTopic.PROGRESS,
+            project_id,
+            "project_deletion",
+            {"status": ProjectDeletionStatus.RUNNING, "progress": progress, "step": step},
+        )
+
+    try:
+        if "s3" not in steps:
+            await _report("s3", await _delete_s3_prefix(f"projects/{project_id}/"))
+        if "project_segments" not in steps:
+            await _report("project_segments", await _delete_segments(db, project_id))
+        for collection_name in CASCADE_COLLECTIONS:
+            if collection_name in steps:
+                continue
+            result = await db[collection_name].delete_many({"project_id": project_id})
+            await _report(collection_name, result.deleted_count)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        logger.error(f"Project deletion failed for {project_id}: {exc}")
+        await deletions.update_one(
+            {"_id": project_id},
+            {
+                "$set": {
+                    "status": ProjectDeletionStatus.FAILED,
+                    "error": str(exc),
+                    "finished_at": datetime.now(),
+                }
+            },
+        )
+        await event_bus.publish(
+            EventTopic.PROGRESS,
+            project_id,
+            "project_deletion",
+            {"status": ProjectDeletionStatus.FAILED, "error": str(exc)},
+        )
+        return
+
+    await deletions.update_one(
+        {"_id": project_id},
+        {
+            "$set": {
+                "status": ProjectDeletionStatus.COMPLETED,
+                "progress": 100,
+                "finished_at": datetime.now(),
+            }
+        },
+    )
+    await event_bus.publish(
+        EventTopic.PROGRESS,
+        project_id,
+        "project_deletion",
+        {"status": ProjectDeletionStatus.COMPLETED, "progress": 100},
+    )
+    logger.info(f"Project {project_id} deleted: {steps}")
+
+
+async def _delete_s3_prefix(prefix: str) -> int:
+    """prefix 아래 객체를 1,000개 단위 delete_objects로 병렬 삭제"""
+    bucket = settings.S3_BUCKET
+    semaphore = asyncio.Semaphore(S3_DELETE_CONCURRENCY)
+
+    async def _delete_batch(keys: list[str]) -> int:
+        async with semaphore:
+            response = await asyncio.to_thread(
+                s3.delete_objects,
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+        errors = response.get("Errors") or []
+        if errors:
+            raise RuntimeError(
+                f"S3 delete failed for {len(errors)} keys "
+                f"(first: {errors[0].get('Key')}: {errors[0].get('Message')})"
+            )
+        return len(keys)
+
+    pending: Set[asyncio.Task] = set()
+    deleted = 0
+    list_kwargs: Dict[str, Any] = {
+        "Bucket": bucket,
+        "Prefix": prefix,
+        "MaxKeys": S3_DELETE_BATCH_SIZE,
+    }
+    try:
+        while True:
+            page = await asyncio.to_thread(s3.list_objects_v2, **list_kwargs)
+            keys = [obj["Key"] for obj in page.get("Contents", [])]
+            if keys:
+                pending.add(asyncio.create_task(_delete_batch(keys)))
+            # 목록 조회가 삭제보다 너무 앞서가지 않도록 제한
+            while len(pending) >= S3_DELETE_CONCURRENCY * 2:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                deleted += sum(task.result() for task in done)
+            if not page.get("IsTruncated"):
+                break
+            list_kwargs["ContinuationToken"] = page["NextContinuationToken"]
+        deleted += sum(await asyncio.gather(*pending))
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        raise
+    return deleted
+
+
+async def _delete_segments(db: AsyncIOMotorDatabase, project_id: str) -> int:
+    """세그먼트를 배치로 조회해 번역과 함께 삭제 (번역은 segment_id로만 연결됨)"""
+    segments = db["project_segments"]
+    deleted = 0
+    while True:
+        batch = (
+            await segments.find({"project_id": project_id}, {"_id": 1})
+            .limit(SEGMENT_DELETE_BATCH_SIZE)
+            .to_list(SEGMENT_DELETE_BATCH_SIZE)
+        )
+        if not batch:
+            return deleted
+        segment_oids = [doc["_id"] for doc in batch]
+        await db["segment_translations"].delete_many(
+            {"segment_id": {"$in": [str(oid) for oid in segment_oids]}}
+        )
+        result = await segments.delete_many({"_id": {"$in": segment_oids}})
+        deleted += result.deleted_count
@@ -22,6 +22,7 @@ class ProjectCreate(BaseModel):
     sourceLanguage: Optional[str] = None
     targetLanguages: List[str]
     tags: List[str] = Field(default_factory=list)
+    useTranslationMemory: bool = True
 
 
 class ProjectThumbnail(BaseModel):
@@ -42,6 +43,7 @@ class ProjectBase(BaseModel):
     speaker_count: Optional[int] = None
     is_replace_voice_samples: Optional[bool] = None
     tags: List[str] = Field(default_factory=list)
+    use_translation_memory: bool = True  # 반복 원문에 이전 기계 번역 재사용
 
 
 class ProjectPublic(ProjectBase):
@@ -76,6 +78,7 @@ class ProjectUpdate(BaseModel):
         None  # {target_lang: {speaker: {default_voice: {ref_wav_key, prompt_text}, replace_voice: {voice_sample_id, similarity, sample_key}}}}
     )
     tags: Optional[List[str]] = None
+    use_translation_memory: Optional[bool] = None
 
 
 class ProjectTargetStatus(str, Enum):
@@ -85,6 +88,27 @@ class ProjectTargetStatus(str, Enum):
     FAILED = "failed"
 
 
+class ProjectDeletionStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ProjectDeletionOut(BaseModel):
+    """프로젝트 삭제 job 진행 상태"""
+
+    project_id: PyObjectId = Field(validation_alias="_id")
+    status: ProjectDeletionStatus
+    progress: int = 0
+    steps: Dict[str, int] = Field(
+        default_factory=dict, description="완료된 단계별 삭제 수 (s3, 컬렉션명)"
+    )
+    error: Optional[str] = None
+    requested_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
 class ProjectTargetCreate(BaseModel):
     project_id: str
     language_code: str
@@ -182,6 +206,9 @@ class EditorStateResponse(BaseModel):
     project_id: str
     segments: list[SegmentTranslationResponse] = []
     # voices: list[VoiceSampleOut] = []
+    next_cursor: Optional[int] = Field(
+        default=None, description="다음 페이지 조회 시 after로 전달할 segment_index"
+    )
     playback: EditorPlaybackState
 
 
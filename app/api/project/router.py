@@ -1,12 +1,18 @@
 from bson import ObjectId
 from bson.errors import InvalidId
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
 from typing import List, Any, Optional
 from pymongo.errors import PyMongoError
 from app.api.deps import DbDep
 from .models import ProjectCreate, ProjectCreateResponse, ProjectOut
-from .service import ProjectService
+from .service import (
+    PROJECT_PAGE_DEFAULT_LIMIT,
+    PROJECT_PAGE_MAX_LIMIT,
+    ProjectService,
+)
+from .deletion import get_project_deletion
 from ..segment.segment_service import SegmentService
+from ..segment.service import SEGMENT_PAGE_MAX_LIMIT
 from app.api.auth.model import UserOut
 from app.api.auth.service import get_current_user_from_cookie
 from .models import (
@@ -14,7 +20,7 @@ from .models import (
     ProjectCreateResponse,
     ProjectOut,
     EditorStateResponse,
-    EditorPlaybackState,
+    ProjectDeletionOut,
     ProjectSegmentCreate,
     SegmentTranslationCreate,
     SegmentTTSRegenerateRequest,
@@ -63,16 +69,27 @@ async def create_project_endpoint(
     summary="현재 사용자 프로젝트 목록",
 )
 async def list_my_projects(
+    response: Response,
     current_user: UserOut = Depends(get_current_user_from_cookie),
     sort: Optional[str] = Query(default="created_at", description="정렬 필드"),
     page: int = Query(1, ge=1),
     limit: int = Query(6, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답 X-Next-Cursor 헤더 값 (created_at 정렬)"
+    ),
     project_service: ProjectService = Depends(ProjectService),
 ) -> List[ProjectOut]:
     try:
-        return await project_service.get_project_paging(
-            sort=sort, page=page, limit=limit, user_id=str(current_user.id)
+        projects, next_cursor = await project_service.get_project_paging(
+            sort=sort,
+            page=page,
+            limit=limit,
+            user_id=str(current_user.id),
+            cursor=cursor,
         )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return projects
     except InvalidId as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -87,10 +104,13 @@ async def list_my_projects(
 
 @project_router.get("", summary="프로젝트 전체 목록")
 async def list_projects(
+    limit: int = Query(PROJECT_PAGE_DEFAULT_LIMIT, ge=1, le=PROJECT_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     project_service: ProjectService = Depends(ProjectService),
 ) -> dict:
-    projects = await project_service.list_projects_with_targets()
-    return {"items": projects}
+    """최신순 keyset 페이지 (다음 페이지는 next_cursor를 cursor로 전달)"""
+    projects, next_cursor = await project_service.list_projects_page(limit, cursor)
+    return {"items": projects, "next_cursor": next_cursor}
 
 
 @project_router.get("/{project_id}", summary="프로젝트 상세 조회")
@@ -146,83 +166,84 @@ async def get_project(
     return ProjectOut.model_validate(project)
 
 
-@project_router.delete("/{project_id}", response_model=int, summary="프로젝트 삭제")
+@project_router.delete(
+    "/{project_id}",
+    response_model=ProjectDeletionOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="프로젝트 삭제",
+)
 async def delete_project(
     project_id: str,
     project_service: ProjectService = Depends(ProjectService),
-    segment_service: SegmentService = Depends(SegmentService),
-) -> None:
+) -> ProjectDeletionOut:
+    """
+    프로젝트를 즉시 목록에서 제거하고 S3/하위 컬렉션 정리는 백그라운드로 수행합니다.
+    진행 상태는 GET /projects/{project_id}/deletion 으로 조회합니다.
+    """
     try:
-        project_oid = ObjectId(project_id)
+        ObjectId(project_id)
     except InvalidId as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid project_id",
         ) from exc
 
-    result = await project_service.delete_project(project_oid)
-    if result == 0:
+    job = await project_service.delete_project(project_id)
+    if job is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
+    return ProjectDeletionOut.model_validate(job)
+
 
-    result = await segment_service.delete_segments_by_project(project_oid)
-    return result
+@project_router.get(
+    "/{project_id}/deletion",
+    response_model=ProjectDeletionOut,
+    summary="프로젝트 삭제 진행 상태",
+)
+async def get_project_deletion_status(project_id: str, db: DbDep) -> ProjectDeletionOut:
+    job = await get_project_deletion(db, project_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project deletion not found",
+        )
+    return ProjectDeletionOut.model_validate(job)
 
 
-@project_router.get("/{project_id}/languages/{language_code}", summary="에디터 조회")
+@project_router.get(
+    "/{project_id}/languages/{language_code}",
+    response_model=EditorStateResponse,
+    summary="에디터 조회",
+)
 async def get_project_editor(
     project_id: str,
     language_code: str,
-    db: DbDep,
-    project_service: ProjectService = Depends(ProjectService),
     segment_service: SegmentService = Depends(SegmentService),
-) -> EditorStateResponse:
-    from ..issues.service import IssueService
-
-    project = await project_service.get_project_by_id(project_id)  # 기본 정보
-    segments = await segment_service.get_project_segment_translations(
-        project_id, language_code
-    )
-
-    # 이슈 조회
-    issue_service = IssueService(db)
-    issues = await issue_service.get_issues_by_project(project_id, language_code)
-
-    # 이슈를 segment_translation_id로 그룹화
-    issues_by_translation_id: dict[str, list] = {}
-    for issue in issues:
-        translation_id = issue.segment_translation_id
-        if translation_id not in issues_by_translation_id:
-            issues_by_translation_id[translation_id] = []
-        issues_by_translation_id[translation_id].append(issue)
-
-    # 각 세그먼트에 이슈 추가
-    for segment in segments:
-        translation_id = str(segment.translation_id) if segment.translation_id else None
-        if translation_id:
-            segment.issues = issues_by_translation_id.get(translation_id, [])
-        else:
-            segment.issues = []
-
-    # voices = []  # TODO: project_id + language_code 기반 조회
-    # glossaries = []  # TODO: project_id 기반 조회
-    playback = EditorPlaybackState(
-        duration=project.duration_seconds or 0,
-        active_language=language_code,
-        playback_rate=1.0,
-        video_source=project.video_source,
-        audio_source=project.audio_source,
-        background_audio_source=project.background_audio_source,
-    )
+    after: Optional[int] = Query(
+        None, ge=-1, description="이전 응답의 next_cursor (segment_index)"
+    ),
+    limit: Optional[int] = Query(None, ge=1, le=SEGMENT_PAGE_MAX_LIMIT),
+    start: Optional[float] = Query(None, ge=0, description="타임라인 구간 시작(초)"),
+    end: Optional[float] = Query(None, ge=0, description="타임라인 구간 끝(초)"),
+) -> dict:
+    """
+    에디터 상태 조회
 
-    return EditorStateResponse(
-        project_id=str(project_id),
-        segments=segments,
-        # voices=voices,
-        # glossaries=glossaries,
-        playback=playback,
+    파라미터가 없으면 전체 세그먼트를 반환합니다. 긴 영상은 limit/after로
+    페이지 단위로, 또는 start/end로 화면에 보이는 구간만 조회할 수 있습니다.
+    """
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+    # 세그먼트/번역/이슈/보이스 정보를 한 번에 조합 (검증은 response_model에서 1회)
+    return await segment_service.get_editor_state(
+        project_id,
+        language_code,
+        after=after,
+        limit=limit,
+        window_start=start,
+        window_end=end,
     )
 
 
@@ -1,8 +1,15 @@
 from fastapi import HTTPException, status
 from datetime import datetime
-from typing import Optional, List
+import base64
+from typing import Optional, List, Tuple
 from bson import ObjectId
+from bson.errors import InvalidId
 from ..deps import DbDep
+from app.config.db import for_listing
+from .summary import PROJECT_SUMMARY_VERSION, sync_target_summary
+from ..cache import PROJECT_META_CACHE, invalidate_cache
+from .deletion import request_project_deletion
+from ..segment.read_model import sync_editor_voice_replacements
 from .models import (
     ProjectCreate,
     ProjectUpdate,
@@ -13,7 +20,6 @@ from .models import (
     ProjectTarget,
     ProjectTargetUpdate,
 )
-from app.config.s3 import drop_projects
 from app.config.env import settings
 
 
@@ -35,10 +41,46 @@ def normalize_tags(tags: list[str] | None, limit: int = 10) -> list[str]:
     return normalized
 
 
+PROJECT_PAGE_DEFAULT_LIMIT = 20
+PROJECT_PAGE_MAX_LIMIT = 100
+# 목록 카드에 필요한 필드만 조회
+PROJECT_LIST_PROJECTION = {
+    "title": 1,
+    "status": 1,
+    "video_source": 1,
+    "thumbnail": 1,
+    "duration_seconds": 1,
+    "issue_count": 1,
+    "target_summary": 1,
+    "source_language": 1,
+    "created_at": 1,
+    "speaker_count": 1,
+    "tags": 1,
+}
+
+
+def encode_project_cursor(doc: dict) -> str:
+    """마지막 항목의 (created_at, _id)를 불투명 커서로 인코딩"""
+    created_at: datetime = doc["created_at"]
+    raw = f"{created_at.isoformat()}|{doc['_id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_project_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, last_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), ObjectId(last_id)
+    except (ValueError, InvalidId) as exc:
+        raise HTTPException(status_code=400, detail="invalid cursor") from exc
+
+
 class ProjectService:
     def __init__(self, db: DbDep):
         self.db = db
         self.project_collection = db.get_collection("projects")
+        # 목록 조회는 읽기 복제본 허용 (쓰기 직후 잠깐 이전 상태가 보일 수 있음)
+        self.project_list_collection = for_listing(self.project_collection)
         self.segment_collection = db.get_collection("segments")
         self.target_collection = db.get_collection("project_targets")
         self.bucket = settings.S3_BUCKET
@@ -54,76 +96,78 @@ class ProjectService:
         sort: str = "created_at",
         page: int = 1,
         limit: int = 6,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProjectOut], Optional[str]]:
+        """
+        사용자 프로젝트 목록
+
+        cursor가 있거나 created_at 정렬이면 (owner_code, created_at, _id) 인덱스로
+        keyset 조회하고, 그 외 정렬 필드는 기존처럼 skip으로 조회합니다.
+        issue_count/targets는 프로젝트 문서의 요약 필드를 그대로 사용합니다.
+        """
+        query: dict = {"owner_code": user_id}
+        if cursor or sort == "created_at":
+            if page > 1 and not cursor:
+                # 커서 없이 페이지 번호만 온 경우 (이전 클라이언트 호환)
+                return await self._paging_by_skip(query, sort, page, limit), None
+            return await self._paging_by_cursor(query, limit, cursor)
+        return await self._paging_by_skip(query, sort, page, limit), None
+
+    async def list_projects_page(
+        self, limit: int = PROJECT_PAGE_DEFAULT_LIMIT, cursor: Optional[str] = None
+    ) -> Tuple[List[ProjectOut], Optional[str]]:
+        """전체 프로젝트 keyset 페이지 (created_at, _id 내림차순)"""
+        return await self._paging_by_cursor({}, limit, cursor)
+
+    async def _paging_by_cursor(
+        self, query: dict, limit: int, cursor: Optional[str]
+    ) -> Tuple[List[ProjectOut], Optional[str]]:
+        if cursor:
+            created_at, last_id = decode_project_cursor(cursor)
+            query = {
+                **query,
+                "$or": [
+                    {"created_at": {"$lt": created_at}},
+                    {"created_at": created_at, "_id": {"$lt": last_id}},
+                ],
+            }
+        docs = (
+            await self.project_list_collection.find(query, PROJECT_LIST_PROJECTION)
+            .sort([("created_at", -1), ("_id", -1)])
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = encode_project_cursor(docs[-1])
+        return [self._project_out(doc) for doc in docs], next_cursor
+
+    async def _paging_by_skip(
+        self, query: dict, sort: str, page: int, limit: int
     ) -> List[ProjectOut]:
-        skip = (page - 1) * limit
         docs = (
-            await self.project_collection.find({"owner_code": user_id})
+            await self.project_list_collection.find(query, PROJECT_LIST_PROJECTION)
             .sort([(sort, -1)])
-            .skip(skip)
+            .skip((page - 1) * limit)
             .limit(limit)
             .to_list(length=limit)
         )
+        return [self._project_out(doc) for doc in docs]
 
-        project_ids = [doc["_id"] for doc in docs]
-
-        pipeline = [
-            {"$match": {"project_id": {"$in": project_ids}}},
-            {
-                "$lookup": {
-                    "from": "issues",
-                    "let": {"segmentId": "$_id"},
-                    "pipeline": [
-                        {"$match": {"$expr": {"$eq": ["$segment_id", "$$segmentId"]}}},
-                        {"$count": "count"},
-                    ],
-                    "as": "issue_docs",
-                }
-            },
-            {
-                "$addFields": {
-                    "issue_count": {"$ifNull": [{"$first": "$issue_docs.count"}, 0]}
-                }
-            },
-            {
-                "$group": {
-                    "_id": "$project_id",
-                    "issue_count": {"$sum": "$issue_count"},
-                }
-            },
-        ]
-        issue_counts = await self.segment_collection.aggregate(pipeline).to_list(
-            length=None
-        )
-        issue_map = {row["_id"]: row["issue_count"] for row in issue_counts}
-
-        result = []
-        for doc in docs:
-            doc["issue_count"] = issue_map.get(doc["_id"], 0)
-            result.append(ProjectOut.model_validate(doc))
-        return result
+    @staticmethod
+    def _project_out(doc: dict) -> ProjectOut:
+        doc["targets"] = list((doc.pop("target_summary", None) or {}).values())
+        doc.setdefault("issue_count", 0)
+        return ProjectOut.model_validate(doc)
 
     async def list_projects_with_targets(self) -> List[ProjectOut]:
-        pipeline = [
-            {"$addFields": {"project_id_str": {"$toString": "$_id"}}},
-            {"$sort": {"created_at": -1}},
-            {
-                "$lookup": {
-                    "from": "project_targets",
-                    "localField": "project_id_str",
-                    "foreignField": "project_id",
-                    "as": "targets",
-                }
-            },
-        ]
-        docs = await self.project_collection.aggregate(pipeline).to_list(length=None)
-        for doc in docs:
-            doc["targets"] = doc.get("targets") or []
-        return [ProjectOut.model_validate(doc) for doc in docs]
+        projects, _ = await self.list_projects_page(limit=PROJECT_PAGE_MAX_LIMIT)
+        return projects
 
-    async def delete_project(self, project_id: str) -> int:
-        drop_projects(project_id=project_id)
-        result = await self.project_collection.delete_one({"_id": project_id})
-        return result.deleted_count
+    async def delete_project(self, project_id: str) -> Optional[dict]:
+        """삭제 job 등록 후 즉시 반환 (S3/하위 컬렉션 정리는 project/deletion.py)"""
+        return await request_project_deletion(self.db, project_id)
 
     async def create_project(self, payload: ProjectCreate) -> str:
         now = datetime.now()
@@ -138,8 +182,17 @@ class ProjectService:
             speaker_count=payload.speakerCount,
             is_replace_voice_samples=payload.replaceVoiceSamples,
             tags=normalize_tags(payload.tags),
+            use_translation_memory=payload.useTranslationMemory,
         )
         doc = base.model_dump(exclude_none=True)
+        # 목록 조회용 요약 필드 (project/summary.py에서 유지)
+        doc.update(
+            {
+                "issue_count": 0,
+                "target_summary": {},
+                "summary_version": PROJECT_SUMMARY_VERSION,
+            }
+        )
         result = await self.project_collection.insert_one(doc)
         # 프로젝트 생성 시, 타겟(타겟 언어별 진행도) 생성
         project_id = str(result.inserted_id)
@@ -157,6 +210,12 @@ class ProjectService:
             {"_id": ObjectId(project_id)},
             {"$set": update_data},
         )
+        if "title" in update_data:
+            await invalidate_cache(PROJECT_META_CACHE, str(ObjectId(project_id)))
+        if "speaker_voices" in update_data:
+            await sync_editor_voice_replacements(
+                self.db, project_id, update_data["speaker_voices"]
+            )
 
         doc = await self.project_collection.find_one({"_id": ObjectId(project_id)})
         if not doc:
@@ -194,6 +253,7 @@ class ProjectService:
             )
         if docs:
             await self.target_collection.insert_many(docs)
+            await sync_target_summary(self.db, project_id)
 
     async def get_targets_by_project(
         self, project_id: str, language_code: str | None = None
@@ -224,6 +284,7 @@ class ProjectService:
             # {"$set": {**update_data, "project_id": doc["project_id"]}},
         )
         doc = await self.target_collection.find_one({"_id": ObjectId(target_id)})
+        await sync_target_summary(self.db, doc["project_id"], doc["language_code"])
         doc["target_id"] = str(doc["_id"])
         return doc
 
@@ -246,5 +307,6 @@ class ProjectService:
         doc = await self.target_collection.find_one(
             {"project_id": project_id, "language_code": language_code}
         )
+        await sync_target_summary(self.db, project_id, language_code)
         doc["target_id"] = str(doc["_id"])
         return doc
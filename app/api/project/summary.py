@@ -0,0 +1,112 @@
+"""
+프로젝트 목록용 요약 필드 유지
+
+목록 조회가 이슈/타겟 컬렉션을 집계하지 않도록 프로젝트 문서에 요약을 저장합니다.
+
+- issue_count: 프로젝트 이슈 수 (이슈 생성 시 $inc, 삭제 시 재계산)
+- target_summary: {language_code: {_id, project_id, language_code, status, progress}}
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.utils.ids import try_object_id
+
+logger = logging.getLogger(__name__)
+
+PROJECT_SUMMARY_VERSION = 1
+TARGET_SUMMARY_FIELDS = ("project_id", "language_code", "status", "progress")
+
+
+def _target_entry(target: Dict[str, Any]) -> Dict[str, Any]:
+    entry = {"_id": target["_id"]}
+    entry.update({field: target.get(field) for field in TARGET_SUMMARY_FIELDS})
+    return entry
+
+
+async def increment_issue_count(
+    db: AsyncIOMotorDatabase, project_id: Optional[str], amount: int = 1
+) -> None:
+    project_oid = try_object_id(project_id)
+    if project_oid is None:
+        return
+    await db["projects"].update_one(
+        {"_id": project_oid}, {"$inc": {"issue_count": amount}}
+    )
+
+
+async def refresh_issue_count(
+    db: AsyncIOMotorDatabase, project_id: Optional[str]
+) -> None:
+    """이슈 삭제 후 (project_id, language_code) 인덱스로 재계산"""
+    project_oid = try_object_id(project_id)
+    if project_oid is None:
+        return
+    count = await db["issues"].count_documents({"project_id": str(project_oid)})
+    await db["projects"].update_one(
+        {"_id": project_oid}, {"$set": {"issue_count": count}}
+    )
+
+
+async def sync_target_summary(
+    db: AsyncIOMotorDatabase, project_id: str, language_code: Optional[str] = None
+) -> None:
+    """project_targets 변경을 프로젝트 문서의 target_summary에 반영"""
+    project_oid = try_object_id(project_id)
+    if project_oid is None:
+        return
+    query: Dict[str, Any] = {"project_id": str(project_oid)}
+    if language_code:
+        query["language_code"] = language_code
+    targets = await db["project_targets"].find(query).to_list(length=None)
+    if not targets:
+        return
+    await db["projects"].update_one(
+        {"_id": project_oid},
+        {
+            "$set": {
+                f"target_summary.{target['language_code']}": _target_entry(target)
+                for target in targets
+            }
+        },
+    )
+
+
+async def rebuild_project_summary(db: AsyncIOMotorDatabase, project_id: str) -> None:
+    """요약 필드 전체 재계산 (백필/정합성 복구용)"""
+    project_oid = try_object_id(project_id)
+    if project_oid is None:
+        return
+    project_ref = str(project_oid)
+    targets = await db["project_targets"].find({"project_id": project_ref}).to_list(
+        length=None
+    )
+    issue_count = await db["issues"].count_documents({"project_id": project_ref})
+    await db["projects"].update_one(
+        {"_id": project_oid},
+        {
+            "$set": {
+                "issue_count": issue_count,
+                "target_summary": {
+                    target["language_code"]: _target_entry(target) for target in targets
+                },
+                "summary_version": PROJECT_SUMMARY_VERSION,
+            }
+        },
+    )
+
+
+async def backfill_project_summaries(db: AsyncIOMotorDatabase) -> int:
+    """요약 버전이 최신이 아닌 프로젝트 재계산"""
+    rebuilt = 0
+    cursor = db["projects"].find(
+        {"summary_version": {"$ne": PROJECT_SUMMARY_VERSION}}, {"_id": 1}
+    )
+    async for doc in cursor:
+        await rebuild_project_summary(db, str(doc["_id"]))
+        rebuilt += 1
+    if rebuilt:
+        logger.info(f"Project summaries rebuilt: {rebuilt}")
+    return rebuilt
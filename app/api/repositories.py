@@ -0,0 +1,111 @@
+"""
+참조 ID를 정규화하는 컬렉션 리포지토리
+
+쓰기/조회 시 참조 필드(project_id, segment_id 등)를 항상 문자열로 맞춰
+저장 타입이 섞이지 않도록 합니다. (규칙: app/utils/ids.py)
+
+    segments = ProjectSegmentRepository(db)
+    docs = await segments.find({"project_id": project_oid}).to_list(None)
+"""
+
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.utils.ids import REFERENCE_FIELDS, normalize_refs
+
+
+class RefRepository:
+    collection_name: ClassVar[str]
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.collection = db.get_collection(self.collection_name)
+
+    @property
+    def ref_fields(self) -> Tuple[str, ...]:
+        return REFERENCE_FIELDS.get(self.collection_name, ())
+
+    def normalize(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """문서/필터의 참조 필드를 문자열로 변환 ($and/$or 내부 포함)"""
+        normalized = normalize_refs(doc, self.ref_fields)
+        for operator in ("$and", "$or"):
+            if operator in normalized:
+                normalized[operator] = [
+                    self.normalize(clause) for clause in normalized[operator]
+                ]
+        return normalized
+
+    def _normalize_update(self, update: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            operator: self.normalize(fields) if operator.startswith("$") else fields
+            for operator, fields in update.items()
+        }
+
+    # 조회
+    def find(self, filter: Dict[str, Any], projection: Optional[Dict[str, Any]] = None):
+        return self.collection.find(self.normalize(filter), projection)
+
+    async def find_one(
+        self, filter: Dict[str, Any], projection: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one(self.normalize(filter), projection, **kwargs)
+
+    async def count_documents(self, filter: Dict[str, Any]) -> int:
+        return await self.collection.count_documents(self.normalize(filter))
+
+    async def distinct(self, key: str, filter: Dict[str, Any]) -> List[Any]:
+        return await self.collection.distinct(key, self.normalize(filter))
+
+    # 쓰기
+    async def insert_one(self, doc: Dict[str, Any]):
+        normalized = self.normalize(doc)
+        result = await self.collection.insert_one(normalized)
+        doc["_id"] = result.inserted_id
+        return result
+
+    async def insert_many(self, docs: Iterable[Dict[str, Any]]):
+        docs = list(docs)
+        normalized = [self.normalize(doc) for doc in docs]
+        result = await self.collection.insert_many(normalized)
+        for doc, inserted_id in zip(docs, result.inserted_ids):
+            doc["_id"] = inserted_id
+        return result
+
+    async def update_one(self, filter: Dict[str, Any], update: Dict[str, Any], **kwargs):
+        return await self.collection.update_one(
+            self.normalize(filter), self._normalize_update(update), **kwargs
+        )
+
+    async def update_many(self, filter: Dict[str, Any], update: Dict[str, Any], **kwargs):
+        return await self.collection.update_many(
+            self.normalize(filter), self._normalize_update(update), **kwargs
+        )
+
+    async def delete_many(self, filter: Dict[str, Any]):
+        return await self.collection.delete_many(self.normalize(filter))
+
+
+class ProjectSegmentRepository(RefRepository):
+    collection_name = "project_segments"
+
+
+class SegmentTranslationRepository(RefRepository):
+    collection_name = "segment_translations"
+
+
+class LegacySegmentRepository(RefRepository):
+    """이전 구조의 segments 컬렉션 (프리뷰/용어 제안에서 사용)"""
+
+    collection_name = "segments"
+
+
+class ProjectTargetRepository(RefRepository):
+    collection_name = "project_targets"
+
+
+class IssueRepository(RefRepository):
+    collection_name = "issues"
+
+
+class AssetRepository(RefRepository):
+    collection_name = "assets"
@@ -0,0 +1,273 @@
+"""
+프로젝트 언어 전체 번역
+
+POST /projects/{id}/languages/{lang}/translate 로 접수하면 백그라운드에서
+1. 세그먼트를 한 번의 쿼리로 읽고
+2. 토큰 예산(MT_BULK_CHUNK_TOKENS)에 맞춰 청크로 나눈 뒤
+3. 청크를 세마포어(MT_BULK_CONCURRENCY) 안에서 동시에 배치 번역 (재시도 + 지수 백오프)
+4. 결과를 segment_translations에 bulk_write 한 번으로 저장합니다.
+
+진행 상황은 progress 토픽의 "bulk-translation" 이벤트로 전달됩니다.
+"""
+
+import asyncio
+import logging
+import os
+import random
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from app.api.progress.dispatcher import broadcast_progress_event
+from app.api.progress.models import ProgressEventType, TaskStatus
+
+from .read_model import rebuild_editor_language
+from .translate_service import translate_items_with_memory
+
+logger = logging.getLogger(__name__)
+
+BULK_TRANSLATE_CHUNK_TOKENS = int(os.getenv("MT_BULK_CHUNK_TOKENS", "3000"))
+# 응답(max_output_tokens=8192)이 잘리지 않도록 청크당 항목 수도 제한
+BULK_TRANSLATE_MAX_ITEMS = int(os.getenv("MT_BULK_MAX_ITEMS", "80"))
+BULK_TRANSLATE_CONCURRENCY = int(os.getenv("MT_BULK_CONCURRENCY", "4"))
+BULK_TRANSLATE_RETRIES = 3
+BULK_TRANSLATE_BACKOFF = 1.0  # 초, 시도마다 2배
+# 항목마다 붙는 "[i] seg_idx=.. text=" 접두어와 JSON 응답 키
+_ITEM_OVERHEAD_TOKENS = 12
+
+_running: Dict[Tuple[str, str], asyncio.Task] = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (한국어/일본어는 글자당 토큰이 많아 보수적으로 3자당 1토큰)"""
+    return len(text) // 3 + 1 + _ITEM_OVERHEAD_TOKENS
+
+
+def chunk_by_token_budget(
+    items: List[Dict[str, Any]], budget: int, max_items: int
+) -> List[List[Dict[str, Any]]]:
+    """입력 순서를 유지하며 토큰 예산/항목 수 안에서 청크 분할 (예산을 넘는 단일 항목은 단독 청크)"""
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    used = 0
+    for item in items:
+        tokens = estimate_tokens(str(item["text"]))
+        if current and (used + tokens > budget or len(current) >= max_items):
+            chunks.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def start_project_translation(
+    db: AsyncIOMotorDatabase,
+    project_id: str,
+    language_code: str,
+    src_lang: Optional[str] = None,
+) -> Dict[str, Any]:
+    """세그먼트를 읽어 청크를 만든 뒤 백그라운드 번역 시작"""
+    try:
+        project_oid = ObjectId(project_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid project_id"
+        )
+    project_ref = str(project_oid)
+    key = (project_ref, language_code)
+    task = _running.get(key)
+    if task is not None and not task.done():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Translation for this language is already running",
+        )
+
+    project, segments = await asyncio.gather(
+        db["projects"].find_one(
+            {"_id": project_oid},
+            {"source_language": 1, "use_translation_memory": 1},
+        ),
+        db["project_segments"]
+        .find(
+            {"project_id": project_ref},
+            {"source_text": 1, "segment_index": 1, "start": 1, "end": 1},
+        )
+        .sort("segment_index", 1)
+        .to_list(length=None),
+    )
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+        )
+
+    segments = [segment for segment in segments if segment.get("source_text")]
+    # seg_idx는 배치 응답을 세그먼트에 되돌리는 용도라 목록 위치로 사용
+    items = [
+        {"seg_idx": index, "text": segment["source_text"]}
+        for index, segment in enumerate(segments)
+    ]
+    chunks = chunk_by_token_budget(
+        items, BULK_TRANSLATE_CHUNK_TOKENS, BULK_TRANSLATE_MAX_ITEMS
+    )
+
+    if chunks:
+        task = asyncio.create_task(
+            _run_project_translation(
+                db,
+                project_ref,
+                language_code,
+                src_lang or project.get("source_language"),
+                project.get("use_translation_memory", True),
+                segments,
+                chunks,
+            ),
+            name=f"bulk-translate:{project_ref}:{language_code}",
+        )
+        _running[key] = task
+        task.add_done_callback(lambda _: _running.pop(key, None))
+
+    return {
+        "project_id": project_ref,
+        "language_code": language_code,
+        "status": "queued",
+        "total_segments": len(items),
+        "chunk_count": len(chunks),
+    }
+
+
+async def stop_project_translations() -> None:
+    """종료 시 진행 중인 번역 취소"""
+    tasks = list(_running.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _translate_chunk(
+    db: AsyncIOMotorDatabase,
+    chunk: List[Dict[str, Any]],
+    language_code: str,
+    src_lang: Optional[str],
+    use_memory: bool,
+) -> List[Dict[str, Any]]:
+    for attempt in range(BULK_TRANSLATE_RETRIES):
+        try:
+            return await translate_items_with_memory(
+                db, chunk, language_code, src_lang=src_lang, use_memory=use_memory
+            )
+        except Exception as exc:
+            if attempt == BULK_TRANSLATE_RETRIES - 1:
+                raise
+            delay = BULK_TRANSLATE_BACKOFF * 2**attempt
+            delay += random.uniform(0, BULK_TRANSLATE_BACKOFF)
+            logger.warning(
+                f"Bulk translation chunk failed (attempt {attempt + 1}), "
+                f"retrying in {delay:.1f}s: {exc}"
+            )
+            await asyncio.sleep(delay)
+    return []
+
+
+async def _run_project_translation(
+    db: AsyncIOMotorDatabase,
+    project_id: str,
+    language_code: str,
+    src_lang: Optional[str],
+    use_memory: bool,
+    segments: List[Dict[str, Any]],
+    chunks: List[List[Dict[str, Any]]],
+) -> None:
+    total = len(segments)
+    semaphore = asyncio.Semaphore(BULK_TRANSLATE_CONCURRENCY)
+    translations: Dict[int, str] = {}
+    failed = 0
+
+    async def _publish(
+        task_status: TaskStatus, message: Optional[str] = None, **extra: Any
+    ) -> None:
+        await broadcast_progress_event(
+            ProgressEventType.BULK_TRANSLATION,
+            project_id,
+            target_lang=language_code,
+            status=task_status,
+            progress=int((len(translations) + failed) / total * 100),
+            message=message,
+            metadata={
+                "translated": len(translations),
+                "failed": failed,
+                "total": total,
+                **extra,
+            },
+        )
+
+    async def _run_chunk(chunk: List[Dict[str, Any]]) -> None:
+        nonlocal failed
+        async with semaphore:
+            try:
+                results = await _translate_chunk(
+                    db, chunk, language_code, src_lang, use_memory
+                )
+            except Exception as exc:
+                logger.error(
+                    f"Bulk translation chunk failed for {project_id}/{language_code}: {exc}"
+                )
+                failed += len(chunk)
+                await _publish(TaskStatus.PROCESSING)
+                return
+        for result in results:
+            translations[int(result["seg_idx"])] = result["translation"]
+        await _publish(TaskStatus.PROCESSING)
+
+    await _publish(TaskStatus.PROCESSING)
+    try:
+        await asyncio.gather(*(_run_chunk(chunk) for chunk in chunks))
+
+        now = datetime.now()
+        operations = []
+        for index, translation in translations.items():
+            segment = segments[index]
+            segment_id = str(segment["_id"])
+            operations.append(
+                UpdateOne(
+                    {"segment_id": segment_id, "language_code": language_code},
+                    {
+                        "$set": {"target_text": translation},
+                        "$setOnInsert": {
+                            "project_id": project_id,
+                            "segment_id": segment_id,
+                            "language_code": language_code,
+                            "start": segment.get("start"),
+                            "end": segment.get("end"),
+                            "created_at": now,
+                        },
+                        "$currentDate": {"updated_at": True},
+                    },
+                    upsert=True,
+                )
+            )
+        if operations:
+            await db["segment_translations"].bulk_write(operations, ordered=False)
+            await rebuild_editor_language(db, project_id, language_code)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        logger.error(f"Bulk translation failed for {project_id}/{language_code}: {exc}")
+        await _publish(TaskStatus.FAILED, message=f"번역 실패: {exc}", error=str(exc))
+        return
+
+    # 일부 청크만 실패해도 작업은 끝난 것으로 보고 실패 수는 metadata로 전달
+    await _publish(
+        TaskStatus.COMPLETED,
+        message=f"세그먼트 {failed}개 번역 실패" if failed else None,
+    )
+    logger.info(
+        f"Bulk translation done: project={project_id} lang={language_code} "
+        f"translated={len(translations)} failed={failed} chunks={len(chunks)}"
+    )
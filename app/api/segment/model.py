@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Annotated, Optional
+from typing import Any, Dict, List, Annotated, Literal, Optional
 from pydantic import BaseModel, Field, BeforeValidator
 from bson import ObjectId
 
@@ -191,9 +191,36 @@ class UpdateSegmentsRequest(BaseModel):
     )
 
 
+class SegmentUpdateResult(BaseModel):
+    """세그먼트별 일괄 업데이트 결과"""
+
+    id: str = Field(..., description="세그먼트 ID")
+    status: Literal["updated", "unchanged", "not_found", "invalid", "failed"]
+    error: Optional[str] = Field(None, description="실패 사유")
+
+
 class UpdateSegmentsResponse(BaseModel):
     """세그먼트 일괄 업데이트 응답 모델"""
 
     success: bool = Field(..., description="성공 여부")
     message: Optional[str] = Field(None, description="응답 메시지")
     updated_count: int = Field(..., description="업데이트된 세그먼트 수")
+    results: List[SegmentUpdateResult] = Field(
+        default_factory=list, description="세그먼트별 결과 (요청 순서)"
+    )
+
+
+class ProjectTranslateRequest(BaseModel):
+    """프로젝트 언어 전체 번역 요청 모델"""
+
+    src_lang: Optional[str] = Field(None, description="소스 언어 (없으면 프로젝트 설정)")
+
+
+class ProjectTranslateResponse(BaseModel):
+    """프로젝트 언어 전체 번역 접수 응답 (진행은 progress 이벤트로 전달)"""
+
+    project_id: str
+    language_code: str
+    status: Literal["queued"]
+    total_segments: int = Field(..., description="번역 대상 세그먼트 수")
+    chunk_count: int = Field(..., description="LLM 배치 호출 수")
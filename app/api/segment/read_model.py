@@ -0,0 +1,600 @@
+"""
+에디터 세그먼트 read model (editor_segments)
+
+(프로젝트, 언어)별로 project_segments + segment_translations + issues +
+speaker_voices의 voice_replacement를 합친 문서를 세그먼트마다 하나씩 저장합니다.
+에디터 조회는 (project_id, language_code, segment_index) 인덱스 한 번으로 끝납니다.
+
+- 문서 _id = segment_translations의 _id
+- projects.editor_read_model.{language_code} = EDITOR_READ_MODEL_VERSION 이면 사용 가능
+- 쓰기 경로는 refresh_* 함수로 바뀐 세그먼트만 원본에서 다시 계산해 반영
+- 반영에 실패하면 해당 언어를 stale로 표시하고, 다음 조회는 원본 조인으로
+  응답하면서 백그라운드에서 전체 재구성
+- 증분 반영은 projects.editor_read_model_generation을 올립니다. 전체 재구성은
+  시작 시점의 값이 그대로일 때만 사용 가능으로 표시하고, 바뀌었으면 다시 수행
+  (재구성 중 이미 복사한 배치에 들어온 편집이 사라지지 않도록)
+
+실행:
+    python -m app.api.segment.read_model rebuild --project <id> [--language en]
+    python -m app.api.segment.read_model rebuild            # 전체 프로젝트
+    python -m app.api.segment.read_model check --project <id> [--language en] [--repair]
+"""
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import DeleteMany, ReplaceOne, ReturnDocument
+
+from app.utils.ids import to_ref, try_object_id
+
+logger = logging.getLogger(__name__)
+
+EDITOR_SEGMENTS_COLLECTION = "editor_segments"
+EDITOR_READ_MODEL_VERSION = 1
+# projects 문서에 언어별 read model 버전을 기록하는 필드
+EDITOR_MODEL_FIELD = "editor_read_model"
+# 증분 반영/무효화마다 올리는 프로젝트 단위 카운터
+EDITOR_GENERATION_FIELD = "editor_read_model_generation"
+REBUILD_BATCH_SIZE = 500
+# 재구성 중 편집이 계속 들어오면 이 횟수만큼만 다시 시도 (이후는 stale 유지)
+REBUILD_MAX_ATTEMPTS = 3
+
+EDITOR_SEGMENT_PROJECTION = {
+    "project_id": 1,
+    "segment_index": 1,
+    "speaker_tag": 1,
+    "start": 1,
+    "end": 1,
+    "source_text": 1,
+}
+EDITOR_TRANSLATION_PROJECTION = {
+    "segment_id": 1,
+    "language_code": 1,
+    "speaker_tag": 1,
+    "start": 1,
+    "end": 1,
+    "target_text": 1,
+    "segment_audio_url": 1,
+    "playback_rate": 1,
+}
+EDITOR_ISSUE_PROJECTION = {
+    "segment_translation_id": 1,
+    "issue_type": 1,
+    "severity": 1,
+    "score": 1,
+    "diff": 1,
+    "details": 1,
+    "resolved": 1,
+}
+
+_rebuilding: Dict[Tuple[str, str], asyncio.Task] = {}
+
+
+# ----------------------------------------------------------------------
+# 조인 (원본 조회 경로와 read model이 같은 로직을 사용)
+# ----------------------------------------------------------------------
+def voice_replacements_by_speaker(
+    speaker_voices: Optional[Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """speaker_voices[language_code]에서 speaker_tag별 voice_replacement 추출"""
+    replacements = {}
+    for speaker_tag, voice_info in (speaker_voices or {}).items():
+        if isinstance(voice_info, dict) and "replace_voice" in voice_info:
+            replace_voice = voice_info["replace_voice"]
+            if isinstance(replace_voice, dict) and "voice_sample_id" in replace_voice:
+                replacements[speaker_tag] = {
+                    "voice_sample_id": replace_voice["voice_sample_id"],
+                    "similarity": replace_voice.get("similarity"),
+                    "sample_key": replace_voice.get("sample_key"),
+                }
+    return replacements
+
+
+def compose_editor_segments(
+    segments: Iterable[Dict[str, Any]],
+    translations: Iterable[Dict[str, Any]],
+    issues: Iterable[Dict[str, Any]],
+    voice_replacements: Dict[str, Dict[str, Any]],
+    language_code: str,
+) -> List[Dict[str, Any]]:
+    """세그먼트 + 번역 + 이슈 + voice_replacement 병합 (SegmentTranslationResponse 형태)"""
+    translation_map = {doc["segment_id"]: doc for doc in translations}
+
+    # 이슈를 segment_translation_id로 그룹화
+    issues_by_translation_id: Dict[str, list] = {}
+    for issue in issues:
+        issues_by_translation_id.setdefault(
+            issue.get("segment_translation_id"), []
+        ).append(issue)
+
+    result = []
+    for seg in segments:
+        translation_data = translation_map.get(str(seg["_id"]))
+
+        # translation_data가 있는 세그먼트만 반환 (해당 언어에 번역이 있는 경우만)
+        if not translation_data:
+            continue
+
+        # project_segments 값을 기본으로, segment_translations의 편집값을 우선 사용
+        translation_id = translation_data["_id"]
+        merged = {
+            **seg,
+            **translation_data,
+            "id": seg["_id"],
+            "translation_id": translation_id,
+            "project_id": seg["project_id"],
+            "language_code": language_code,
+            "issues": issues_by_translation_id.get(str(translation_id), []),
+        }
+
+        # voice_replacement 정보 추가
+        speaker_tag = seg.get("speaker_tag")
+        if speaker_tag in voice_replacements:
+            merged["voice_replacement"] = voice_replacements[speaker_tag]
+
+        result.append(merged)
+    return result
+
+
+def to_editor_document(merged: Dict[str, Any]) -> Dict[str, Any]:
+    """병합 결과 → editor_segments 문서"""
+    doc = {key: value for key, value in merged.items() if key not in ("id", "translation_id")}
+    doc["_id"] = merged["translation_id"]
+    doc["segment_id"] = str(merged["id"])
+    doc["project_id"] = to_ref(merged["project_id"])
+    doc["model_version"] = EDITOR_READ_MODEL_VERSION
+    return doc
+
+
+def from_editor_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """editor_segments 문서 → SegmentTranslationResponse 형태"""
+    return {**doc, "id": doc["segment_id"], "translation_id": doc["_id"]}
+
+
+async def _load_sources(
+    db: AsyncIOMotorDatabase,
+    project_ref: str,
+    languages: List[str],
+    segment_oids: Optional[List[ObjectId]] = None,
+    after: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """원본 컬렉션에서 세그먼트/언어별 번역/이슈 조회"""
+    segment_query: Dict[str, Any] = {"project_id": project_ref}
+    if segment_oids is not None:
+        segment_query["_id"] = {"$in": segment_oids}
+    if after is not None:
+        segment_query["segment_index"] = {"$gt": after}
+    cursor = db["project_segments"].find(segment_query, EDITOR_SEGMENT_PROJECTION).sort(
+        "segment_index", 1
+    )
+    if limit:
+        cursor = cursor.limit(limit)
+    segments = await cursor.to_list(None)
+    if not segments:
+        return [], {}, []
+
+    translations = await db["segment_translations"].find(
+        {
+            "segment_id": {"$in": [str(seg["_id"]) for seg in segments]},
+            "language_code": {"$in": languages},
+        },
+        EDITOR_TRANSLATION_PROJECTION,
+    ).to_list(None)
+    issues = []
+    if translations:
+        issues = await db["issues"].find(
+            {"segment_translation_id": {"$in": [str(doc["_id"]) for doc in translations]}},
+            EDITOR_ISSUE_PROJECTION,
+        ).to_list(None)
+
+    translations_by_language: Dict[str, List[Dict[str, Any]]] = {}
+    for doc in translations:
+        translations_by_language.setdefault(doc["language_code"], []).append(doc)
+    return segments, translations_by_language, issues
+
+
+async def _load_project_state(
+    db: AsyncIOMotorDatabase, project_oid: ObjectId, bump: bool = False
+) -> Dict[str, Any]:
+    """speaker_voices/read model 상태 조회 (bump=True면 generation을 올리면서 조회)"""
+    projection = {"speaker_voices": 1, EDITOR_MODEL_FIELD: 1, EDITOR_GENERATION_FIELD: 1}
+    if bump:
+        project = await db["projects"].find_one_and_update(
+            {"_id": project_oid},
+            {"$inc": {EDITOR_GENERATION_FIELD: 1}},
+            projection=projection,
+            return_document=ReturnDocument.AFTER,
+        )
+    else:
+        project = await db["projects"].find_one({"_id": project_oid}, projection)
+    return project or {}
+
+
+# ----------------------------------------------------------------------
+# 전체 재구성
+# ----------------------------------------------------------------------
+async def _set_language_state(
+    db: AsyncIOMotorDatabase, project_oid: ObjectId, language_code: str, built: bool
+) -> None:
+    key = f"{EDITOR_MODEL_FIELD}.{language_code}"
+    update = (
+        {"$set": {key: EDITOR_READ_MODEL_VERSION}} if built else {"$unset": {key: ""}}
+    )
+    await db["projects"].update_one({"_id": project_oid}, update)
+
+
+async def rebuild_editor_language(
+    db: AsyncIOMotorDatabase, project_id: str, language_code: str
+) -> int:
+    """(프로젝트, 언어) read model을 원본에서 다시 만들고 저장한 문서 수를 반환"""
+    project_oid = try_object_id(project_id)
+    if project_oid is None:
+        return 0
+    project_ref = str(project_oid)
+
+    for attempt in range(1, REBUILD_MAX_ATTEMPTS + 1):
+        # 재구성 중에는 조회가 원본 조인을 사용하도록 먼저 stale 표시
+        await _set_language_state(db, project_oid, language_code, built=False)
+        project = await _load_project_state(db, project_oid)
+        generation = project.get(EDITOR_GENERATION_FIELD)
+        count = await _copy_editor_language(db, project_ref, language_code, project)
+
+        # 복사하는 동안 증분 반영이 없었을 때만 사용 가능으로 표시
+        result = await db["projects"].update_one(
+            {"_id": project_oid, EDITOR_GENERATION_FIELD: generation},
+            {"$set": {f"{EDITOR_MODEL_FIELD}.{language_code}": EDITOR_READ_MODEL_VERSION}},
+        )
+        if result.matched_count:
+            logger.info(
+                f"Editor read model rebuilt: project={project_ref} "
+                f"lang={language_code} docs={count}"
+            )
+            return count
+        logger.info(
+            f"Editor read model changed during rebuild, retrying: project={project_ref} "
+            f"lang={language_code} attempt={attempt}"
+        )
+
+    logger.warning(
+        f"Editor read model left stale after {REBUILD_MAX_ATTEMPTS} attempts: "
+        f"project={project_ref} lang={language_code}"
+    )
+    return count
+
+
+async def _copy_editor_language(
+    db: AsyncIOMotorDatabase,
+    project_ref: str,
+    language_code: str,
+    project: Dict[str, Any],
+) -> int:
+    """원본을 배치로 읽어 editor_segments에 저장하고, 사라진 세그먼트 문서 제거"""
+    collection = db[EDITOR_SEGMENTS_COLLECTION]
+    replacements = voice_replacements_by_speaker(
+        (project.get("speaker_voices") or {}).get(language_code)
+    )
+
+    kept: List[ObjectId] = []
+    after = None
+    while True:
+        segments, translations, issues = await _load_sources(
+            db, project_ref, [language_code], after=after, limit=REBUILD_BATCH_SIZE
+        )
+        if not segments:
+            break
+        docs = [
+            to_editor_document(merged)
+            for merged in compose_editor_segments(
+                segments,
+                translations.get(language_code, []),
+                issues,
+                replacements,
+                language_code,
+            )
+        ]
+        if docs:
+            await collection.bulk_write(
+                [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs],
+                ordered=False,
+            )
+            kept.extend(doc["_id"] for doc in docs)
+        after = segments[-1].get("segment_index")
+        if after is None or len(segments) < REBUILD_BATCH_SIZE:
+            break
+
+    await collection.delete_many(
+        {"project_id": project_ref, "language_code": language_code, "_id": {"$nin": kept}}
+    )
+    return len(kept)
+
+
+async def _project_languages(db: AsyncIOMotorDatabase, project_ref: str) -> List[str]:
+    return await db["project_targets"].distinct(
+        "language_code", {"project_id": project_ref}
+    )
+
+
+async def rebuild_editor_project(db: AsyncIOMotorDatabase, project_id: str) -> Dict[str, int]:
+    project_ref = to_ref(project_id)
+    return {
+        language_code: await rebuild_editor_language(db, project_ref, language_code)
+        for language_code in await _project_languages(db, project_ref)
+    }
+
+
+def schedule_editor_rebuild(
+    db: AsyncIOMotorDatabase, project_id: str, language_code: str
+) -> None:
+    """조회 경로에서 read model이 없을 때 백그라운드 재구성 (중복 실행 방지)"""
+    key = (to_ref(project_id), language_code)
+    task = _rebuilding.get(key)
+    if task is not None and not task.done():
+        return
+
+    async def _run() -> None:
+        try:
+            await rebuild_editor_language(db, key[0], language_code)
+        except Exception as exc:
+            logger.error(f"Editor read model rebuild failed for {key}: {exc}")
+
+    task = asyncio.create_task(_run(), name=f"editor-rebuild:{key[0]}:{language_code}")
+    _rebuilding[key] = task
+    task.add_done_callback(lambda _: _rebuilding.pop(key, None))
+
+
+# ----------------------------------------------------------------------
+# 쓰기 경로용 증분 반영
+# ----------------------------------------------------------------------
+async def refresh_editor_segments(
+    db: AsyncIOMotorDatabase,
+    project_id: Any,
+    segment_ids: Iterable[Any],
+    language_code: Optional[str] = None,
+) -> None:
+    """
+    세그먼트 단위 증분 반영 (language_code가 없으면 구성된 모든 언어)
+
+    원본에서 사라진 세그먼트/번역의 문서는 삭제합니다. 실패해도 쓰기 요청은
+    실패시키지 않고 해당 언어를 stale로 표시합니다.
+    """
+    project_oid = try_object_id(project_id)
+    segment_oids = [oid for oid in map(try_object_id, segment_ids) if oid is not None]
+    if project_oid is None or not segment_oids:
+        return
+
+    # 진행 중인 전체 재구성이 이 변경을 놓치지 않도록 generation을 먼저 올림
+    project = await _load_project_state(db, project_oid, bump=True)
+    built = {
+        lang
+        for lang, version in (project.get(EDITOR_MODEL_FIELD) or {}).items()
+        if version == EDITOR_READ_MODEL_VERSION
+    }
+    # 아직 구성되지 않았거나 재구성 중인 언어는 재구성이 원본을 다시 읽으므로 건너뜀
+    languages = sorted(built & {language_code}) if language_code else sorted(built)
+    if not languages:
+        return
+
+    try:
+        segments, translations, issues = await _load_sources(
+            db, str(project_oid), languages, segment_oids=segment_oids
+        )
+        operations: list = []
+        speaker_voices = project.get("speaker_voices") or {}
+        for lang in languages:
+            docs = [
+                to_editor_document(merged)
+                for merged in compose_editor_segments(
+                    segments,
+                    translations.get(lang, []),
+                    issues,
+                    voice_replacements_by_speaker(speaker_voices.get(lang)),
+                    lang,
+                )
+            ]
+            operations.extend(
+                ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs
+            )
+            operations.append(
+                DeleteMany(
+                    {
+                        "project_id": str(project_oid),
+                        "language_code": lang,
+                        "segment_id": {"$in": [str(oid) for oid in segment_oids]},
+                        "_id": {"$nin": [doc["_id"] for doc in docs]},
+                    }
+                )
+            )
+        await db[EDITOR_SEGMENTS_COLLECTION].bulk_write(operations, ordered=False)
+    except Exception as exc:
+        logger.error(
+            f"Editor read model refresh failed (project={project_oid}, langs={languages}): {exc}"
+        )
+        for lang in languages:
+            await _set_language_state(db, project_oid, lang, built=False)
+
+
+async def refresh_editor_translations(
+    db: AsyncIOMotorDatabase, translation_ids: Iterable[Any]
+) -> None:
+    """번역 ID 기준 증분 반영 (이슈/번역 변경)"""
+    translation_oids = [
+        oid for oid in map(try_object_id, translation_ids) if oid is not None
+    ]
+    if not translation_oids:
+        return
+    translations = await db["segment_translations"].find(
+        {"_id": {"$in": translation_oids}}, {"segment_id": 1, "language_code": 1}
+    ).to_list(None)
+    segment_oids = [try_object_id(doc.get("segment_id")) for doc in translations]
+    segments = await db["project_segments"].find(
+        {"_id": {"$in": [oid for oid in segment_oids if oid is not None]}},
+        {"project_id": 1},
+    ).to_list(None)
+    project_by_segment = {str(seg["_id"]): seg.get("project_id") for seg in segments}
+
+    grouped: Dict[Tuple[str, str], Set[str]] = {}
+    for doc in translations:
+        project_ref = project_by_segment.get(doc.get("segment_id"))
+        if project_ref:
+            grouped.setdefault((project_ref, doc["language_code"]), set()).add(
+                doc["segment_id"]
+            )
+    for (project_ref, language_code), segment_ids in grouped.items():
+        await refresh_editor_segments(db, project_ref, segment_ids, language_code)
+
+
+async def invalidate_editor_project(db: AsyncIOMotorDatabase, project_id: Any) -> None:
+    """프로젝트 전체 언어를 stale로 표시 (다음 조회 시 재구성)"""
+    project_oid = try_object_id(project_id)
+    if project_oid is not None:
+        await db["projects"].update_one(
+            {"_id": project_oid},
+            {"$unset": {EDITOR_MODEL_FIELD: ""}, "$inc": {EDITOR_GENERATION_FIELD: 1}},
+        )
+
+
+async def sync_editor_voice_replacements(
+    db: AsyncIOMotorDatabase, project_id: str, speaker_voices: Dict[str, Any]
+) -> None:
+    """speaker_voices 변경을 voice_replacement 필드에 반영"""
+    project_ref = to_ref(project_id)
+    collection = db[EDITOR_SEGMENTS_COLLECTION]
+    for language_code, voices in (speaker_voices or {}).items():
+        replacements = voice_replacements_by_speaker(voices)
+        base = {"project_id": project_ref, "language_code": language_code}
+        for speaker_tag, replacement in replacements.items():
+            await collection.update_many(
+                {**base, "speaker_tag": speaker_tag},
+                {"$set": {"voice_replacement": replacement}},
+            )
+        await collection.update_many(
+            {
+                **base,
+                "speaker_tag": {"$nin": list(replacements)},
+                "voice_replacement": {"$exists": True},
+            },
+            {"$unset": {"voice_replacement": ""}},
+        )
+
+
+# ----------------------------------------------------------------------
+# 정합성 검사
+# ----------------------------------------------------------------------
+@dataclass
+class EditorConsistencyReport:
+    project_id: str
+    language_code: str
+    built: bool = False
+    checked: int = 0
+    missing: List[str] = field(default_factory=list)  # 원본에는 있으나 read model에 없음
+    stale: List[str] = field(default_factory=list)  # 내용이 다름
+    orphaned: List[str] = field(default_factory=list)  # 원본에 없는 문서
+
+    @property
+    def consistent(self) -> bool:
+        return self.built and not (self.missing or self.stale or self.orphaned)
+
+
+async def check_editor_read_model(
+    db: AsyncIOMotorDatabase, project_id: str, language_code: str
+) -> EditorConsistencyReport:
+    """원본 조인 결과와 저장된 read model을 문서 단위로 비교"""
+    project_oid = try_object_id(project_id)
+    report = EditorConsistencyReport(str(project_oid or project_id), language_code)
+    if project_oid is None:
+        return report
+    project_ref = str(project_oid)
+    project = await _load_project_state(db, project_oid)
+    report.built = (project.get(EDITOR_MODEL_FIELD) or {}).get(
+        language_code
+    ) == EDITOR_READ_MODEL_VERSION
+    replacements = voice_replacements_by_speaker(
+        (project.get("speaker_voices") or {}).get(language_code)
+    )
+
+    stored = {
+        doc["_id"]: doc
+        async for doc in db[EDITOR_SEGMENTS_COLLECTION].find(
+            {"project_id": project_ref, "language_code": language_code}
+        )
+    }
+    after = None
+    while True:
+        segments, translations, issues = await _load_sources(
+            db, project_ref, [language_code], after=after, limit=REBUILD_BATCH_SIZE
+        )
+        if not segments:
+            break
+        for merged in compose_editor_segments(
+            segments,
+            translations.get(language_code, []),
+            issues,
+            replacements,
+            language_code,
+        ):
+            expected = to_editor_document(merged)
+            actual = stored.pop(expected["_id"], None)
+            report.checked += 1
+            if actual is None:
+                report.missing.append(expected["segment_id"])
+            elif actual != expected:
+                report.stale.append(expected["segment_id"])
+        after = segments[-1].get("segment_index")
+        if after is None or len(segments) < REBUILD_BATCH_SIZE:
+            break
+    report.orphaned = [doc.get("segment_id") for doc in stored.values()]
+    return report
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from app.config.db import database
+
+    if args.command == "rebuild":
+        if args.project and args.language:
+            count = await rebuild_editor_language(database, args.project, args.language)
+            print(f"{args.project}/{args.language}: {count}")
+            return
+        if args.project:
+            project_ids = [args.project]
+        else:
+            project_ids = [
+                str(doc["_id"]) async for doc in database["projects"].find({}, {"_id": 1})
+            ]
+        for project_id in project_ids:
+            print(f"{project_id}: {await rebuild_editor_project(database, project_id)}")
+        return
+
+    languages = (
+        [args.language]
+        if args.language
+        else await _project_languages(database, to_ref(args.project))
+    )
+    for language_code in languages:
+        report = await check_editor_read_model(database, args.project, language_code)
+        print(
+            f"{args.project}/{language_code}: built={report.built} "
+            f"checked={report.checked} missing={len(report.missing)} "
+            f"stale={len(report.stale)} orphaned={len(report.orphaned)}"
+        )
+        if args.repair and not report.consistent:
+            count = await rebuild_editor_language(database, args.project, language_code)
+            print(f"  rebuilt: {count}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="에디터 read model 재구성/정합성 검사")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--project")
+    parser.add_argument("--language")
+    parser.add_argument("--repair", action="store_true")
+    args = parser.parse_args()
+    if args.command == "check" and not args.project:
+        parser.error("check requires --project")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(args))
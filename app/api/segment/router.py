@@ -14,10 +14,13 @@ from .model import (
     MergeSegmentResponse,
     UpdateSegmentsRequest,
     UpdateSegmentsResponse,
+    ProjectTranslateRequest,
+    ProjectTranslateResponse,
 )
 from typing import List
 from ..deps import DbDep
 from ..jobs.service import start_segment_tts_job
+from .bulk_translate import start_project_translation
 
 segment_router = APIRouter(prefix="/segment", tags=["segment"])
 editor_segment_router = APIRouter(prefix="/editor/projects", tags=["segment"])
@@ -187,13 +190,38 @@ async def update_segments_bulk(
     - **target_text**: 번역 텍스트
 
     Returns:
-        업데이트 결과 (성공 여부, 메시지, 업데이트된 세그먼트 수)
+        업데이트 결과 (성공 여부, 메시지, 업데이트된 세그먼트 수, 세그먼트별 결과)
 
     Notes:
-        - project_segments 컬렉션: start, end, speaker_tag, source_text 업데이트
-        - segment_translations 컬렉션: target_text, playback_rate 업데이트
+        - project_segments 컬렉션: source_text 업데이트
+        - segment_translations 컬렉션: speaker_tag, start, end, target_text, playback_rate 업데이트
         - 제공된 필드만 업데이트됩니다 (null/undefined 필드는 무시)
+        - 값이 실제로 바뀐 필드만 컬렉션별 bulk_write 한 번으로 저장됩니다
+        - 세그먼트별 status: updated / unchanged / not_found / invalid / failed
     """
     return await service.update_segments_bulk(
         project_id, language_code, payload.segments
     )
+
+
+@project_segment_router.post(
+    "/{project_id}/languages/{language_code}/translate",
+    response_model=ProjectTranslateResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def translate_project_language(
+    project_id: str,
+    language_code: str,
+    db: DbDep,
+    payload: ProjectTranslateRequest | None = None,
+):
+    """
+    프로젝트의 모든 세그먼트를 해당 언어로 번역합니다.
+
+    세그먼트를 토큰 예산 단위 청크로 묶어 동시에 배치 번역하고 결과를 한 번에 저장합니다.
+    진행 상황은 progress 이벤트(event: bulk-translation)로 전달됩니다.
+    같은 (프로젝트, 언어) 번역이 진행 중이면 409를 반환합니다.
+    """
+    return await start_project_translation(
+        db, project_id, language_code, src_lang=payload.src_lang if payload else None
+    )
@@ -6,7 +6,11 @@ from fastapi import APIRouter, Query, HTTPException, Body
 from typing import Optional, List
 from bson import ObjectId
 from ..deps import DbDep
-from .service import SegmentService
+from .service import (
+    SEGMENT_PAGE_DEFAULT_LIMIT,
+    SEGMENT_PAGE_MAX_LIMIT,
+    SegmentService,
+)
 from .translate_service import translate_single_segment
 from .model import TranslateSegmentRequest
 import logging
@@ -108,6 +112,49 @@ async def get_segments_with_translations(
     )
 
 
+@segments_router.get("/project/{project_id}/page")
+async def get_segment_page(
+    project_id: str,
+    db: DbDep,
+    language_code: Optional[str] = Query(None, description="언어 코드 필터"),
+    after: Optional[int] = Query(
+        None, ge=-1, description="이전 페이지의 next_cursor (segment_index)"
+    ),
+    limit: int = Query(
+        SEGMENT_PAGE_DEFAULT_LIMIT, ge=1, le=SEGMENT_PAGE_MAX_LIMIT
+    ),
+    start: Optional[float] = Query(
+        None, ge=0, description="구간 시작(초) - 이 시각 이후에 끝나는 세그먼트"
+    ),
+    end: Optional[float] = Query(
+        None, ge=0, description="구간 끝(초) - 이 시각 이전에 시작하는 세그먼트"
+    ),
+) -> dict:
+    """
+    세그먼트 keyset 페이지 조회 (번역 포함)
+
+    - **after**: 이 segment_index 다음부터 조회 (첫 페이지는 생략)
+    - **start/end**: 타임라인 구간 [start, end]와 겹치는 세그먼트만 조회
+    - 다음 페이지가 있으면 `next_cursor`를 `after`로 전달
+
+    반환 형식:
+    ```json
+    {"items": [...], "next_cursor": 99, "has_more": true}
+    ```
+    """
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+    service = SegmentService(db)
+    return await service.get_segment_page(
+        project_id,
+        language_code,
+        after=after,
+        limit=limit,
+        window_start=start,
+        window_end=end,
+    )
+
+
 @segments_router.get("/project/{project_id}/languages")
 async def get_translation_languages(project_id: str, db: DbDep) -> List[str]:
     """프로젝트에서 사용된 번역 언어 목록 조회"""
@@ -221,15 +268,20 @@ async def translate_segment(
 
     # 프로젝트에서 소스 언어 가져오기 (src_lang이 제공되지 않은 경우)
     src_lang = request.src_lang
-    if not src_lang and project_id:
+    use_memory = True
+    if project_id:
         try:
             # project_id가 문자열이면 ObjectId로 변환
             project_oid = (
                 ObjectId(project_id) if isinstance(project_id, str) else project_id
             )
-            project = await db["projects"].find_one({"_id": project_oid})
+            project = await db["projects"].find_one(
+                {"_id": project_oid},
+                {"source_language": 1, "use_translation_memory": 1},
+            )
             if project:
-                src_lang = project.get("source_language")
+                src_lang = src_lang or project.get("source_language")
+                use_memory = project.get("use_translation_memory", True)
         except Exception as e:
             logger.warning(f"Failed to get source language from project: {e}")
 
@@ -238,11 +290,13 @@ async def translate_segment(
         logger.info(
             f"Translating segment {segment_id}: source_text={source_text[:50]}..., target_lang={request.target_lang}, src_lang={src_lang}"
         )
-        translation_result = translate_single_segment(
+        translation_result = await translate_single_segment(
             source_text=source_text,
             segment_index=segment_index,
             target_lang=request.target_lang,
             src_lang=src_lang,
+            db=db,
+            use_memory=use_memory,
         )
         logger.info(f"Translation result: {translation_result}")
 
@@ -9,13 +9,32 @@ import logging
 import asyncio
 import os
 
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
 from ..deps import DbDep
+from ..repositories import ProjectSegmentRepository, SegmentTranslationRepository
+from .service import build_segment_range_query
+from .read_model import (
+    EDITOR_ISSUE_PROJECTION,
+    EDITOR_MODEL_FIELD,
+    EDITOR_READ_MODEL_VERSION,
+    EDITOR_SEGMENT_PROJECTION,
+    EDITOR_SEGMENTS_COLLECTION,
+    EDITOR_TRANSLATION_PROJECTION,
+    compose_editor_segments,
+    from_editor_document,
+    refresh_editor_segments,
+    schedule_editor_rebuild,
+    voice_replacements_by_speaker,
+)
 from .model import (
     ResponseSegment,
     RequestSegment,
     SegmentSplitResponseItem,
     MergeSegmentResponse,
     SegmentUpdateData,
+    SegmentUpdateResult,
     UpdateSegmentsResponse,
 )
 from ..project.models import (
@@ -33,6 +52,14 @@ from app.utils.audio import (
 logger = logging.getLogger(__name__)
 AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET", "dupilot-dev-media")
 
+# 에디터가 렌더링하는 필드만 조회
+EDITOR_PROJECT_FIELDS = (
+    "duration_seconds",
+    "video_source",
+    "audio_source",
+    "background_audio_source",
+)
+
 
 class SegmentService:
     def __init__(self, db: DbDep):
@@ -49,6 +76,9 @@ class SegmentService:
             "video_source": 1,
         }
         self.translation_collection = db.get_collection("segment_translations")
+        # 참조 ID를 문자열로 정규화해서 쓰는 리포지토리
+        self.segment_repository = ProjectSegmentRepository(db)
+        self.translation_repository = SegmentTranslationRepository(db)
 
     async def test_save_segment(self, request: RequestSegment, db_name: str):
         project_oid = ObjectId(request.project_id)
@@ -58,16 +88,12 @@ class SegmentService:
         result = await collection.insert_one(doc)
         return str(result.inserted_id)
 
-    async def delete_segments_by_project(self, project_id: ObjectId) -> int:
-        result = await self.segment_collection.delete_many({"project_id": project_id})
-        return result.deleted_count
-
     async def insert_segments_from_metadata(
         self,
         project_id: str | ObjectId,
         segments_meta: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
-        project_oid = self._as_object_id(str(project_id))
+        project_ref = str(self._as_object_id(str(project_id)))
         now = datetime.now()
         docs: list[dict[str, Any]] = []
 
@@ -75,7 +101,7 @@ class SegmentService:
             normalized = self._normalize_segment_for_store(raw or {}, index=index)
             normalized.update(
                 {
-                    "project_id": project_oid,
+                    "project_id": project_ref,
                     "segment_index": index,
                     "created_at": now,
                     "updated_at": now,
@@ -84,7 +110,7 @@ class SegmentService:
             docs.append(normalized)
 
         if docs:
-            await self.segment_collection.insert_many(docs)
+            await self.segment_repository.insert_many(docs)
 
         return docs
 
@@ -137,7 +163,7 @@ class SegmentService:
     ) -> Tuple[Dict[str, Any], Dict[str, Any], int, ObjectId]:
         project, object_id = await self._load_project(project_id)
 
-        segment = await self.segment_collection.find_one(
+        segment = await self.segment_repository.find_one(
             {"segment_id": ObjectId(segment_id), "project_id": object_id}
         )
 
@@ -214,94 +240,177 @@ class SegmentService:
         project_id: str,
         language_code: str,
     ) -> list[SegmentTranslationResponse]:
-        # project_oid = ObjectId(project_id)
-        segments = await self.segment_collection.find(
-            {"project_id": project_id}
-        ).to_list(None)
-
-        print("segments:", segments)
+        state = await self.get_editor_state(project_id, language_code)
+        return [
+            SegmentTranslationResponse.model_validate(segment)
+            for segment in state["segments"]
+        ]
 
-        if not segments:
-            return []
+    async def get_editor_state(
+        self,
+        project_id: str,
+        language_code: str,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        window_start: Optional[float] = None,
+        window_end: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """
+        에디터 화면 상태 조회 (EditorStateResponse 형태의 dict)
 
-        # segment_id는 문자열로 저장되어 있으므로 문자열 배열로 만들기
-        segment_ids = [str(seg["_id"]) for seg in segments]
-        translations = await self.translation_collection.find(
-            {"segment_id": {"$in": segment_ids}, "language_code": language_code}
-        ).to_list(None)
+        editor_segments read model(segment/read_model.py)이 구성된 언어는
+        프로젝트 조회와 read model 조회 두 번을 동시에 실행해 응답합니다.
+        아직 구성되지 않았거나 stale이면 원본 컬렉션을 조인해 응답하고
+        백그라운드에서 read model을 다시 만듭니다.
 
-        print("translations:", translations)
+        after/limit(keyset) 또는 window_start/window_end(타임라인 구간)를 주면
+        해당 범위의 세그먼트만 조회합니다.
+        """
+        project_oid = self._as_object_id(project_id)
+        project_projection = {field: 1 for field in EDITOR_PROJECT_FIELDS}
+        project_projection[f"{EDITOR_MODEL_FIELD}.{language_code}"] = 1
 
-        # translation_map의 키도 문자열로
-        translation_map = {doc["segment_id"]: doc for doc in translations}
+        editor_query = build_segment_range_query(
+            str(project_oid), after, window_start, window_end
+        )
+        editor_query["language_code"] = language_code
+        editor_cursor = (
+            self.db[EDITOR_SEGMENTS_COLLECTION].find(editor_query).sort("segment_index", 1)
+        )
+        if limit:
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+            editor_cursor = editor_cursor.limit(limit + 1)
 
-        # 프로젝트에서 speaker_voices 가져오기
-        project = await self.collection.find_one(
-            {"_id": ObjectId(project_id)}, {"speaker_voices": 1}
+        project, editor_docs = await asyncio.gather(
+            self.collection.find_one({"_id": project_oid}, project_projection),
+            editor_cursor.to_list(None),
         )
+        if not project:
+            raise HTTPException(status_code=404, detail="project not found")
 
-        # voice_replacement 정보를 speaker_tag별로 매핑
-        voice_replacements_by_speaker = {}
-        if project and project.get("speaker_voices"):
-            speaker_voices = project["speaker_voices"].get(language_code, {})
-            for speaker_tag, voice_info in speaker_voices.items():
-                if isinstance(voice_info, dict) and "replace_voice" in voice_info:
-                    replace_voice = voice_info["replace_voice"]
-                    if (
-                        isinstance(replace_voice, dict)
-                        and "voice_sample_id" in replace_voice
-                    ):
-                        voice_replacements_by_speaker[speaker_tag] = {
-                            "voice_sample_id": replace_voice["voice_sample_id"],
-                            "similarity": replace_voice.get("similarity"),
-                            "sample_key": replace_voice.get("sample_key"),
-                        }
-
-        result = []
-        for seg in segments:
-            segment_id_str = str(seg["_id"])  # 문자열로 변환
-            translation_data = translation_map.get(segment_id_str)
-
-            # translation_data가 있는 세그먼트만 반환 (해당 언어에 번역이 있는 경우만)
-            if not translation_data:
-                continue
+        built = (project.get(EDITOR_MODEL_FIELD) or {}).get(language_code)
+        if built == EDITOR_READ_MODEL_VERSION:
+            segments = [from_editor_document(doc) for doc in editor_docs]
+            next_cursor = None
+            if limit and len(segments) > limit:
+                segments = segments[:limit]
+                next_cursor = segments[-1].get("segment_index")
+        else:
+            schedule_editor_rebuild(self.db, str(project_oid), language_code)
+            segments, next_cursor = await self._join_editor_segments(
+                project_id, language_code, after, limit, window_start, window_end
+            )
 
-            # segment_translations의 편집된 값을 우선 사용하도록 순서 설정
-            # seg(project_segments)를 먼저, 그 다음 translation_data를 병합하여
-            # translation_data의 값이 있으면 우선, 없으면 project_segments 사용
-            merged = {
-                "id": seg["_id"],
-                "translation_id": translation_data.get(
-                    "_id"
-                ),  # segment_translations의 _id
-                **seg,  # project_segments 데이터 (기본값)
-                **translation_data,  # segment_translations 데이터 (편집값 우선)
-                "language_code": language_code,
-            }
+        return {
+            "project_id": project_id,
+            "segments": segments,
+            "next_cursor": next_cursor,
+            "playback": {
+                "duration": project.get("duration_seconds") or 0,
+                "active_language": language_code,
+                "playback_rate": 1.0,
+                "video_source": project.get("video_source"),
+                "audio_source": project.get("audio_source"),
+                "background_audio_source": project.get("background_audio_source"),
+            },
+        }
 
-            # voice_replacement 정보 추가
-            speaker_tag = seg.get("speaker_tag")
-            if speaker_tag and speaker_tag in voice_replacements_by_speaker:
-                merged["voice_replacement"] = voice_replacements_by_speaker[speaker_tag]
+    async def _join_editor_segments(
+        self,
+        project_id: str,
+        language_code: str,
+        after: Optional[int],
+        limit: Optional[int],
+        window_start: Optional[float],
+        window_end: Optional[float],
+    ) -> Tuple[list[dict[str, Any]], Optional[int]]:
+        """
+        원본 컬렉션 조인으로 에디터 세그먼트 조회 (read model이 없을 때)
 
-            result.append(SegmentTranslationResponse(**merged))
+        서로 독립적인 speaker_voices/세그먼트/이슈 조회는 동시에 실행하고,
+        번역은 세그먼트 ID로 한 번에 조회합니다.
+        """
+        segment_cursor = self.segment_collection.find(
+            build_segment_range_query(project_id, after, window_start, window_end),
+            EDITOR_SEGMENT_PROJECTION,
+        ).sort("segment_index", 1)
+        if limit:
+            segment_cursor = segment_cursor.limit(limit + 1)
+
+        ranged = limit is not None or window_start is not None or window_end is not None
+        reads = [
+            self.collection.find_one(
+                {"_id": self._as_object_id(project_id)},
+                {f"speaker_voices.{language_code}": 1},
+            ),
+            segment_cursor.to_list(None),
+        ]
+        if not ranged:
+            # 전체 조회는 이슈도 프로젝트 단위로 함께 조회
+            reads.append(
+                self.db["issues"]
+                .find(
+                    {"project_id": project_id, "language_code": language_code},
+                    EDITOR_ISSUE_PROJECTION,
+                )
+                .to_list(None)
+            )
+        project, segments, *issue_reads = await asyncio.gather(*reads)
 
-        return result
+        next_cursor = None
+        if limit and len(segments) > limit:
+            segments = segments[:limit]
+            next_cursor = segments[-1].get("segment_index")
+
+        # segment_id는 문자열로 저장되어 있으므로 문자열 배열로 만들기
+        translations = []
+        if segments:
+            segment_ids = [str(seg["_id"]) for seg in segments]
+            translations = await self.translation_collection.find(
+                {"segment_id": {"$in": segment_ids}, "language_code": language_code},
+                EDITOR_TRANSLATION_PROJECTION,
+            ).to_list(None)
+
+        if issue_reads:
+            issues = issue_reads[0]
+        elif translations:
+            # 범위 조회는 페이지에 포함된 번역의 이슈만 조회
+            issues = await self.db["issues"].find(
+                {
+                    "segment_translation_id": {
+                        "$in": [str(doc["_id"]) for doc in translations]
+                    }
+                },
+                EDITOR_ISSUE_PROJECTION,
+            ).to_list(None)
+        else:
+            issues = []
+
+        speaker_voices = ((project or {}).get("speaker_voices") or {}).get(language_code)
+        merged = compose_editor_segments(
+            segments,
+            translations,
+            issues,
+            voice_replacements_by_speaker(speaker_voices),
+            language_code,
+        )
+        return merged, next_cursor
 
     async def create_project_segment(
         self,
         project_id: str,
         payload: ProjectSegmentCreate,
     ) -> str:
-        project_oid = ObjectId(project_id)
+        project_ref = str(self._as_object_id(project_id))
         now = datetime.now(timezone.utc)
 
         doc = payload.model_dump(exclude_none=True)
         doc.setdefault("created_at", now)
         doc.setdefault("updated_at", now)
-        doc["project_id"] = project_oid
+        doc["project_id"] = project_ref
 
-        result = await self.segment_collection.insert_one(doc)
+        result = await self.segment_repository.insert_one(doc)
+        await refresh_editor_segments(self.db, project_ref, [result.inserted_id])
         return str(result.inserted_id)
 
     async def create_segment_translation(
@@ -310,11 +419,11 @@ class SegmentService:
         segment_id: str,
         payload: SegmentTranslationCreate,
     ) -> str:
-        project_oid = ObjectId(project_id)
+        project_ref = str(self._as_object_id(project_id))
         segment_oid = ObjectId(segment_id)
 
-        segment = await self.segment_collection.find_one(
-            {"_id": segment_oid, "project_id": project_oid},
+        segment = await self.segment_repository.find_one(
+            {"_id": segment_oid, "project_id": project_ref},
             {"_id": 1},
         )
         if not segment:
@@ -324,11 +433,12 @@ class SegmentService:
         doc = payload.model_dump(exclude_none=True)
         doc.setdefault("created_at", now)
         doc.setdefault("updated_at", now)
-        # segment_id는 문자열로 저장 (일관성 유지)
-        doc["segment_id"] = str(segment_oid)
-        doc["project_id"] = project_oid
+        # 참조 필드는 문자열로 저장 (app/utils/ids.py)
+        doc["segment_id"] = segment_oid
+        doc["project_id"] = project_ref
 
-        result = await self.translation_collection.insert_one(doc)
+        result = await self.translation_repository.insert_one(doc)
+        await refresh_editor_segments(self.db, project_ref, [segment_oid])
         return str(result.inserted_id)
 
     async def split_segment(
@@ -490,6 +600,9 @@ class SegmentService:
                 "updated_at": now,
             }
             await self.translation_collection.insert_one(new_translation_doc)
+            await refresh_editor_segments(
+                self.db, project_id, [new_segment_id], language_code
+            )
 
             # 11. 응답 생성
             response = [
@@ -705,13 +818,17 @@ class SegmentService:
         """
         프로젝트의 여러 세그먼트를 일괄 업데이트합니다.
 
+        현재 값을 컬렉션별 $in 조회 한 번으로 읽어 실제로 바뀐 필드만 골라내고,
+        project_segments / segment_translations 에 각각 unordered bulk_write
+        한 번씩(동시에) 적용합니다.
+
         Args:
             project_id: 프로젝트 ID
             language_code: 타겟 언어 코드
             segments_data: 업데이트할 세그먼트 데이터 목록
 
         Returns:
-            업데이트 결과
+            업데이트 결과 (세그먼트별 결과 포함)
         """
         # 1. 프로젝트 ID 검증
         try:
@@ -719,91 +836,212 @@ class SegmentService:
         except (InvalidId, TypeError) as exc:
             raise HTTPException(status_code=400, detail="Invalid project_id") from exc
 
-        # 2. 프로젝트 존재 확인
-        project = await self.collection.find_one({"_id": project_oid})
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        now = datetime.now(timezone.utc)
-        updated_count = 0
-
-        # 3. 각 세그먼트 업데이트
+        # 2. 페이로드 검증 (같은 세그먼트가 여러 번 오면 뒤의 값으로 병합)
+        results: Dict[str, SegmentUpdateResult] = {}
+        segment_fields: Dict[ObjectId, Dict[str, Any]] = {}
+        translation_fields: Dict[ObjectId, Dict[str, Any]] = {}
         for segment_data in segments_data:
             try:
                 segment_oid = ObjectId(segment_data.id)
             except (InvalidId, TypeError):
-                logger.warning(f"Invalid segment_id: {segment_data.id}, skipping")
+                results[segment_data.id] = SegmentUpdateResult(
+                    id=segment_data.id, status="invalid", error="invalid segment id"
+                )
                 continue
-
-            # 이 세그먼트가 실제로 수정되었는지 추적
-            segment_modified = False
-
-            # 4. project_segments 컬렉션 업데이트할 필드 구성
-            # 언어 독립적인 데이터만 저장
-            segment_update_fields: Dict[str, Any] = {}
-
-            if segment_data.source_text is not None:
-                segment_update_fields["source_text"] = segment_data.source_text
-
-            # 5. project_segments 업데이트
-            if segment_update_fields:
-                # updated_at 없이 먼저 업데이트하여 실제 변경 여부 확인
-                result = await self.segment_collection.update_one(
-                    {"_id": segment_oid},
-                    {"$set": segment_update_fields},
+            if (
+                segment_data.start is not None
+                and segment_data.end is not None
+                and segment_data.start > segment_data.end
+            ):
+                results[segment_data.id] = SegmentUpdateResult(
+                    id=segment_data.id, status="invalid", error="start > end"
                 )
-                # 실제로 수정된 경우만 updated_at 업데이트
-                if result.modified_count > 0:
-                    await self.segment_collection.update_one(
-                        {"_id": segment_oid},
-                        {"$currentDate": {"updated_at": True}},
-                    )
-                    segment_modified = True
-
-            # 6. segment_translations 컬렉션 업데이트할 필드 구성
-            # 타겟 언어별로 편집되는 데이터 저장
-            translation_update_fields: Dict[str, Any] = {}
+                continue
 
+            # project_segments: 언어 독립적인 데이터
+            if segment_data.source_text is not None:
+                segment_fields.setdefault(segment_oid, {})[
+                    "source_text"
+                ] = segment_data.source_text
+            # segment_translations: 타겟 언어별로 편집되는 데이터
+            edited = translation_fields.setdefault(segment_oid, {})
             if segment_data.speaker_tag is not None:
-                translation_update_fields["speaker_tag"] = segment_data.speaker_tag
+                edited["speaker_tag"] = segment_data.speaker_tag
             if segment_data.start is not None:
-                translation_update_fields["start"] = segment_data.start
+                edited["start"] = segment_data.start
             if segment_data.end is not None:
-                translation_update_fields["end"] = segment_data.end
+                edited["end"] = segment_data.end
             if segment_data.target_text is not None:
-                translation_update_fields["target_text"] = segment_data.target_text
+                edited["target_text"] = segment_data.target_text
             if segment_data.playbackRate is not None:
-                translation_update_fields["playback_rate"] = segment_data.playbackRate
-
-            # 7. segment_translations 업데이트 (있으면 업데이트, 없으면 생성)
-            if translation_update_fields:
-                # updated_at 없이 먼저 업데이트하여 실제 변경 여부 확인
-                result = await self.translation_collection.update_one(
-                    {"segment_id": segment_data.id, "language_code": language_code},
-                    {
-                        "$set": translation_update_fields,
-                        "$setOnInsert": {
-                            "segment_id": segment_data.id,
-                            "language_code": language_code,
-                            "created_at": now,
-                        },
-                    },
-                    upsert=True,
+                edited["playback_rate"] = segment_data.playbackRate
+            results[str(segment_oid)] = SegmentUpdateResult(
+                id=str(segment_oid), status="unchanged"
+            )
+
+        segment_oids = [
+            ObjectId(item.id) for item in results.values() if item.status != "invalid"
+        ]
+
+        # 3. 프로젝트 존재 확인 + 현재 값 조회 (동시에)
+        segment_projection = {"source_text": 1}
+        translation_projection = {
+            "segment_id": 1,
+            "speaker_tag": 1,
+            "start": 1,
+            "end": 1,
+            "target_text": 1,
+            "playback_rate": 1,
+        }
+        project, current_segments, current_translations = await asyncio.gather(
+            self.collection.find_one({"_id": project_oid}, {"_id": 1}),
+            self.segment_repository.find(
+                {"_id": {"$in": segment_oids}, "project_id": project_oid},
+                segment_projection,
+            ).to_list(None),
+            self.translation_collection.find(
+                {
+                    "segment_id": {"$in": [str(oid) for oid in segment_oids]},
+                    "language_code": language_code,
+                },
+                translation_projection,
+            ).to_list(None),
+        )
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        segments_by_id = {doc["_id"]: doc for doc in current_segments}
+        translations_by_segment = {
+            doc["segment_id"]: doc for doc in current_translations
+        }
+
+        # 4. 실제로 바뀐 필드만 쓰기 연산으로 구성
+        now = datetime.now(timezone.utc)
+        segment_ops: list[UpdateOne] = []
+        segment_op_ids: list[str] = []
+        translation_ops: list[UpdateOne] = []
+        translation_op_ids: list[str] = []
+
+        for segment_oid in segment_oids:
+            segment_id = str(segment_oid)
+            current = segments_by_id.get(segment_oid)
+            if current is None:
+                results[segment_id].status = "not_found"
+                continue
+
+            changed = {
+                key: value
+                for key, value in segment_fields.get(segment_oid, {}).items()
+                if current.get(key) != value
+            }
+            if changed:
+                segment_ops.append(
+                    UpdateOne(
+                        {"_id": segment_oid},
+                        {"$set": changed, "$currentDate": {"updated_at": True}},
+                    )
                 )
-                # 실제로 수정되었거나 새로 생성된 경우 updated_at 업데이트
-                if result.modified_count > 0 or result.upserted_id is not None:
-                    await self.translation_collection.update_one(
-                        {"segment_id": segment_data.id, "language_code": language_code},
-                        {"$currentDate": {"updated_at": True}},
+                segment_op_ids.append(segment_id)
+
+            edited = translation_fields.get(segment_oid) or {}
+            translation = translations_by_segment.get(segment_id)
+            if translation is None:
+                if edited:
+                    # 번역이 없으면 생성 (동시 저장에도 중복 생성되지 않도록 upsert)
+                    translation_ops.append(
+                        UpdateOne(
+                            {"segment_id": segment_id, "language_code": language_code},
+                            {
+                                "$set": edited,
+                                "$setOnInsert": {
+                                    "segment_id": segment_id,
+                                    "language_code": language_code,
+                                    "created_at": now,
+                                },
+                                "$currentDate": {"updated_at": True},
+                            },
+                            upsert=True,
+                        )
                     )
-                    segment_modified = True
+                    translation_op_ids.append(segment_id)
+                continue
 
-            # 세그먼트당 한 번만 카운트 (두 컬렉션 중 하나라도 수정되었으면)
-            if segment_modified:
-                updated_count += 1
+            changed = {
+                key: value
+                for key, value in edited.items()
+                if translation.get(key) != value
+            }
+            if changed:
+                translation_ops.append(
+                    UpdateOne(
+                        {"_id": translation["_id"]},
+                        {"$set": changed, "$currentDate": {"updated_at": True}},
+                    )
+                )
+                translation_op_ids.append(segment_id)
+
+        # 5. 컬렉션별 bulk_write 한 번씩 (동시에)
+        await asyncio.gather(
+            self._apply_bulk(
+                self.segment_collection, segment_ops, segment_op_ids, results
+            ),
+            self._apply_bulk(
+                self.translation_collection,
+                translation_ops,
+                translation_op_ids,
+                results,
+            ),
+        )
 
+        # 에디터 read model 반영 (source_text는 모든 언어에 보이므로 언어 구분 없이)
+        await refresh_editor_segments(self.db, project_oid, set(segment_op_ids))
+        await refresh_editor_segments(
+            self.db,
+            project_oid,
+            set(translation_op_ids) - set(segment_op_ids),
+            language_code,
+        )
+
+        updated_count = sum(1 for item in results.values() if item.status == "updated")
+        failed = [item for item in results.values() if item.status == "failed"]
         return UpdateSegmentsResponse(
-            success=True,
-            message=f"Successfully updated {updated_count} segments",
+            success=not failed,
+            message=(
+                f"Successfully updated {updated_count} segments"
+                if not failed
+                else f"Updated {updated_count} segments, {len(failed)} failed"
+            ),
             updated_count=updated_count,
+            results=list(results.values()),
         )
+
+    @staticmethod
+    async def _apply_bulk(
+        collection,
+        operations: list[UpdateOne],
+        segment_ids: list[str],
+        results: Dict[str, SegmentUpdateResult],
+    ) -> None:
+        """unordered bulk_write 후 연산별 결과를 세그먼트 결과에 반영"""
+        if not operations:
+            return
+        errors: Dict[int, str] = {}
+        try:
+            await collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as exc:
+            errors = {
+                error["index"]: error.get("errmsg", "write failed")
+                for error in exc.details.get("writeErrors", [])
+            }
+            logger.error(
+                f"Bulk segment update had {len(errors)} write errors on "
+                f"{collection.name}"
+            )
+
+        for index, segment_id in enumerate(segment_ids):
+            result = results[segment_id]
+            if index in errors:
+                result.status = "failed"
+                result.error = errors[index]
+            elif result.status != "failed":
+                result.status = "updated"
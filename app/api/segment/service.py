@@ -2,13 +2,42 @@
 세그먼트 및 번역 관련 서비스
 """
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 import logging
 
+from app.utils.ids import to_ref
+
+from .read_model import refresh_editor_translations
+
 logger = logging.getLogger(__name__)
 
+SEGMENT_PAGE_DEFAULT_LIMIT = 100
+SEGMENT_PAGE_MAX_LIMIT = 500
+
+
+def build_segment_range_query(
+    project_id: str,
+    after: Optional[int] = None,
+    window_start: Optional[float] = None,
+    window_end: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    세그먼트 범위 조회 조건
+
+    - after: 이 segment_index 다음부터 (keyset 커서)
+    - window_start / window_end: [t0, t1] 구간과 겹치는 세그먼트만
+    """
+    query: Dict[str, Any] = {"project_id": project_id}
+    if after is not None:
+        query["segment_index"] = {"$gt": after}
+    if window_end is not None:
+        query["start"] = {"$lt": window_end}
+    if window_start is not None:
+        query["end"] = {"$gt": window_start}
+    return query
+
 
 class SegmentService:
     def __init__(self, db: AsyncIOMotorDatabase):
@@ -145,14 +174,7 @@ class SegmentService:
         try:
             # 세그먼트 조회
             segments = await self.get_segments_by_project(project_id, skip, limit)
-
-            # 각 세그먼트에 대한 번역 조회 (segment_id는 문자열로)
-            for segment in segments:
-                translations = await self.get_translations_by_segment(
-                    str(segment["_id"]), language_code  # 문자열로 변환
-                )
-                segment["translations"] = translations
-
+            await self._attach_translations(segments, language_code)
             return segments
 
         except Exception as exc:
@@ -161,6 +183,73 @@ class SegmentService:
             )
             raise
 
+    async def get_segment_page(
+        self,
+        project_id: str,
+        language_code: Optional[str] = None,
+        after: Optional[int] = None,
+        limit: int = SEGMENT_PAGE_DEFAULT_LIMIT,
+        window_start: Optional[float] = None,
+        window_end: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        segment_index 기준 keyset 페이지 조회 (번역 포함)
+
+        (project_id, segment_index) 인덱스를 따라 after 이후 limit개만 읽으므로
+        skip과 달리 페이지가 뒤로 가도 비용이 일정합니다.
+        다음 페이지는 반환된 next_cursor를 after로 전달해 조회합니다.
+        """
+        try:
+            query = build_segment_range_query(
+                project_id, after, window_start, window_end
+            )
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+            segments = await (
+                self.segments_collection.find(query)
+                .sort("segment_index", 1)
+                .limit(limit + 1)
+                .to_list(None)
+            )
+            has_more = len(segments) > limit
+            segments = segments[:limit]
+            for segment in segments:
+                segment["_id"] = str(segment["_id"])
+            await self._attach_translations(segments, language_code)
+
+            return {
+                "items": segments,
+                "next_cursor": segments[-1].get("segment_index") if has_more else None,
+                "has_more": has_more,
+            }
+
+        except Exception as exc:
+            logger.error(f"Failed to get segment page for project {project_id}: {exc}")
+            raise
+
+    async def _attach_translations(
+        self, segments: List[dict], language_code: Optional[str] = None
+    ) -> None:
+        """페이지에 포함된 세그먼트의 번역을 한 번의 $in 조회로 붙이기"""
+        if not segments:
+            return
+        # segment_id는 문자열로 저장되어 있으므로 문자열 배열로 만들기
+        segment_ids = [str(segment["_id"]) for segment in segments]
+        query: Dict[str, Any] = {"segment_id": {"$in": segment_ids}}
+        if language_code:
+            query["language_code"] = language_code
+
+        translations_by_segment: Dict[str, List[dict]] = {}
+        async for translation in self.translations_collection.find(query):
+            translation["_id"] = str(translation["_id"])
+            translations_by_segment.setdefault(translation["segment_id"], []).append(
+                translation
+            )
+
+        for segment in segments:
+            segment["translations"] = translations_by_segment.get(
+                str(segment["_id"]), []
+            )
+
     async def get_translation_languages(self, project_id: str) -> List[str]:
         """프로젝트에서 사용된 번역 언어 목록 조회"""
         try:
@@ -205,6 +294,7 @@ class SegmentService:
             )
 
             if result:
+                await refresh_editor_translations(self.db, [result["_id"]])
                 result["_id"] = str(result["_id"])
 
             return result
@@ -223,7 +313,6 @@ class SegmentService:
         """번역 생성 또는 업데이트 (upsert)"""
         try:
             from datetime import datetime
-            from bson.errors import InvalidId
 
             # 기존 번역이 있는지 확인
             existing = await self.translations_collection.find_one(
@@ -232,16 +321,12 @@ class SegmentService:
 
             now = datetime.now()
 
-            # project_id를 ObjectId로 변환 (문자열인 경우)
-            project_oid = None
+            # project_id는 참조 필드 규칙대로 문자열로 저장 (app/utils/ids.py)
+            project_ref = None
             if project_id:
                 try:
-                    project_oid = (
-                        ObjectId(project_id)
-                        if isinstance(project_id, str)
-                        else project_id
-                    )
-                except (InvalidId, TypeError):
+                    project_ref = to_ref(project_id)
+                except ValueError:
                     logger.warning(
                         f"Invalid project_id format: {project_id}, skipping project_id"
                     )
@@ -249,8 +334,8 @@ class SegmentService:
             if existing:
                 # 업데이트
                 update_data = {"target_text": target_text, "updated_at": now}
-                if project_oid:
-                    update_data["project_id"] = project_oid
+                if project_ref:
+                    update_data["project_id"] = project_ref
 
                 result = await self.translations_collection.find_one_and_update(
                     {"_id": existing["_id"]},
@@ -266,8 +351,8 @@ class SegmentService:
                     "created_at": now,
                     "updated_at": now,
                 }
-                if project_oid:
-                    doc["project_id"] = project_oid
+                if project_ref:
+                    doc["project_id"] = project_ref
 
                 result = await self.translations_collection.insert_one(doc)
                 result = await self.translations_collection.find_one(
@@ -279,6 +364,7 @@ class SegmentService:
                     f"Failed to create or update translation for segment {segment_id}"
                 )
 
+            await refresh_editor_translations(self.db, [result["_id"]])
             result["_id"] = str(result["_id"])
             return result
 
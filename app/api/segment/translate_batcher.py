@@ -0,0 +1,116 @@
+"""
+단일 세그먼트 번역 요청 마이크로 배칭
+
+에디터에서 여러 세그먼트를 연달아 재번역하면 요청마다 LLM 왕복과 시스템 프롬프트
+토큰을 반복해서 씁니다. (src_lang, target_lang)별로 짧은 창(window) 동안 요청을 모아
+한 번의 배치 호출로 보내고, 결과를 각 요청에 돌려줍니다.
+
+- 창이 끝나거나 max_items가 차면 즉시 전송
+- 같은 배치 안의 동일 원문은 한 번만 번역
+- 배치 호출이 실패하면 해당 배치의 모든 요청에 같은 예외 전달
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.utils.metrics import COUNT_BUCKETS, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# (items, target_lang, src_lang) -> [{"seg_idx", "translation"}, ...]
+TranslateFn = Callable[
+    [List[Dict[str, Any]], str, Optional[str]], Awaitable[List[Dict[str, Any]]]
+]
+BatchKey = Tuple[Optional[str], str]
+
+TRANSLATION_BATCH_SIZE = metrics_registry.histogram(
+    "translation_batch_size",
+    "Segments sent per batched translation call",
+    ["target_lang"],
+    buckets=COUNT_BUCKETS,
+)
+
+
+class _PendingBatch:
+    def __init__(self):
+        self.waiters: List[Tuple[str, asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class TranslationBatcher:
+    """언어 쌍별로 번역 요청을 모아 배치 호출"""
+
+    def __init__(self, translate: TranslateFn, window: float, max_items: int):
+        self._translate = translate
+        self.window = window
+        self.max_items = max(1, max_items)
+        self._pending: Dict[BatchKey, _PendingBatch] = {}
+        self._inflight: set[asyncio.Task] = set()
+
+    async def translate(
+        self, source_text: str, target_lang: str, src_lang: Optional[str] = None
+    ) -> str:
+        """번역문 반환 (배치 결과에 없으면 원문)"""
+        if self.window <= 0 or self.max_items == 1:
+            result = await self._translate(
+                [{"seg_idx": 0, "text": source_text}], target_lang, src_lang
+            )
+            return result[0]["translation"] if result else source_text
+
+        loop = asyncio.get_running_loop()
+        key = (src_lang, target_lang)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch()
+            batch.timer = loop.call_later(self.window, self._flush, key)
+
+        future = loop.create_future()
+        batch.waiters.append((source_text, future))
+        if len(batch.waiters) >= self.max_items:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: BatchKey) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        # 이미 취소된 요청(클라이언트 연결 종료 등)은 보내지 않음
+        waiters = [(text, future) for text, future in batch.waiters if not future.done()]
+        if not waiters:
+            return
+        task = asyncio.create_task(self._dispatch(key, waiters))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(
+        self, key: BatchKey, waiters: List[Tuple[str, asyncio.Future]]
+    ) -> None:
+        src_lang, target_lang = key
+        # 요청마다 segment_index가 겹칠 수 있어 배치 내부 인덱스로 다시 매김
+        texts = list(dict.fromkeys(text for text, _ in waiters))
+        items = [{"seg_idx": index, "text": text} for index, text in enumerate(texts)]
+        TRANSLATION_BATCH_SIZE.observe(len(items), target_lang=target_lang)
+
+        try:
+            results = await self._translate(items, target_lang, src_lang)
+        except Exception as exc:
+            logger.warning(
+                f"Batched translation failed ({src_lang}->{target_lang}, "
+                f"{len(items)} items): {exc}"
+            )
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        translations = {
+            texts[int(result["seg_idx"])]: result["translation"]
+            for result in results
+            if 0 <= int(result["seg_idx"]) < len(texts)
+        }
+        for text, future in waiters:
+            if not future.done():
+                future.set_result(translations.get(text) or text)
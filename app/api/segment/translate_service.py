@@ -5,26 +5,31 @@ worker의 translate_single_segment 로직을 참고하여 구현
 
 import os
 import json
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
-from app.config.env import GOOGLE_APPLICATION_CREDENTIALS
 
-logger = logging.getLogger(__name__)
+from motor.motor_asyncio import AsyncIOMotorDatabase
 
-#  AI 라이브러리 선택적 임포트
-_VERTEX_AVAILABLE = True
-try:
-    import vertexai
-    from vertexai.generative_models import GenerativeModel, GenerationConfig
-    from google.oauth2 import service_account
-except Exception:
-    _VERTEX_AVAILABLE = False
+from app.api.llm import LLMBackend, LLMRequest, get_llm_backend
 
+from .translate_batcher import TranslationBatcher
+from .translation_memory import lookup_translations, store_translations
 
-def _env_str(key: str, default: str | None = None) -> str | None:
-    """환경변수 문자열 읽기"""
-    v = os.getenv(key)
-    return v if v is not None and v != "" else default
+logger = logging.getLogger(__name__)
+
+# 동기 폴백 번역기(googletrans)는 이벤트 루프 밖 전용 스레드에서 실행
+_fallback_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("MT_FALLBACK_WORKERS", "4")),
+    thread_name_prefix="mt-fallback",
+)
+# 동시에 진행하는 LLM 번역 호출 수 상한 (쿼터 보호)
+_MT_MAX_CONCURRENCY = int(os.getenv("MT_MAX_CONCURRENCY", "8"))
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+_translator: Optional["LLMTranslator"] = None
+# 프롬프트(_build_prompt)를 바꾸면 올려서 번역 메모리를 새로 채움
+TRANSLATION_PROMPT_VERSION = 1
 
 
 def _env_bool(key: str, default: bool = False) -> bool:
@@ -63,71 +68,44 @@ def _fallback_translate_batch(
         ]
 
 
-class GeminiTranslator:
-    """Vertex AI Gemini 기반 번역기 (worker의 GeminiTranslator와 동일한 로직)"""
+class LLMTranslator:
+    """LLM 배치 번역기 (프롬프트/응답 복원은 worker의 GeminiTranslator와 동일한 로직)"""
 
-    def __init__(self) -> None:
-        if not _VERTEX_AVAILABLE:
-            raise RuntimeError(
-                "Vertex AI libraries not installed. Add google-cloud-aiplatform to requirements."
-            )
-
-        # 모델/리전
-        self.model_name = _env_str("GEMINI_MODEL_VERSION", "gemini-2.5-flash")
-        self.location = _env_str("VERTEX_LOCATION", "us-central1")
-        self.project_id = _env_str("VERTEX_PROJECT_ID")
-
-        # 서비스 계정 JSON (여러 키명 지원)
-        sa_path = (
-            _env_str("VERTEX_SERVICE_ACCOUNT_JSON")
-            or _env_str("VERTEX_SA_PATH")
-            or GOOGLE_APPLICATION_CREDENTIALS
-        )
-
-        creds = None
-        if sa_path and os.path.isfile(sa_path):
-            # 프로젝트 ID가 없으면 JSON에서 복구 시도
-            if not self.project_id:
-                try:
-                    with open(sa_path, "r", encoding="utf-8") as f:
-                        j = json.load(f)
-                        self.project_id = j.get("project_id")
-                except Exception:
-                    pass
-            try:
-                creds = service_account.Credentials.from_service_account_file(
-                    sa_path, scopes=["https://www.googleapis.com/auth/cloud-platform"]
-                )
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to load service account JSON at {sa_path}: {e}"
-                )
-
-        if not self.project_id:
-            raise RuntimeError(
-                "VERTEX_PROJECT_ID is required (or set in service account JSON)."
-            )
+    def __init__(self, backend: LLMBackend) -> None:
+        self.backend = backend
 
-        vertexai.init(
-            project=self.project_id, location=self.location, credentials=creds
-        )
-        self._model = GenerativeModel(self.model_name)
-
-    def translate_batch(
+    async def translate_batch_async(
         self,
         items: List[Dict[str, Any]],
         target_lang: str,
         src_lang: str | None = None,
     ) -> List[Dict[str, Any]]:
-        """배치 번역 수행 (심플 버전).
+        """배치 번역 수행.
 
         items: [{"seg_idx": int, "text": str}, ...]
         반환: [{"seg_idx": int, "translation": str}, ...] (seg_idx 기준으로 N개 복원)
         """
-        n = len(items)
-        if n == 0:
+        if not items:
             return []
+        system, prompt = self._build_prompt(items, target_lang, src_lang)
+        async with _get_llm_semaphore():
+            text = await self.backend.generate(
+                LLMRequest(
+                    task="translate",
+                    prompt=prompt,
+                    system=system,
+                    temperature=0.1,
+                    max_output_tokens=8192,
+                )
+            )
+        return self._restore_items(items, text)
 
+    @staticmethod
+    def _build_prompt(
+        items: List[Dict[str, Any]], target_lang: str, src_lang: str | None
+    ) -> tuple[str, str]:
+        """시스템/사용자 프롬프트 구성"""
+        n = len(items)
         src_texts = [str(o["text"]) for o in items]
         seg_idxs = [int(o["seg_idx"]) for o in items]
 
@@ -158,18 +136,13 @@ class GeminiTranslator:
             + "\n\nReturn JSON ONLY like:\n"
             '[{"seg_idx": 0, "translation": "..."}, ...]'
         )
+        return sys, user
 
-        gen_cfg = GenerationConfig(
-            temperature=0.1,
-            max_output_tokens=8192,
-        )
-
-        resp = self._model.generate_content(
-            contents=[sys, user],
-            generation_config=gen_cfg,
-        )
-        logger.info(f"Gemini raw response: {resp}")
-        text = self._extract_text(resp)
+    def _restore_items(
+        self, items: List[Dict[str, Any]], text: str
+    ) -> List[Dict[str, Any]]:
+        """응답을 seg_idx 기준으로 입력 N개에 맞춰 복원 (누락은 원문 폴백)"""
+        logger.debug(f"LLM raw response: {text}")
         data = self._parse_json_array(text)
 
         # seg_idx → 번역 매핑
@@ -183,33 +156,12 @@ class GeminiTranslator:
             except Exception:
                 continue
 
-        # 최종 N개 복원 (누락은 원문 폴백)
         out: List[Dict[str, Any]] = []
-        for idx, src in zip(seg_idxs, src_texts):
-            out.append({"seg_idx": idx, "translation": mapping.get(idx, src)})
+        for o in items:
+            idx = int(o["seg_idx"])
+            out.append({"seg_idx": idx, "translation": mapping.get(idx, str(o["text"]))})
         return out
 
-    @staticmethod
-    def _extract_text(resp: Any) -> str:
-        """응답에서 텍스트 추출"""
-        try:
-            cands = getattr(resp, "candidates", None)
-            if cands:
-                content = cands[0].content
-                parts = getattr(content, "parts", None)
-                for p in parts or []:
-                    t = getattr(p, "text", None)
-                    if isinstance(t, str) and t.strip():
-                        return t
-        except Exception:
-            pass
-        try:
-            if hasattr(resp, "text") and isinstance(resp.text, str):
-                return resp.text
-        except Exception:
-            pass
-        return str(resp)
-
     @staticmethod
     def _parse_json_array(text: str) -> List[Dict[str, Any]]:
         """텍스트에서 JSON 배열 파싱"""
@@ -235,11 +187,50 @@ class GeminiTranslator:
         return []
 
 
-def translate_single_segment(
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(_MT_MAX_CONCURRENCY)
+    return _llm_semaphore
+
+
+def get_translator() -> LLMTranslator:
+    """프로세스 전역 백엔드를 쓰는 LLMTranslator (백엔드가 교체되면 다시 생성)"""
+    global _translator
+    backend = get_llm_backend()
+    if _translator is None or _translator.backend is not backend:
+        _translator = LLMTranslator(backend)
+    return _translator
+
+
+def _use_llm_backend() -> bool:
+    # 백엔드 선택: 기본 LLM(LLM_BACKEND), MT_BACKEND로 googletrans 폴백 강제 가능
+    backend = (os.getenv("MT_BACKEND") or "vertex").strip().lower()
+    return backend in {"vertex", "gemini", "gemini-vertex", "llm"}
+
+
+def translation_memory_version() -> Optional[str]:
+    """번역 메모리 버전 (Vertex 결과만 저장, 폴백/스텁/로컬 대역 번역은 None)"""
+    if not _use_llm_backend():
+        return None
+    try:
+        backend = get_llm_backend()
+    except Exception:
+        # 백엔드를 만들 수 없으면 폴백 번역이 쓰이므로 저장하지 않음
+        return None
+    # set_llm_backend로 교체된 백엔드도 실제 인스턴스 기준으로 판단
+    if backend.name != "vertex":
+        return None
+    return f"{backend.default_model}:p{TRANSLATION_PROMPT_VERSION}"
+
+
+async def translate_single_segment(
     source_text: str,
     segment_index: int,
     target_lang: str,
     src_lang: str | None = None,
+    db: Optional[AsyncIOMotorDatabase] = None,
+    use_memory: bool = True,
 ) -> dict[str, Any]:
     """단일 세그먼트를 번역합니다.
 
@@ -248,37 +239,110 @@ def translate_single_segment(
         segment_index: 세그먼트 인덱스
         target_lang: 타겟 언어 코드
         src_lang: 소스 언어 코드 (선택)
+        db: 번역 메모리 조회/저장용 DB (없으면 메모리 미사용)
+        use_memory: 프로젝트별 번역 메모리 사용 여부
 
     Returns:
         {"seg_idx": int, "translation": str}
     """
-    items = [{"seg_idx": segment_index, "text": source_text}]
+    version = translation_memory_version() if db is not None and use_memory else None
+    if version:
+        hits = await lookup_translations(
+            db, [source_text], src_lang, target_lang, version
+        )
+        if source_text in hits:
+            return {"seg_idx": segment_index, "translation": hits[source_text]}
+
+    # 동시에 들어온 단건 요청은 같은 언어 쌍끼리 모아 한 번에 번역
+    translation = await translation_batcher.translate(
+        source_text, target_lang, src_lang
+    )
+    # 원문 그대로면 번역 누락 폴백일 수 있어 저장하지 않음
+    if version and translation != source_text:
+        await store_translations(
+            db, {source_text: translation}, src_lang, target_lang, version
+        )
+    return {"seg_idx": segment_index, "translation": translation}
 
-    # 백엔드 선택: 기본 vertex, 환경변수로 강제 가능
-    backend = (os.getenv("MT_BACKEND") or "vertex").strip().lower()
+
+async def translate_items_with_memory(
+    db: AsyncIOMotorDatabase,
+    items: List[Dict[str, Any]],
+    target_lang: str,
+    src_lang: str | None = None,
+    use_memory: bool = True,
+) -> List[Dict[str, Any]]:
+    """번역 메모리에 없는 원문만 LLM에 보내는 배치 번역"""
+    version = translation_memory_version() if use_memory else None
+    if not version:
+        return await translate_items(items, target_lang, src_lang=src_lang)
+
+    texts = [str(item["text"]) for item in items]
+    translations = await lookup_translations(
+        db, texts, src_lang, target_lang, version
+    )
+    # 같은 원문은 한 번만 전송
+    misses: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        if str(item["text"]) not in translations:
+            misses.setdefault(str(item["text"]), item)
+    if misses:
+        results = await translate_items(
+            list(misses.values()), target_lang, src_lang=src_lang
+        )
+        by_index = {int(r["seg_idx"]): r["translation"] for r in results}
+        learned = {}
+        for item in misses.values():
+            text = str(item["text"])
+            translation = by_index.get(int(item["seg_idx"]), text)
+            if translation != text:
+                learned[text] = translation
+        await store_translations(db, learned, src_lang, target_lang, version)
+        translations = {**translations, **learned}
+    return [
+        {
+            "seg_idx": int(item["seg_idx"]),
+            "translation": translations.get(str(item["text"]), str(item["text"])),
+        }
+        for item in items
+    ]
+
+
+async def translate_items(
+    items: List[Dict[str, Any]],
+    target_lang: str,
+    src_lang: str | None = None,
+) -> List[Dict[str, Any]]:
+    """설정된 백엔드로 배치 번역 (LLM 비동기 호출, 폴백은 전용 스레드 풀)"""
     strict = _env_bool("MT_STRICT", True)
-    translator: Any | None = None
-    use_vertex = backend in {"vertex", "gemini", "gemini-vertex"}
+    translator: Optional[LLMTranslator] = None
 
-    if use_vertex:
+    if _use_llm_backend():
         try:
-            translator = GeminiTranslator()
+            translator = get_translator()
         except Exception as exc:
             if strict:
                 raise RuntimeError(
-                    f"Vertex translator initialization failed under MT_STRICT: {exc}"
+                    f"LLM translator initialization failed under MT_STRICT: {exc}"
                 )
-            use_vertex = False
 
-    if not use_vertex or translator is None:
+    if translator is None:
         # 폴백 번역 사용
-        result = _fallback_translate_batch(items, target_lang, src_lang=src_lang)
-    else:
-        # Vertex 사용
-        result = translator.translate_batch(items, target_lang, src_lang=src_lang)
-
-    if result and len(result) > 0:
-        return result[0]
-    else:
-        # 실패 시 원문 반환
-        return {"seg_idx": segment_index, "translation": source_text}
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _fallback_executor,
+            _fallback_translate_batch,
+            items,
+            target_lang,
+            src_lang,
+        )
+    return await translator.translate_batch_async(
+        items, target_lang, src_lang=src_lang
+    )
+
+
+translation_batcher = TranslationBatcher(
+    translate_items,
+    window=int(os.getenv("MT_BATCH_WINDOW_MS", "100")) / 1000,
+    max_items=int(os.getenv("MT_BATCH_MAX_ITEMS", "20")),
+)
@@ -0,0 +1,125 @@
+"""
+번역 메모리 (translation memory)
+
+"Thank you", 인트로/아웃트로 멘트처럼 프로젝트마다 반복되는 원문은 이전 기계 번역을
+재사용합니다. 키는 정규화한 원문 해시 + 언어 쌍 + 모델/프롬프트 버전이라
+모델이나 프롬프트가 바뀌면 자연히 새 항목으로 채워집니다.
+
+- 1차: 프로세스 내 LRU (I/O 없음)
+- 2차: translation_memory 컬렉션 (_id = 키, 한 번의 $in 조회)
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from app.utils.cache import TTLCache
+from app.utils.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_MEMORY_COLLECTION = "translation_memory"
+TRANSLATION_MEMORY_CACHE = TTLCache("translation_memory", ttl=3600, maxsize=20000)
+
+TRANSLATION_MEMORY_REQUESTS = metrics_registry.counter(
+    "translation_memory_requests_total",
+    "Translation memory lookups by result (memory, db, miss)",
+    ["result"],
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_source_text(text: str) -> str:
+    """전각/반각, 공백 차이만 흡수 (대소문자/구두점은 번역에 영향이 있어 유지)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def memory_key(
+    text: str, src_lang: Optional[str], target_lang: str, version: str
+) -> str:
+    digest = hashlib.sha256(normalize_source_text(text).encode("utf-8")).hexdigest()
+    return f"{src_lang or 'auto'}:{target_lang}:{version}:{digest}"
+
+
+async def lookup_translations(
+    db: AsyncIOMotorDatabase,
+    texts: Iterable[str],
+    src_lang: Optional[str],
+    target_lang: str,
+    version: str,
+) -> Dict[str, str]:
+    """원문 -> 저장된 번역 (없는 원문은 결과에서 제외)"""
+    keys = {text: memory_key(text, src_lang, target_lang, version) for text in texts}
+    found: Dict[str, str] = {}
+    missing: Dict[str, list[str]] = {}
+    for text, key in keys.items():
+        cached = TRANSLATION_MEMORY_CACHE.get(key)
+        if cached is not None:
+            found[text] = cached
+            TRANSLATION_MEMORY_REQUESTS.inc(result="memory")
+        else:
+            missing.setdefault(key, []).append(text)
+    if not missing:
+        return found
+
+    try:
+        docs = await db[TRANSLATION_MEMORY_COLLECTION].find(
+            {"_id": {"$in": list(missing)}}, {"translation": 1}
+        ).to_list(length=None)
+    except PyMongoError as exc:
+        logger.warning(f"Translation memory lookup failed: {exc}")
+        docs = []
+
+    for doc in docs:
+        TRANSLATION_MEMORY_CACHE.set(doc["_id"], doc["translation"])
+        for text in missing.pop(doc["_id"], []):
+            found[text] = doc["translation"]
+            TRANSLATION_MEMORY_REQUESTS.inc(result="db")
+    for texts_without_hit in missing.values():
+        TRANSLATION_MEMORY_REQUESTS.inc(len(texts_without_hit), result="miss")
+    return found
+
+
+async def store_translations(
+    db: AsyncIOMotorDatabase,
+    translations: Dict[str, str],
+    src_lang: Optional[str],
+    target_lang: str,
+    version: str,
+) -> None:
+    """원문 -> 번역 저장 (실패해도 번역 요청은 계속 진행)"""
+    if not translations:
+        return
+    now = datetime.now()
+    operations = []
+    for text, translation in translations.items():
+        key = memory_key(text, src_lang, target_lang, version)
+        TRANSLATION_MEMORY_CACHE.set(key, translation)
+        operations.append(
+            UpdateOne(
+                {"_id": key},
+                {
+                    "$set": {"translation": translation, "updated_at": now},
+                    "$setOnInsert": {
+                        "source_text": normalize_source_text(text),
+                        "src_lang": src_lang,
+                        "target_lang": target_lang,
+                        "version": version,
+                        "created_at": now,
+                    },
+                },
+                upsert=True,
+            )
+        )
+    try:
+        await db[TRANSLATION_MEMORY_COLLECTION].bulk_write(operations, ordered=False)
+    except PyMongoError as exc:
+        logger.warning(f"Translation memory store failed: {exc}")
@@ -1,5 +1,6 @@
 # app/api/routes/upload.py
 import os
+import json
 import asyncio
 import logging
 import tempfile
@@ -29,6 +30,7 @@ from app.api.auth.model import UserOut
 from .models import PresignRequest, RegisterRequest, UploadFinalize
 from app.api.project.models import ProjectThumbnail
 from app.config.redis import get_redis
+from app.api.events import event_bus, EventTopic
 from app.workers.jobs.video_ingest import run_ingest
 from app.utils.thumbnail import extract_and_upload_thumbnail, ThumbnailError
 from pathlib import Path
@@ -250,15 +252,13 @@ def media_redirect(key: str):
 
 @upload_router.get("/{project_id}/events")
 async def stream_events(project_id: str, request: Request):
-    redis = get_redis()
-    pubsub = redis.pubsub()
-    channel = f"uploads:{project_id}"
-    pubsub.subscribe(channel)
     logger.info(f"New SSE connection for uploads:{project_id}")
 
     async def event_stream():
-        loop = asyncio.get_running_loop()
-        heartbeat_counter = 0
+        heartbeat_interval = 30  # 30초마다 하트비트
+        # 통합 이벤트 버스의 upload 토픽 구독 (클라이언트별 Redis 연결/스레드 없음)
+        # 제너레이터 안에서 구독해야 시작 전 연결 종료 시에도 구독이 남지 않음
+        subscription = event_bus.subscribe([EventTopic.UPLOAD], [project_id])
         try:
             while True:
                 # 클라이언트 연결 해제 확인
@@ -266,24 +266,13 @@ async def stream_events(project_id: str, request: Request):
                     logger.info(f"Client disconnected from storage events for project {project_id}")
                     break
 
-                # 타임아웃을 줄여서 더 자주 연결 상태 체크 (1초 -> 0.5초)
-                message = await loop.run_in_executor(None, pubsub.get_message, 0.5)
-
-                if not message or message["type"] != "message":
-                    # 메시지가 없을 때 하트비트 체크 (30초마다)
-                    heartbeat_counter += 1
-                    if heartbeat_counter >= 60:  # 0.5초 * 60 = 30초
-                        yield {"event": "heartbeat", "data": '{"timestamp": "' + str(asyncio.get_event_loop().time()) + '"}'}
-                        heartbeat_counter = 0
-                    await asyncio.sleep(0.1)
+                try:
+                    envelope = await asyncio.wait_for(subscription.get(), timeout=heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield {"event": "heartbeat", "data": '{"timestamp": "' + str(asyncio.get_event_loop().time()) + '"}'}
                     continue
 
-                # 메시지가 있으면 하트비트 카운터 리셋
-                heartbeat_counter = 0
-                data = message["data"]
-                if isinstance(data, bytes):
-                    data = data.decode()
-
+                data = json.dumps(envelope["data"])
                 logger.info(f"event stream: {data}")
                 yield {"event": "progress", "data": data}
 
@@ -293,11 +282,7 @@ async def stream_events(project_id: str, request: Request):
         except Exception as e:
             logger.error(f"Error in storage events stream for project {project_id}: {e}")
         finally:
-            try:
-                pubsub.unsubscribe(channel)
-                pubsub.close()
-                logger.info(f"Cleaned up Redis pubsub connection for project {project_id}")
-            except Exception as e:
-                logger.error(f"Error cleaning up pubsub for project {project_id}: {e}")
+            event_bus.unsubscribe(subscription)
+            logger.info(f"Cleaned up storage events listener for project {project_id}")
 
     return EventSourceResponse(event_stream())
@@ -1,4 +1,8 @@
+import json
+import logging
+
 from fastapi import APIRouter, Depends, status, Response, HTTPException
+from sse_starlette.sse import EventSourceResponse
 from .service import Model
 from .models import SuggestionResponse, SuggestionRequest, SuggestSave, SuggestDelete
 from .status import EnumStatus
@@ -6,6 +10,8 @@ from .status import EnumStatus
 """
 @author: 김현수
 """
+logger = logging.getLogger(__name__)
+
 suggestion_router = APIRouter(prefix="/suggestion", tags=["AI Sugession"])
 
 @suggestion_router.get("/{segment_id}", response_model=str, status_code=status.HTTP_200_OK)
@@ -20,6 +26,34 @@ async def model_sugession(segment_id: str, request_context: str, sugession_servi
         raise HTTPException(status_code=500, detail="AI 모델 응답 생성 실패")
     return result
 
+@suggestion_router.get("/{segment_id}/stream", status_code=status.HTTP_200_OK)
+async def model_sugession_stream(segment_id: str, request_context: str, sugession_service: Model = Depends(Model)):
+    """
+    제안 문장을 생성되는 대로 SSE로 전달
+
+    - token: {"text": 이번 조각}
+    - done: {"text": 전체 제안 문장}
+    - error: {"detail": 오류 메시지}
+    """
+    try:
+        req_context = EnumStatus(int(request_context)).label()
+    except (ValueError, KeyError):
+        raise HTTPException(status_code=400, detail="잘못된 request_context 값입니다.")
+
+    async def event_generator():
+        parts = []
+        try:
+            async for text in sugession_service.stream_prompt_text(segment_id, req_context):
+                parts.append(text)
+                yield {"event": "token", "data": json.dumps({"text": text}, ensure_ascii=False)}
+        except Exception as exc:
+            logger.error(f"Suggestion stream failed for {segment_id}: {exc}")
+            yield {"event": "error", "data": json.dumps({"detail": "AI 모델 응답 생성 실패"}, ensure_ascii=False)}
+            return
+        yield {"event": "done", "data": json.dumps({"text": "".join(parts)}, ensure_ascii=False)}
+
+    return EventSourceResponse(event_generator())
+
 @suggestion_router.get("/list", response_model=str, status_code=status.HTTP_200_OK)
 async def model_sugession(sugession_service: Model = Depends(Model)):
     result = await sugession_service.get_suggestion_list()
@@ -1,16 +1,10 @@
-import vertexai
-from vertexai.generative_models import GenerativeModel
-from google.oauth2 import service_account
 from bson import ObjectId
 import asyncio
 import logging
-from app.config.env import (
-    VERTEX_PROJECT_ID,
-    VERTEX_LOCATION,
-    GEMINI_MODEL_VERSION,
-    GOOGLE_APPLICATION_CREDENTIALS,
-)
+from typing import AsyncIterator
+from app.api.llm import LLMRequest, get_llm_backend
 from ..deps import DbDep
+from ..language.service import LanguageService
 from .models import SuggestionRequest, SuggestionResponse
 import datetime
 
@@ -18,119 +12,103 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def build_suggestion_prompt(
+    origin_context: str, translate_context: str, request_context: str, language_name: str
+) -> str:
+    return f"""
+            [Role]: You are a professional dubbing script editor.
+            [Original Text]: {origin_context}
+            [Translated Text]: {translate_context}
+            [Request]: {request_context}
+            [Rules]:
+            1. Do not provide any explanations, apologies, or extra text.
+            2. Respond with only the single, final, revised {language_name} script.
+            3. Do not add any text before or after the revised script.
+            4. **CRITICAL:** Your output must be the raw text of the script *only*. Do not wrap your response in quotation marks ("), apostrophes ('), asterisks (*), hyphens (-), or any other formatting characters.
+            """
+
+
+async def stream_suggestion(prompt: str) -> AsyncIterator[str]:
+    """
+    제안 문장을 생성되는 대로 조각 단위로 반환 (스트리밍 API)
+
+    완성본과 같이 앞뒤 공백/따옴표는 제거합니다. 끝의 따옴표는 마지막 조각인지
+    알 수 없으므로 다음 조각이 올 때까지 보류합니다.
+    """
+    started = False
+    pending = ""
+    async for text in get_llm_backend().stream(LLMRequest(task="suggest", prompt=prompt)):
+        if not started:
+            text = text.lstrip().lstrip('"')
+            if not text:
+                continue
+            started = True
+        text = pending + text
+        stripped = text.rstrip().rstrip('"')
+        pending = text[len(stripped) :]
+        if stripped:
+            yield stripped
+
+
 class Model:
     def __init__(self, db: DbDep):
         self.suggesion_prompt_collection = db.get_collection("suggesion_prompt")
         self.project_segemnts_collection = db.get_collection("project_segments")
         self.segment_translations_collection = db.get_collection("segment_translations")
-        self.languages_collection = db.get_collection("languages")
+        self.language_service = LanguageService(db)
+
+    async def build_prompt(self, segment_id: str, request_context: str) -> str:
+        """세그먼트 원문/번역/언어로 프롬프트 구성 (정보가 없으면 빈 문자열)"""
+        # 1단계: 필수 정보 2개를 동시에 가져오기
+        project_segment, trans_segment = await asyncio.gather(
+            self.project_segemnts_collection.find_one({"_id": ObjectId(segment_id)}),
+            self.segment_translations_collection.find_one({"segment_id": segment_id}),
+        )
 
-        sa_path = GOOGLE_APPLICATION_CREDENTIALS
-        try:
-            # 서비스 계정 키 파일 경로
-            sa_path = GOOGLE_APPLICATION_CREDENTIALS
-
-            if not all(
-                [VERTEX_PROJECT_ID, VERTEX_LOCATION, GEMINI_MODEL_VERSION, sa_path]
-            ):
-                raise ValueError(
-                    "필수 환경 변수(PROJECT_ID, LOCATION, MODEL, CREDENTIALS)가 설정되지 않았습니다."
-                )
-
-            # 2. 자격 증명(Credentials) 생성
-            credentials = service_account.Credentials.from_service_account_file(
-                sa_path, scopes=["https://www.googleapis.com/auth/cloud-platform"]
-            )
+        if not project_segment or not trans_segment:
+            logger.error("세그먼트 정보를 찾을 수 없습니다: %s", segment_id)
+            return ""
 
-            vertexai.init(
-                project=VERTEX_PROJECT_ID,
-                location=VERTEX_LOCATION,
-                credentials=credentials,
-            )
+        # 2단계: 1단계 정보를 바탕으로 언어 정보 가져오기
+        language_code = trans_segment.get("language_code")
+        language = await self.language_service.get_language_doc(language_code)
 
-            self.model = GenerativeModel(GEMINI_MODEL_VERSION)
+        if not language:
+            logger.error("언어 정보를 찾을 수 없습니다: %s", language_code)
+            return ""
 
-        except Exception as e:
-            logger.error(f"오류 발생: {e}")
+        return build_suggestion_prompt(
+            project_segment.get("source_text", ""),
+            trans_segment.get("target_text", ""),
+            request_context,
+            language.get("name_ko", ""),
+        )
 
     async def prompt_text(self, segment_id: str, request_context: str) -> str:
-        if not self.model:
-            logger.error("Gemini 모델이 초기화되지 않았습니다.")
-            return ""
-
         try:
-            # --- 1. DB 조회 병렬 처리 ---
-            # 3개의 비동기 작업을 리스트로 준비
-            tasks = [
-                self.project_segemnts_collection.find_one(
-                    {"_id": ObjectId(segment_id)}
-                ),
-                self.segment_translations_collection.find_one(
-                    {"segment_id": segment_id}
-                ),
-                # 이 언어 코드는 trans_segment가 완료되어야 알 수 있으므로,
-                # 이 방식은 적합하지 않습니다. (아래 2안 참고)
-            ]
-
-            # --- (수정) DB 호출 2단계로 병렬화 ---
-
-            # 1단계: 필수 정보 2개를 동시에 가져오기
-            tasks_step1 = [
-                self.project_segemnts_collection.find_one(
-                    {"_id": ObjectId(segment_id)}
-                ),
-                self.segment_translations_collection.find_one(
-                    {"segment_id": segment_id}
-                ),
-            ]
-
-            project_segment, trans_segment = await asyncio.gather(*tasks_step1)
-
-            if not project_segment or not trans_segment:
-                logger.error("세그먼트 정보를 찾을 수 없습니다: %s", segment_id)
+            prompt = await self.build_prompt(segment_id, request_context)
+            if not prompt:
                 return ""
 
-            # 2단계: 1단계 정보를 바탕으로 3번째 정보 가져오기
-            language_code = trans_segment.get("language_code")
-            language = await self.languages_collection.find_one(
-                {"language_code": language_code}
+            response = await get_llm_backend().generate(
+                LLMRequest(task="suggest", prompt=prompt)
             )
-
-            if not language:
-                logger.error("언어 정보를 찾을 수 없습니다: %s", language_code)
-                return ""
-            # --- 병렬 처리 완료 ---
-
-            language_name = language.get("name_ko", "")
-            origin_context = project_segment.get("source_text", "")
-            translate_context = trans_segment.get("target_text", "")
-
-            prompt = f"""
-            [Role]: You are a professional dubbing script editor.
-            [Original Text]: {origin_context}
-            [Translated Text]: {translate_context}
-            [Request]: {request_context}
-            [Rules]:
-            1. Do not provide any explanations, apologies, or extra text.
-            2. Respond with only the single, final, revised {language_name} script.
-            3. Do not add any text before or after the revised script.
-            4. **CRITICAL:** Your output must be the raw text of the script *only*. Do not wrap your response in quotation marks ("), apostrophes ('), asterisks (*), hyphens (-), or any other formatting characters.
-            """
-
-            # --- 2. 비-스트리밍 API 사용 ---
-            # (이것이 '완성된 텍스트'를 얻는 가장 빠르고 올바른 방법입니다.)
-            response = await self.model.generate_content_async(prompt)
-
-            if not response:
-                return ""
-
-            cleaned_text = response.text.strip().strip('"')
-            return cleaned_text
+            return response.strip().strip('"')
 
         except Exception as exc:
-            logger.error(f"Gemini API 또는 DB 호출 오류: {exc}", exc_info=True)
+            logger.error(f"LLM 또는 DB 호출 오류: {exc}", exc_info=True)
             return ""
 
+    async def stream_prompt_text(
+        self, segment_id: str, request_context: str
+    ) -> AsyncIterator[str]:
+        """prompt_text의 스트리밍 버전 (세그먼트 정보가 없으면 LookupError)"""
+        prompt = await self.build_prompt(segment_id, request_context)
+        if not prompt:
+            raise LookupError("세그먼트 정보를 찾을 수 없습니다.")
+        async for text in stream_suggestion(prompt):
+            yield text
+
     async def get_suggession_by_id(self, segment_id: str):
         doc = await self.suggesion_prompt_collection.find_one(
             {"$or": [{"_id": ObjectId(segment_id)}, {"segment_id": segment_id}]}
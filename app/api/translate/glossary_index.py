@@ -0,0 +1,364 @@
+"""
+프로세스 내 용어집 검색 엔진
+
+data/glossaries/*.jsonl을 기동 시 읽어 두 가지 인덱스를 만듭니다.
+
+- 용어/대체어/금지어/권장 번역을 한 번에 찾는 Aho-Corasick 자동자 (입력 길이에 선형)
+- (선택) 같은 이름의 .npy에 저장된 정규화 임베딩 - 메모리 매핑해 코사인 유사도로
+  어휘 매칭된 용어와 가까운 용어를 보강 (script/ingest.py가 생성)
+
+파일이 바뀌면 GLOSSARY_RELOAD_INTERVAL(초)마다 mtime을 확인해 다시 읽습니다.
+확인/리로드는 백그라운드 스레드에서 하고, 조회는 그동안 이전 인덱스로 응답합니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 기본값은 실행 위치와 무관하게 저장소 루트의 data/glossaries
+GLOSSARY_DIR = Path(
+    os.getenv("GLOSSARY_DIR")
+    or Path(__file__).resolve().parents[3] / "data" / "glossaries"
+)
+GLOSSARY_RELOAD_INTERVAL = float(os.getenv("GLOSSARY_RELOAD_INTERVAL", "5"))
+# 어휘 매칭 점수: 항목당 매칭 종류별 가중치
+_KIND_WEIGHTS = {"forbidden": 3.0, "term": 2.0, "alias": 1.5, "preferred": 1.0}
+MATCH_KINDS = tuple(_KIND_WEIGHTS)
+
+
+@dataclass(frozen=True)
+class GlossaryEntry:
+    index: int
+    term: str
+    preferred: str
+    aliases: Tuple[str, ...]
+    forbidden: Tuple[str, ...]
+    domain: str
+    text: str  # ingest.py와 같은 형식의 설명 문자열
+    raw: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class GlossaryMatch:
+    entry: GlossaryEntry
+    kind: str  # term | alias | forbidden | preferred
+    start: int
+    end: int
+    text: str  # 입력에서 매칭된 원래 표기
+
+
+@dataclass(frozen=True)
+class GlossaryHit:
+    entry: GlossaryEntry
+    score: float
+    matches: Tuple[GlossaryMatch, ...] = ()
+
+
+def fold(text: str) -> str:
+    """대소문자 무시 비교용 (길이가 바뀌는 문자는 그대로 두어 오프셋 유지)"""
+    return "".join(
+        lowered if len(lowered := char.lower()) == 1 else char for char in text
+    )
+
+
+def _is_word_char(char: str) -> bool:
+    # 한국어는 조사가 붙으므로 경계 검사는 영문/숫자에만 적용
+    return char.isascii() and char.isalnum()
+
+
+class PatternMatcher:
+    """Aho-Corasick 자동자 - 모든 패턴을 입력 한 번 순회로 찾음"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+        for pattern, payload in patterns:
+            self._add(fold(pattern), payload)
+        self._build()
+
+    def _add(self, pattern: str, payload: Any) -> None:
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), payload))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """(start, end, payload) - 영문/숫자 패턴은 단어 경계에서만 매칭"""
+        folded = fold(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            end = index + 1
+            for length, payload in out[state]:
+                start = end - length
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(
+                    text[start]
+                ):
+                    continue
+                if end < len(text) and _is_word_char(text[end]) and _is_word_char(
+                    text[end - 1]
+                ):
+                    continue
+                yield start, end, payload
+
+
+def _entry_text(item: Dict[str, Any]) -> str:
+    return (
+        "Term: {term} | Preferred: {pref} | Forbidden: {forb} | "
+        "Aliases: {ali} | Notes: {notes} | Examples: {ex} | Domain: {dom}"
+    ).format(
+        term=item.get("term", ""),
+        pref=item.get("preferred", ""),
+        forb=", ".join(item.get("forbidden", [])),
+        ali=", ".join(item.get("aliases", [])),
+        notes=item.get("notes", ""),
+        ex="; ".join(item.get("examples", [])),
+        dom=item.get("domain", ""),
+    )
+
+
+def _clean(values: Iterable[Any]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(str(v).strip() for v in values if str(v).strip()))
+
+
+class GlossaryIndex:
+    """로드된 용어집 스냅샷 (불변, 리로드 시 새 인스턴스로 교체)"""
+
+    def __init__(
+        self,
+        entries: List[GlossaryEntry],
+        embeddings: Optional[np.ndarray] = None,
+    ):
+        self.entries = entries
+        # 행 i = entries[i]의 정규화 임베딩 (없으면 어휘 매칭만 사용)
+        self.embeddings = embeddings
+        patterns = []
+        for entry in entries:
+            patterns.append((entry.term, (entry.index, "term")))
+            patterns.extend((alias, (entry.index, "alias")) for alias in entry.aliases)
+            patterns.extend((bad, (entry.index, "forbidden")) for bad in entry.forbidden)
+            if entry.preferred:
+                patterns.append((entry.preferred, (entry.index, "preferred")))
+        self.matcher = PatternMatcher(patterns)
+
+    def match(self, text: str) -> List[GlossaryMatch]:
+        """입력에 등장하는 모든 용어집 표현 (등장 순서)"""
+        return [
+            GlossaryMatch(self.entries[index], kind, start, end, text[start:end])
+            for start, end, (index, kind) in self.matcher.iter_matches(text)
+        ]
+
+    def search(self, text: str, top_k: int = 5) -> List[GlossaryHit]:
+        """어휘 매칭 점수 순 top-k, 남는 자리는 임베딩 이웃으로 보강"""
+        by_entry: Dict[int, List[GlossaryMatch]] = {}
+        for match in self.match(text):
+            by_entry.setdefault(match.entry.index, []).append(match)
+
+        hits = []
+        for index, matches in by_entry.items():
+            kinds = {match.kind for match in matches}
+            score = sum(_KIND_WEIGHTS[kind] for kind in kinds)
+            hits.append(GlossaryHit(self.entries[index], score, tuple(matches)))
+        hits.sort(key=lambda hit: (-hit.score, hit.entry.index))
+        hits = hits[:top_k]
+
+        if len(hits) < top_k and hits and self.embeddings is not None:
+            seen = {hit.entry.index for hit in hits}
+            query = self.embeddings[[hit.entry.index for hit in hits]].mean(axis=0)
+            for index, similarity in self.nearest(query, top_k + len(seen)):
+                if index in seen:
+                    continue
+                hits.append(GlossaryHit(self.entries[index], similarity))
+                if len(hits) >= top_k:
+                    break
+        return hits
+
+    def nearest(self, vector: np.ndarray, top_k: int) -> List[Tuple[int, float]]:
+        """코사인 유사도 top-k (entry index, score)"""
+        if self.embeddings is None or not len(self.entries):
+            return []
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0:
+            return []
+        scores = self.embeddings @ (vector / norm)
+        top_k = min(top_k, len(scores))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        return [(int(index), float(scores[index])) for index in best]
+
+
+def _load_file(path: Path, start: int) -> Tuple[List[GlossaryEntry], Optional[np.ndarray]]:
+    entries: List[GlossaryEntry] = []
+    rows: List[int] = []
+    with path.open("r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as exc:
+                logger.warning(f"Skip invalid glossary line {path.name}:{line_no + 1}: {exc}")
+                continue
+            term = str(item.get("term") or "").strip()
+            if not term:
+                continue
+            rows.append(line_no)
+            entries.append(
+                GlossaryEntry(
+                    index=start + len(entries),
+                    term=term,
+                    preferred=str(item.get("preferred") or "").strip(),
+                    aliases=_clean(item.get("aliases") or []),
+                    forbidden=_clean(item.get("forbidden") or []),
+                    domain=str(item.get("domain") or ""),
+                    text=_entry_text(item),
+                    raw=item,
+                )
+            )
+
+    embeddings = None
+    npy_path = path.with_suffix(".npy")
+    if npy_path.exists():
+        matrix = np.load(npy_path, mmap_mode="r")
+        # ingest.py는 jsonl 줄 순서대로 임베딩을 저장
+        if matrix.ndim == 2 and matrix.shape[0] > max(rows, default=-1):
+            embeddings = np.asarray(matrix[rows], dtype=np.float32)
+        else:
+            logger.warning(
+                f"Ignore {npy_path.name}: shape {matrix.shape} does not match {path.name}"
+            )
+    return entries, embeddings
+
+
+def load_glossary_index(directory: Path = GLOSSARY_DIR) -> GlossaryIndex:
+    entries: List[GlossaryEntry] = []
+    matrices: List[Optional[np.ndarray]] = []
+    for path in sorted(directory.glob("*.jsonl")):
+        file_entries, embeddings = _load_file(path, len(entries))
+        entries.extend(file_entries)
+        matrices.append(embeddings)
+
+    # 모든 파일에 같은 차원의 임베딩이 있을 때만 벡터 인덱스 사용
+    embeddings = None
+    if matrices and all(m is not None for m in matrices):
+        if len({m.shape[1] for m in matrices}) == 1:
+            embeddings = np.vstack(matrices) if len(matrices) > 1 else matrices[0]
+    return GlossaryIndex(entries, embeddings)
+
+
+class GlossaryEngine:
+    """현재 용어집 인덱스 보관 + 파일 변경 시 리로드"""
+
+    def __init__(self, directory: Path = GLOSSARY_DIR):
+        self.directory = directory
+        self._index: Optional[GlossaryIndex] = None
+        self._signature: Tuple[Tuple[str, int, int], ...] = ()
+        self._checked_at = 0.0
+        # load()는 워커 스레드(warm-up/리로드)에서만 경합하므로 이벤트 루프를 막지 않음
+        self._lock = threading.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _file_signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        signature = []
+        for pattern in ("*.jsonl", "*.npy"):
+            for path in self.directory.glob(pattern):
+                stat = path.stat()
+                signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(signature))
+
+    def load(self) -> GlossaryIndex:
+        with self._lock:
+            signature = self._file_signature()
+            if self._index is None or signature != self._signature:
+                started = time.perf_counter()
+                self._index = load_glossary_index(self.directory)
+                self._signature = signature
+                logger.info(
+                    f"Glossary index loaded: {len(self._index.entries)} entries, "
+                    f"vectors={'yes' if self._index.embeddings is not None else 'no'} "
+                    f"({(time.perf_counter() - started) * 1000:.1f} ms)"
+                )
+            self._checked_at = time.monotonic()
+            return self._index
+
+    def _refresh(self) -> None:
+        try:
+            self.load()
+        except Exception as exc:
+            # 파일 교체 중, 잘못된 JSON 등 어떤 오류든 이전 인덱스로 계속 응답
+            logger.warning(f"Glossary reload failed, keeping previous index: {exc}")
+            self._checked_at = time.monotonic()
+
+    def index(self) -> GlossaryIndex:
+        """
+        현재 인덱스 스냅샷
+
+        GLOSSARY_RELOAD_INTERVAL이 지나면 리로드 확인을 백그라운드로 넘기고 바로 반환합니다.
+        인덱스가 아직 없을 때(warm-up 전 첫 조회)만 동기로 로드합니다.
+        """
+        index = self._index
+        if index is None:
+            return self.load()
+        if time.monotonic() - self._checked_at <= GLOSSARY_RELOAD_INTERVAL:
+            return index
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return index
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖(스크립트, to_thread 안)에서는 그 자리에서 확인
+            self._refresh()
+            return self._index
+        self._refresh_task = loop.create_task(asyncio.to_thread(self._refresh))
+        return index
+
+
+glossary_engine = GlossaryEngine()
+
+
+async def warm_up_glossary() -> None:
+    """기동 시 용어집 인덱스 미리 로드 (실패해도 첫 조회에서 다시 시도)"""
+    try:
+        await asyncio.to_thread(glossary_engine.load)
+    except Exception as exc:
+        logger.warning(f"Glossary warm-up failed: {exc}")
@@ -1,25 +1,21 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
 import os
 from functools import lru_cache
-from typing import Any, List, Sequence
+from typing import Any, Sequence
 
-import google.auth
-import httpx
 from dotenv import load_dotenv
-from google.auth.transport.requests import Request
-from .utils import RetrievedDoc
+
+from app.api.llm import LLMRequest, get_llm_backend
+
+from .utils import RetrievedDoc, vector_search
 
 load_dotenv()
 
 GEMINI_MODEL_DEFAULT = "gemini-2.5-flash"
 GEMINI_MODEL_ENV = "GEMINI_MODEL"
-GEMINI_PROJECT_ENV = "GCP_PROJECT"
-GEMINI_LOCATION_ENV = "GCP_LOCATION"
-GEMINI_LOCATION_DEFAULT = "us-central1"
 
 
 def _format_glossary(doc: RetrievedDoc) -> str:
@@ -63,8 +59,12 @@ Guidelines:
     def build_glossary_context(
         self, source_text: str, draft_translation: str, top_glossary: int
     ) -> str:
-        # TODO: glossary vector search 비활성화
-        return "자료 없음"
+        hits = vector_search(
+            f"{source_text.strip()}\n\n{draft_translation.strip()}", top_glossary
+        )
+        if not hits:
+            return "자료 없음"
+        return "\n\n".join(_format_glossary(hit) for hit in hits)
 
     async def correct(
         self,
@@ -87,15 +87,15 @@ Guidelines:
             f"{context}"
         )
 
-        messages = [
-            {"role": "system", "content": self.SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ]
-
-        response = await call_gemini(
-            messages,
-            model=model or os.getenv(GEMINI_MODEL_ENV, GEMINI_MODEL_DEFAULT),
-            temperature=temperature,
+        response = await call_llm_json(
+            LLMRequest(
+                task="correct",
+                system=self.SYSTEM_PROMPT,
+                prompt=user_prompt,
+                model=model or os.getenv(GEMINI_MODEL_ENV, GEMINI_MODEL_DEFAULT),
+                temperature=temperature,
+                json_output=True,
+            )
         )
 
         corrected_text = response.get("corrected_text", draft_translation)
@@ -135,84 +135,86 @@ Guidelines:
             "notes": notes,
         }
 
+    BATCH_SYSTEM_PROMPT = (
+        SYSTEM_PROMPT.split("Output ONLY JSON:")[0]
+        + """Each input item has an id, a SOURCE and a DRAFT. Correct every item independently.
 
-async def call_gemini(
-    messages: Sequence[dict[str, Any]],
-    *,
-    model: str,
-    temperature: float,
-) -> dict[str, Any]:
-    project = os.getenv(GEMINI_PROJECT_ENV)
-    if not project:
-        raise EnvironmentError("GCP_PROJECT must be set for Gemini calls.")
-    location = os.getenv(GEMINI_LOCATION_ENV, GEMINI_LOCATION_DEFAULT)
-    model_name = model or GEMINI_MODEL_DEFAULT
-
-    credentials, _ = google.auth.default(
-        scopes=["https://www.googleapis.com/auth/cloud-platform"]
-    )
-    req = Request()
-    loop = asyncio.get_running_loop()
-
-    def _refresh() -> None:
-        credentials.refresh(req)
-
-    await loop.run_in_executor(None, _refresh)
-    if not credentials.token:
-        raise RuntimeError("Failed to obtain access token for Gemini call.")
-
-    system_parts: List[dict[str, str]] = []
-    contents: List[dict[str, Any]] = []
-    for msg in messages:
-        role = msg.get("role", "user")
-        content = str(msg.get("content", "")).strip()
-        if not content:
-            continue
-        if role == "system":
-            system_parts.append({"text": content})
-        elif role == "assistant":
-            contents.append({"role": "model", "parts": [{"text": content}]})
-        else:
-            contents.append({"role": "user", "parts": [{"text": content}]})
-
-    if not contents:
-        raise ValueError("Gemini call requires at least one non-system message.")
-
-    payload: dict[str, Any] = {
-        "contents": contents,
-        "generationConfig": {
-            "responseMimeType": "application/json",
-        },
+Output ONLY JSON:
+{
+  "results": [
+    {
+      "id": "<입력 id 그대로>",
+      "corrected_text": "<최종 교정 문장 전체>",
+      "message": "<LLM 교정 결과 메시지>",
+      "notes": "<추가 메모, 필요 없으면 빈 문자열>"
     }
-    if temperature:
-        payload["generationConfig"]["temperature"] = float(temperature)
-    if system_parts:
-        payload["systemInstruction"] = {"role": "system", "parts": system_parts}
-
-    endpoint = (
-        f"https://{location}-aiplatform.googleapis.com/v1/projects/"
-        f"{project}/locations/{location}/publishers/google/models/"
-        f"{model_name}:generateContent"
+  ]
+}
+
+Guidelines:
+- 입력 항목마다 결과를 정확히 하나씩, id를 바꾸지 말고 반환한다.
+- `message`는 교정한 결과 기반의 수정 이유와 변경사항을 명사형으로 짧게 작성한다.
+- 응답은 반드시 유효한 JSON이어야 한다."""
     )
-    headers = {
-        "Authorization": f"Bearer {credentials.token}",
-        "Content-Type": "application/json",
-    }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.post(endpoint, headers=headers, json=payload)
-        resp.raise_for_status()
-        data = resp.json()
-
-    candidates = data.get("candidates") or []
-    if not candidates:
-        raise ValueError(f"Gemini returned no candidates: {data}")
-    parts = candidates[0].get("content", {}).get("parts", [])
-    if not parts:
-        raise ValueError(f"Gemini response missing parts: {data}")
-    text = parts[0].get("text", "")
-    json_text = _extract_json_block(text)
-    return json.loads(json_text)
+    async def correct_batch(
+        self,
+        items: Sequence[dict[str, str]],
+        *,
+        model: str | None = None,
+        temperature: float = 0.1,
+        top_glossary: int = 5,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        여러 세그먼트를 한 번의 호출로 교정
+
+        items: [{"id", "source", "draft"}, ...]
+        반환: {id: {"corrected_text", "message", "notes"}} (응답에 없는 id는 제외)
+        """
+        # 항목별 용어집 검색 결과를 합쳐 한 번만 프롬프트에 포함
+        glossary: dict[str, RetrievedDoc] = {}
+        for item in items:
+            query = f"{item['source'].strip()}\n\n{item['draft'].strip()}"
+            for hit in vector_search(query, top_glossary):
+                glossary.setdefault(hit.raw.get("term", hit.text), hit)
+        context = (
+            "\n\n".join(_format_glossary(hit) for hit in glossary.values())
+            or "자료 없음"
+        )
+        inputs = "\n\n".join(
+            f"[ITEM id={item['id']}]\n"
+            f"[SOURCE]\n{item['source'].strip()}\n"
+            f"[DRAFT]\n{item['draft'].strip()}"
+            for item in items
+        )
+        response = await call_llm_json(
+            LLMRequest(
+                task="correct_batch",
+                system=self.BATCH_SYSTEM_PROMPT,
+                prompt=f"{inputs}\n\n[GLOSSARY]\n{context}",
+                model=model or os.getenv(GEMINI_MODEL_ENV, GEMINI_MODEL_DEFAULT),
+                temperature=temperature,
+                json_output=True,
+            )
+        )
+
+        requested = {str(item["id"]) for item in items}
+        results: dict[str, dict[str, Any]] = {}
+        for result in response.get("results") or []:
+            if not isinstance(result, dict) or str(result.get("id")) not in requested:
+                continue
+            results[str(result["id"])] = {
+                "corrected_text": result.get("corrected_text", ""),
+                "message": result.get("message", ""),
+                "notes": result.get("notes", ""),
+            }
+        return results
+
+
+async def call_llm_json(request: LLMRequest) -> dict[str, Any]:
+    """설정된 LLM 백엔드 호출 후 응답의 JSON 객체 파싱"""
+    text = await get_llm_backend().generate(request)
+    return json.loads(_extract_json_block(text))
 
 
 def _extract_json_block(text: str) -> str:
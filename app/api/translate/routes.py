@@ -5,7 +5,7 @@ from bson.errors import InvalidId
 from fastapi import HTTPException, status
 
 from ..deps import DbDep
-from .service import glosary_suggestion
+from .service import glosary_suggestion, suggestion_by_project
 
 trans_router = APIRouter(prefix="/trans", tags=["translate"])
 
@@ -14,7 +14,7 @@ trans_router = APIRouter(prefix="/trans", tags=["translate"])
 async def test_set_seg(db: DbDep):
     await db["segments"].insert_one(
         {
-            "project_id": ObjectId("69083650141e52c49d637523"),
+            "project_id": "69083650141e52c49d637523",
             "segment_text": "The new graphics card launch was insane, no way! Oh my gosh, Rosie, your album finally dropped on Jimmy Fallon's show",
             "translate_context": "새 지피유 는 미쳤어, 길이없다! 오 마이 갓, 로지 너의 앨범이 드디어 지미펠런의 쇼에 떨어졌어",
         }
@@ -34,3 +34,20 @@ async def get_glosary_suggestion(db: DbDep, segment_id: str):
     review = await glosary_suggestion(db, segment_oid)
 
     return {"segment_id": str(segment_oid), "review": review}
+
+
+@trans_router.post(
+    "/projects/{project_id}/glossary-suggestion",
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_project_glossary_suggestion(db: DbDep, project_id: str):
+    """용어집 표현이 있는 세그먼트만 골라 백그라운드에서 교정 제안 (progress 이벤트로 진행 전달)"""
+    try:
+        project_ref = str(ObjectId(project_id))
+    except InvalidId as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid project_id",
+        ) from exc
+
+    return await suggestion_by_project(db, project_ref)
@@ -1,87 +1,104 @@
-import re
 from dotenv import load_dotenv
 from datetime import datetime
 from fastapi import HTTPException, status
-from bson import ObjectId
-from bson.errors import InvalidId
 from .rag import rag_glossary_correction
+from .glossary_index import GlossaryMatch, fold, glossary_engine
+from .suggestion_job import start_project_suggestion
 from .utils import vector_search
 
 from ..deps import DbDep
+from ..repositories import IssueRepository
 
 load_dotenv()
 
 
 def detect_glossary_issues(source: str, mt: str, top_k: int = 5):
-    query = f"{source.strip()}\n\n{mt.strip()}"
-    hits = vector_search(query, top_k)
-
-    issues: list[str] = []
-    suggestion = mt
-
-    for hit in hits:
-        raw = hit.raw
-        preferred = (raw.get("preferred") or "").strip()
-        term = (raw.get("term") or "").strip()
-        aliases = [a.strip() for a in raw.get("aliases", []) if a.strip()]
-        forbidden = [w.strip() for w in raw.get("forbidden", []) if w.strip()]
-
-        # 금지어 체크
-        for bad in forbidden:
-            if not bad:
+    """
+    번역문의 금지어/대체어를 용어집 기준으로 교정
+
+    용어집 버전마다 한 번 컴파일된 자동자(glossary_index.py)로 번역문을 한 번 훑어
+    모든 등장 위치를 찾고, 치환은 겹치지 않는 구간만 골라 한 번에 적용합니다.
+    top_k는 반환하는 hits 수 (source + mt 기준 검색 결과)입니다.
+    """
+    index = glossary_engine.index()
+    by_entry: dict[int, list[GlossaryMatch]] = {}
+    for match in index.match(mt):
+        by_entry.setdefault(match.entry.index, []).append(match)
+
+    issues: list[dict] = []
+    replacements: list[tuple[int, int, str]] = []
+
+    for matches in by_entry.values():
+        entry = matches[0].entry
+        preferred = entry.preferred
+        replacement = preferred or entry.term
+
+        # 금지어 체크 (금지어별 이슈 1건, 모든 등장 위치 치환)
+        forbidden_found: dict[str, list[GlossaryMatch]] = {}
+        for match in matches:
+            if match.kind == "forbidden":
+                forbidden_found.setdefault(match.text, []).append(match)
+        for bad, occurrences in forbidden_found.items():
+            replacements.extend((m.start, m.end, replacement) for m in occurrences)
+            if replacement:
+                message = f"금지어 '{bad}' → '{replacement}' 교정"
+            else:
+                message = f"금지어 '{bad}' 제거"
+            issues.append(
+                {"message": message, "from": bad, "to": replacement, "kind": "forbidden"}
+            )
+
+        # 권장 용어 치환 (권장어가 이미 있거나 금지어 교정으로 들어가면 생략)
+        if not preferred or forbidden_found:
+            continue
+        if any(match.kind == "preferred" for match in matches):
+            continue
+        found = {fold(m.text): m for m in matches if m.kind in ("alias", "term")}
+        for alias in (*entry.aliases, entry.term):
+            if fold(alias) not in found:
                 continue
-            if bad in suggestion:
-                replacement = preferred or term or ""
-                if replacement:
-                    suggestion = suggestion.replace(bad, replacement)
-                    issues.append(
-                        {
-                            "message": f"금지어 '{bad}' → '{replacement}' 교정",
-                            "from": bad,
-                            "to": replacement,
-                            "kind": "forbidden",
-                        }
-                    )
-                else:
-                    issues.append(
-                        {
-                            "message": f"금지어 '{bad}' 제거",
-                            "from": bad,
-                            "to": "",
-                            "kind": "forbidden",
-                        }
-                    )
-
-        # 권장 용어 치환
-        if preferred and preferred not in suggestion:
-            for alias in aliases + [term]:
-                if alias and re.search(rf"\b{re.escape(alias)}\b", suggestion):
-                    suggestion = re.sub(
-                        rf"\b{re.escape(alias)}\b", preferred, suggestion
-                    )
-                    issues.append(
-                        {
-                            "message": f"'{alias}' 대신 '{preferred}' 권장",
-                            "from": alias,
-                            "to": preferred,
-                            "kind": "preferred",
-                        }
-                    )
-                    break
-
-    return {"issues": issues, "suggestion": suggestion, "hits": hits}
+            occurrences = [
+                m
+                for m in matches
+                if m.kind in ("alias", "term") and fold(m.text) == fold(alias)
+            ]
+            replacements.extend((m.start, m.end, preferred) for m in occurrences)
+            issues.append(
+                {
+                    "message": f"'{alias}' 대신 '{preferred}' 권장",
+                    "from": alias,
+                    "to": preferred,
+                    "kind": "preferred",
+                }
+            )
+            break
+
+    return {
+        "issues": issues,
+        "suggestion": _apply_replacements(mt, replacements),
+        "hits": vector_search(f"{source.strip()}\n\n{mt.strip()}", top_k),
+    }
+
+
+def _apply_replacements(text: str, replacements: list[tuple[int, int, str]]) -> str:
+    """겹치지 않는 (start, end, 대체어) 구간을 앞에서부터 한 번에 치환 (겹치면 긴 쪽 우선)"""
+    parts: list[str] = []
+    cursor = 0
+    for start, end, replacement in sorted(
+        replacements, key=lambda item: (item[0], item[0] - item[1])
+    ):
+        if start < cursor:
+            continue
+        parts.append(text[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
 
 
 async def suggestion_by_project(db, project_id: str):
-    # 1) 프로젝트의 세그먼트 찾기
-    try:
-        project_oid = ObjectId(project_id)
-    except InvalidId:
-        project_oid = project_id  # 이미 문자열로 저장된 경우 그대로 사용
-
-    cursor = db["segments"].find({"project_id": project_oid})
-    async for segment in cursor:
-        await glosary_suggestion(db, segment["_id"])
+    """프로젝트 전체 용어 교정 제안을 백그라운드 job으로 시작 (suggestion_job.py)"""
+    return await start_project_suggestion(db, project_id)
 
 
 async def glosary_suggestion(db: DbDep, segment_oid: str):
@@ -105,7 +122,7 @@ async def glosary_suggestion(db: DbDep, segment_oid: str):
     )
     review["checked_at"] = datetime.now().isoformat() + "Z"
 
-    await db["issues"].insert_one(
+    await IssueRepository(db).insert_one(
         {
             "segment_id": segment_oid,
             "message": review.get("message", ""),
@@ -0,0 +1,166 @@
+"""
+프로젝트 전체 용어 교정 제안 job
+
+세그먼트를 한 번에 읽어 로컬 용어집 매칭으로 후보(용어집 표현이 등장하는 세그먼트)만
+고른 뒤, SUGGESTION_BATCH_SIZE개씩 묶은 프롬프트로 동시에(SUGGESTION_CONCURRENCY)
+LLM 교정을 요청합니다. 결과 이슈는 배치마다 insert_many로 저장하고,
+진행 상황은 progress 토픽의 "glossary-suggestion" 이벤트로 전달됩니다.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.api.progress.dispatcher import broadcast_progress_event
+from app.api.progress.models import ProgressEventType, TaskStatus
+
+from ..repositories import IssueRepository, LegacySegmentRepository
+from .glossary_index import glossary_engine
+from .rag import _get_corrector
+
+logger = logging.getLogger(__name__)
+
+SUGGESTION_BATCH_SIZE = int(os.getenv("GLOSSARY_SUGGESTION_BATCH_SIZE", "10"))
+SUGGESTION_CONCURRENCY = int(os.getenv("GLOSSARY_SUGGESTION_CONCURRENCY", "4"))
+
+_running: Dict[str, asyncio.Task] = {}
+
+
+def select_candidates(segments: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """원문/번역이 있고 용어집 표현이 등장하는 세그먼트만 LLM 입력 형태로 반환"""
+    index = glossary_engine.index()
+    candidates = []
+    for segment in segments:
+        source = (segment.get("segment_text") or "").strip()
+        draft = (segment.get("translate_context") or "").strip()
+        if not source or not draft:
+            continue
+        if index.match(source) or index.match(draft):
+            candidates.append({"id": str(segment["_id"]), "source": source, "draft": draft})
+    return candidates
+
+
+async def start_project_suggestion(
+    db: AsyncIOMotorDatabase, project_id: str
+) -> Dict[str, Any]:
+    """후보 세그먼트를 고른 뒤 백그라운드 교정 시작"""
+    task = _running.get(project_id)
+    if task is not None and not task.done():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Glossary suggestion for this project is already running",
+        )
+
+    segments = await LegacySegmentRepository(db).find(
+        {"project_id": project_id},
+        {"segment_text": 1, "translate_context": 1},
+    ).to_list(length=None)
+    candidates = select_candidates(segments)
+    batches = [
+        candidates[i : i + SUGGESTION_BATCH_SIZE]
+        for i in range(0, len(candidates), SUGGESTION_BATCH_SIZE)
+    ]
+
+    if batches:
+        task = asyncio.create_task(
+            _run_project_suggestion(db, project_id, batches),
+            name=f"glossary-suggestion:{project_id}",
+        )
+        _running[project_id] = task
+        task.add_done_callback(lambda _: _running.pop(project_id, None))
+
+    return {
+        "project_id": project_id,
+        "status": "queued" if batches else "completed",
+        "total_segments": len(segments),
+        "candidate_segments": len(candidates),
+    }
+
+
+async def stop_project_suggestions() -> None:
+    """종료 시 진행 중인 job 취소"""
+    tasks = list(_running.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _run_project_suggestion(
+    db: AsyncIOMotorDatabase, project_id: str, batches: List[List[Dict[str, str]]]
+) -> None:
+    issues = IssueRepository(db)
+    semaphore = asyncio.Semaphore(SUGGESTION_CONCURRENCY)
+    total = sum(len(batch) for batch in batches)
+    counts = {"checked": 0, "failed": 0, "issues": 0}
+
+    async def _publish(
+        task_status: TaskStatus, message: Optional[str] = None, **extra: Any
+    ) -> None:
+        await broadcast_progress_event(
+            ProgressEventType.GLOSSARY_SUGGESTION,
+            project_id,
+            status=task_status,
+            progress=int((counts["checked"] + counts["failed"]) / total * 100),
+            message=message,
+            metadata={"total": total, **counts, **extra},
+        )
+
+    async def _run_batch(batch: List[Dict[str, str]]) -> None:
+        async with semaphore:
+            try:
+                results = await corrector.correct_batch(batch)
+            except Exception as exc:
+                logger.error(f"Glossary suggestion batch failed for {project_id}: {exc}")
+                counts["failed"] += len(batch)
+                await _publish(TaskStatus.PROCESSING)
+                return
+
+        now = datetime.now()
+        docs = [
+            {
+                "segment_id": item["id"],
+                "message": result.get("message", ""),
+                "recommend_text": result.get("corrected_text", ""),
+                "kind": "LLM 교정",
+                "created_at": now,
+            }
+            for item in batch
+            if (result := results.get(item["id"]))
+            # 고칠 것이 없다고 판단한 세그먼트는 이슈를 남기지 않음
+            and result.get("corrected_text")
+            and result["corrected_text"].strip() != item["draft"]
+        ]
+        if docs:
+            await issues.insert_many(docs)
+        counts["checked"] += len(batch)
+        counts["issues"] += len(docs)
+        await _publish(TaskStatus.PROCESSING)
+
+    await _publish(TaskStatus.PROCESSING)
+    try:
+        corrector = _get_corrector()
+        # 실패 이벤트 뒤에 다른 배치의 진행 이벤트가 오지 않도록 모든 배치를 기다린 뒤 판정
+        outcomes = await asyncio.gather(
+            *(_run_batch(batch) for batch in batches), return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        logger.error(f"Glossary suggestion failed for {project_id}: {exc}")
+        await _publish(TaskStatus.FAILED, message=f"교정 제안 실패: {exc}", error=str(exc))
+        return
+
+    # 일부 배치만 실패해도 job은 끝난 것으로 보고 실패 수는 metadata로 전달
+    await _publish(
+        TaskStatus.COMPLETED,
+        message=f"세그먼트 {counts['failed']}개 교정 실패" if counts["failed"] else None,
+    )
+    logger.info(f"Glossary suggestion done for {project_id}: {counts}")
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Any, List
 
+from .glossary_index import glossary_engine
+
 
 @dataclass
 class RetrievedDoc:
@@ -11,5 +13,8 @@ class RetrievedDoc:
 
 
 def vector_search(query: str, top_k: int = 5) -> List[RetrievedDoc]:
-    """Glossary vector search disabled."""
-    return []
+    """용어집 검색 (어휘 매칭 + 임베딩 이웃 보강, glossary_index.py)"""
+    return [
+        RetrievedDoc(kind="glossary", text=hit.entry.text, raw=hit.entry.raw, score=hit.score)
+        for hit in glossary_engine.index().search(query, top_k)
+    ]
@@ -47,7 +47,9 @@ from .utils import (
     ffprobe_duration,
     MAX_DURATION,
 )
+from app.config.db import for_listing
 from app.config.s3 import s3
+from ..events import event_bus, EventTopic
 import logging
 
 logger = logging.getLogger(__name__)
@@ -55,6 +57,7 @@ voice_samples_router = APIRouter(prefix="/voice-samples", tags=["Voice Samples"]
 
 AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET")
 AWS_REGION = os.getenv("AWS_REGION", "ap-northeast-2")
+VOICE_SAMPLE_HEARTBEAT_INTERVAL = 15  # 초
 
 SERVICE_INTRO_SCRIPT = {
     "ko": "안녕하세요. AI 음성 합성 서비스를 소개합니다. 이 서비스를 통해 여러분의 목소리로 다양한 콘텐츠를 제작할 수 있습니다.",
@@ -395,7 +398,7 @@ async def list_voice_samples(
     current_user: Optional[UserOut] = Depends(get_current_user_from_cookie),
 ):
     """음성 샘플 목록 조회"""
-    service = VoiceSampleService(db)
+    service = VoiceSampleService(for_listing(db))
     samples, total = await service.list_voice_samples(
         current_user=current_user,
         q=q,
@@ -468,43 +471,66 @@ def _serialize_datetime(obj: Any) -> Any:
 
 @voice_samples_router.get("/{sample_id}/stream", summary="음성 샘플 상태 실시간 스트림")
 async def stream_voice_sample_status(sample_id: str, db: DbDep):
-    """SSE를 통해 음성 샘플의 audio_sample_url 업데이트를 실시간으로 스트리밍합니다."""
+    """SSE를 통해 음성 샘플의 audio_sample_url 업데이트를 실시간으로 스트리밍합니다.
+
+    최초 1회만 DB에서 현재 상태를 조회하고, 이후에는 잡 콜백이 이벤트 버스에
+    발행하는 voice-sample 이벤트를 기다립니다.
+    """
 
     async def event_stream():
         service = VoiceSampleService(db)
+        # 조회와 콜백 사이의 이벤트를 놓치지 않도록 DB 조회 전에 구독
+        # (제너레이터 안에서 구독해야 시작 전 연결 종료 시에도 구독이 남지 않음)
+        subscription = event_bus.subscribe([EventTopic.VOICE_SAMPLE], [sample_id])
         try:
+            # 현재 상태 조회 (연결당 1회)
+            try:
+                sample = await service.get_voice_sample(sample_id, None)
+                data = {
+                    "sample_id": str(sample.sample_id),
+                    "audio_sample_url": sample.audio_sample_url,
+                    "has_audio_sample": sample.audio_sample_url is not None,
+                }
+                # datetime 객체를 문자열로 변환
+                data = _serialize_datetime(data)
+
+                yield f"data: {json.dumps(data)}\n\n"
+
+                # 이미 audio_sample_url이 채워져 있으면 종료
+                if sample.audio_sample_url:
+                    return
+
+            except HTTPException as e:
+                if e.status_code == 404:
+                    error_data = {"error": "Voice sample not found"}
+                    yield f"data: {json.dumps(error_data)}\n\n"
+                    return
+                raise
+
+            # 처리 완료/실패 이벤트 대기
             while True:
-                # voice_sample 조회
                 try:
-                    sample = await service.get_voice_sample(sample_id, None)
-                    data = {
-                        "sample_id": str(sample.sample_id),
-                        "audio_sample_url": sample.audio_sample_url,
-                        "has_audio_sample": sample.audio_sample_url is not None,
-                    }
-                    # datetime 객체를 문자열로 변환
-                    data = _serialize_datetime(data)
-
-                    yield f"data: {json.dumps(data)}\n\n"
-
-                    # audio_sample_url이 채워지면 종료
-                    if sample.audio_sample_url:
-                        break
-
-                except HTTPException as e:
-                    if e.status_code == 404:
-                        error_data = {"error": "Voice sample not found"}
-                        yield f"data: {json.dumps(error_data)}\n\n"
-                        break
-                    raise
-
-                # 2초마다 폴링
-                await asyncio.sleep(2)
+                    envelope = await asyncio.wait_for(
+                        subscription.get(), timeout=VOICE_SAMPLE_HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    # 연결 유지를 위한 SSE 코멘트
+                    yield ": heartbeat\n\n"
+                    continue
+
+                data = envelope["data"]
+                yield f"data: {json.dumps(data)}\n\n"
+
+                # audio_sample_url이 채워지거나 실패하면 종료
+                if data.get("has_audio_sample") or data.get("error"):
+                    break
 
         except Exception as e:
             # 에러 발생 시 클라이언트에 에러 메시지 전송
             error_data = {"error": str(e), "timestamp": datetime.now().isoformat()}
             yield f"data: {json.dumps(error_data)}\n\n"
+        finally:
+            event_bus.unsubscribe(subscription)
 
     return StreamingResponse(
         event_stream(),
@@ -1,20 +1,82 @@
 import os, json
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from importlib.util import find_spec
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
 from dotenv import load_dotenv
-from typing import AsyncGenerator
-from typing import AsyncGenerator
+from pymongo import ReadPreference
+from typing import Any, AsyncGenerator, List, TypeVar
+
+from app.config.db_monitoring import command_listener, pool_listener
+from app.config.indexes import reconcile_indexes
+from app.config.migrations import backfill_reference_ids
+from app.api.project.summary import backfill_project_summaries
 
 
 load_dotenv()
 
+# 압축 방식별로 필요한 패키지 (zlib은 표준 라이브러리)
+_COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": None}
+
+# 목록 화면처럼 약간 늦은 데이터가 허용되는 조회는 읽기 복제본으로 분산
+_READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+LISTING_READ_PREFERENCE = _READ_PREFERENCES[
+    os.getenv("MONGO_LISTING_READ_PREFERENCE", "secondaryPreferred")
+]
+
+_Target = TypeVar("_Target", AsyncIOMotorDatabase, AsyncIOMotorCollection)
+
+
+def available_compressors(names: str) -> List[str]:
+    """설정된 압축 방식 중 현재 환경에서 쓸 수 있는 것만 (서버와 협상해 첫 번째 사용)"""
+    available = []
+    for name in (part.strip() for part in names.split(",")):
+        if name not in _COMPRESSOR_MODULES:
+            continue
+        module = _COMPRESSOR_MODULES[name]
+        if module is None or find_spec(module) is not None:
+            available.append(name)
+    return available
 
-def make_db():
+
+def mongo_client_options(app_name: str) -> dict[str, Any]:
+    """커넥션 풀/재시도/압축/모니터링 공통 옵션 (환경변수로 조정)"""
+    options: dict[str, Any] = {
+        "appname": app_name,
+        "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+        "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+        "maxIdleTimeMS": int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000")),
+        "maxConnecting": int(os.getenv("MONGO_MAX_CONNECTING", "2")),
+        # 풀이 포화되면 무한 대기 대신 빠르게 실패시켜 메트릭에 드러나게 함
+        "waitQueueTimeoutMS": int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000")),
+        "retryReads": True,
+        "event_listeners": [command_listener, pool_listener],
+    }
+    compressors = available_compressors(
+        os.getenv("MONGO_COMPRESSORS", "zstd,snappy,zlib")
+    )
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    return options
+
+
+def make_db(app_name: str = "dupilot-api", **overrides: Any) -> AsyncIOMotorDatabase:
+    """프로세스당 한 번 생성해 재사용 (overrides로 풀 크기 등 개별 조정)"""
     env = os.getenv("APP_ENV", "dev")
     dbname = os.getenv("DB_NAME", "dupilot")
+    options = {**mongo_client_options(app_name), **overrides}
 
     if env == "dev":
         uri = os.getenv("MONGO_URL_DEV", "mongodb://localhost:27017")
-        client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=3000)
+        client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=3000, **options)
     else:
         endpoint = os.environ["DOCDB_ENDPOINT"]
         port = os.getenv("DOCDB_PORT", "27017")
@@ -24,10 +86,17 @@ def make_db():
         user, pwd = os.environ["DOCDB_USER"], os.environ["DOCDB_PASSWORD"]
 
         uri = f"mongodb://{user}:{pwd}@{endpoint}:{port}/{dbname}?{params}"
-        client = AsyncIOMotorClient(uri, tlsCAFile=ca, serverSelectionTimeoutMS=5000)
+        client = AsyncIOMotorClient(
+            uri, tlsCAFile=ca, serverSelectionTimeoutMS=5000, **options
+        )
     return client[dbname]
 
 
+def for_listing(target: _Target) -> _Target:
+    """목록 조회용 read preference를 적용한 DB/컬렉션"""
+    return target.with_options(read_preference=LISTING_READ_PREFERENCE)
+
+
 # global
 database = make_db()
 
@@ -46,14 +115,28 @@ async def get_db() -> AsyncGenerator[AsyncIOMotorDatabase, None]:
 
 
 async def ensure_indexes() -> None:
-    """데이터베이스 인덱스 생성"""
-    # project_segments 조회 성능을 위한 일반 인덱스 (유니크 아님)
-    # 중복 방지는 Redis 분산 락으로 처리
+    """인덱스 레지스트리 기준으로 인덱스 생성/점검 (app/config/indexes.py)"""
     try:
-        await database["project_segments"].create_index(
-            [("project_id", 1), ("segment_index", 1)],
-            name="project_segment_idx",
+        report = await reconcile_indexes(database)
+        print(
+            f"MongoDB indexes reconciled (v{report.version}): "
+            f"created={len(report.created)} unexpected={len(report.unexpected)} "
+            f"mismatched={len(report.mismatched)} failed={len(report.failed)}"
         )
-        print("MongoDB indexes ensured")
     except Exception as exc:
-        print(f"Index creation warning: {exc}")
+        print(f"Index reconcile warning: {exc}")
+
+
+async def run_migrations() -> None:
+    """참조 ID/프로젝트 요약 백필"""
+    try:
+        converted = await backfill_reference_ids(database)
+        if converted:
+            print(f"Reference id backfill: {converted}")
+    except Exception as exc:
+        print(f"Reference id backfill warning: {exc}")
+    try:
+        # 프로젝트 목록 요약 필드 (issue_count, target_summary)
+        await backfill_project_summaries(database)
+    except Exception as exc:
+        print(f"Project summary backfill warning: {exc}")
@@ -0,0 +1,153 @@
+"""
+MongoDB 명령/커넥션 풀 모니터링
+
+pymongo 이벤트 리스너로 컬렉션·명령별 지연시간과 풀 대기시간을 메트릭으로 남깁니다.
+리스너는 드라이버 스레드에서 동기로 호출되므로 가볍게 유지합니다.
+"""
+
+import threading
+from typing import Any, Dict, Tuple
+
+from pymongo import monitoring
+
+from app.utils.metrics import LabelValues, metrics_registry
+
+MONGO_COMMAND_DURATION = metrics_registry.histogram(
+    "mongo_command_duration_seconds",
+    "MongoDB command latency",
+    ["collection", "command"],
+)
+MONGO_COMMAND_FAILURES = metrics_registry.counter(
+    "mongo_command_failures_total",
+    "MongoDB commands that returned an error",
+    ["collection", "command"],
+)
+MONGO_POOL_WAIT = metrics_registry.histogram(
+    "mongo_pool_wait_seconds",
+    "Time spent waiting to check out a pooled connection",
+    ["address"],
+)
+MONGO_POOL_CHECKOUT_FAILURES = metrics_registry.counter(
+    "mongo_pool_checkout_failures_total",
+    "Connection checkouts that failed (timeout = pool saturated)",
+    ["address", "reason"],
+)
+
+
+def _address(address: Tuple[str, int]) -> str:
+    host, port = address
+    return f"{host}:{port}"
+
+
+def _collection_name(command_name: str, command: Dict[str, Any]) -> str:
+    if command_name == "getMore":
+        return str(command.get("collection", ""))
+    value = command.get(command_name)
+    return value if isinstance(value, str) else ""
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """명령 시작 시 컬렉션 이름을 기억해두고 완료 시 지연시간 기록"""
+
+    def __init__(self):
+        self._collections: Dict[Tuple[Any, int], str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self._collections[(event.connection_id, event.request_id)] = _collection_name(
+            event.command_name, event.command
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMAND_DURATION.observe(
+            event.duration_micros / 1_000_000,
+            collection=collection,
+            command=event.command_name,
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMAND_DURATION.observe(
+            event.duration_micros / 1_000_000,
+            collection=collection,
+            command=event.command_name,
+        )
+        MONGO_COMMAND_FAILURES.inc(collection=collection, command=event.command_name)
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """풀 대기시간과 서버별 열린/사용 중 커넥션 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open: Dict[str, int] = {}
+        self._in_use: Dict[str, int] = {}
+
+    def _add(self, counts: Dict[str, int], address: str, delta: int) -> None:
+        with self._lock:
+            counts[address] = max(counts.get(address, 0) + delta, 0)
+
+    def connection_counts(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            samples: Dict[LabelValues, float] = {
+                (address, "open"): count for address, count in self._open.items()
+            }
+            samples.update(
+                {(address, "in_use"): count for address, count in self._in_use.items()}
+            )
+        return samples
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        address = _address(event.address)
+        MONGO_POOL_WAIT.observe(event.duration, address=address)
+        MONGO_POOL_CHECKOUT_FAILURES.inc(address=address, reason=event.reason)
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        address = _address(event.address)
+        MONGO_POOL_WAIT.observe(event.duration, address=address)
+        self._add(self._in_use, address, 1)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        self._add(self._in_use, _address(event.address), -1)
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        self._add(self._open, _address(event.address), 1)
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        self._add(self._open, _address(event.address), -1)
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        # 풀이 비워지면 사용 중이던 커넥션도 반납 없이 닫힘
+        with self._lock:
+            self._in_use.pop(_address(event.address), None)
+
+    # 나머지 이벤트는 기록하지 않음
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        pass
+
+
+command_listener = CommandMetricsListener()
+pool_listener = PoolMetricsListener()
+
+metrics_registry.gauge(
+    "mongo_pool_connections",
+    "Pooled MongoDB connections by state",
+    ["address", "state"],
+    collect=pool_listener.connection_counts,
+)
@@ -31,6 +31,7 @@ REFRESH_TOKEN_EXPIRE_DAYS = int(
 
 class Settings(BaseSettings):
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://redis:6379/0")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
     S3_BUCKET: str = os.getenv("AWS_S3_BUCKET", "dupilot-dev-media")
     AWS_REGION: str = os.getenv("AWS_REGION", "ap-northeast-2")
     INGEST_WORKDIR: str = os.getenv("INGEST_WORKDIR", "/tmp/dupilot-ingest")
@@ -0,0 +1,332 @@
+"""
+MongoDB 인덱스 레지스트리
+
+핫 쿼리가 사용하는 인덱스를 한 곳에 선언하고, 시작 시 백그라운드에서
+실제 인덱스와 비교(reconcile)합니다.
+
+- 레지스트리에 있으나 DB에 없는 인덱스 → 생성
+- 같은 이름이지만 키/옵션이 다른 인덱스 → 경고 (자동 삭제하지 않음)
+- DB에 있으나 레지스트리에 없는 인덱스 → 경고 (자동 삭제하지 않음)
+
+인덱스를 추가/변경할 때는 INDEX_REGISTRY와 HOT_QUERIES를 함께 수정하고
+INDEX_REGISTRY_VERSION을 올립니다. 적용된 버전은 schema_meta 컬렉션에 기록됩니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+logger = logging.getLogger(__name__)
+
+INDEX_REGISTRY_VERSION = 4
+SCHEMA_META_COLLECTION = "schema_meta"
+INDEX_META_ID = "indexes"
+
+IndexKeys = Tuple[Tuple[str, int], ...]
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    collection: str
+    keys: IndexKeys
+    name: str
+    unique: bool = False
+
+    def model(self) -> IndexModel:
+        return IndexModel(list(self.keys), name=self.name, unique=self.unique)
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """인덱스로 처리되어야 하는 조회 (explain 검사용 샘플 조건)"""
+
+    collection: str
+    filter: Dict[str, Any]
+    sort: Optional[Tuple[Tuple[str, int], ...]] = None
+    description: str = ""
+
+
+INDEX_REGISTRY: Tuple[IndexSpec, ...] = (
+    # 목록 keyset 페이지 (project/service.py)
+    IndexSpec(
+        "projects",
+        (("created_at", DESCENDING), ("_id", DESCENDING)),
+        "project_created_idx",
+    ),
+    IndexSpec(
+        "projects",
+        (("owner_code", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)),
+        "project_owner_created_idx",
+    ),
+    # 중복 방지는 Redis 분산 락으로 처리하므로 유니크 아님
+    IndexSpec(
+        "project_segments",
+        (("project_id", ASCENDING), ("segment_index", ASCENDING)),
+        "project_segment_idx",
+    ),
+    IndexSpec(
+        "segments",
+        (("project_id", ASCENDING),),
+        "segment_project_idx",
+    ),
+    IndexSpec(
+        "segment_translations",
+        (("segment_id", ASCENDING), ("language_code", ASCENDING)),
+        "segment_translation_lang_idx",
+    ),
+    # 에디터 read model (segment/read_model.py)
+    IndexSpec(
+        "editor_segments",
+        (
+            ("project_id", ASCENDING),
+            ("language_code", ASCENDING),
+            ("segment_index", ASCENDING),
+        ),
+        "editor_segment_idx",
+    ),
+    IndexSpec(
+        "project_targets",
+        (("project_id", ASCENDING), ("language_code", ASCENDING)),
+        "project_target_lang_idx",
+    ),
+    IndexSpec(
+        "jobs",
+        (
+            ("project_id", ASCENDING),
+            ("target_lang", ASCENDING),
+            ("task", ASCENDING),
+            ("created_at", DESCENDING),
+        ),
+        "job_project_lang_task_idx",
+    ),
+    IndexSpec(
+        "issues",
+        (("project_id", ASCENDING), ("language_code", ASCENDING)),
+        "issue_project_lang_idx",
+    ),
+    IndexSpec(
+        "issues",
+        (("segment_translation_id", ASCENDING),),
+        "issue_translation_idx",
+    ),
+    IndexSpec(
+        "user_voices",
+        (("user_id", ASCENDING), ("voice_sample_id", ASCENDING)),
+        "user_voice_idx",
+    ),
+    IndexSpec(
+        "voice_samples",
+        (("is_public", ASCENDING), ("created_at", DESCENDING)),
+        "voice_sample_public_idx",
+    ),
+    IndexSpec(
+        "credit_balances",
+        (("user_id", ASCENDING),),
+        "credit_balance_user_idx",
+    ),
+    IndexSpec(
+        "assets",
+        (
+            ("project_id", ASCENDING),
+            ("language_code", ASCENDING),
+            ("created_at", DESCENDING),
+        ),
+        "asset_project_lang_idx",
+    ),
+    IndexSpec(
+        "pipelines",
+        (("project_id", ASCENDING),),
+        "pipeline_project_idx",
+    ),
+)
+
+_OID = "000000000000000000000000"
+
+HOT_QUERIES: Tuple[HotQuery, ...] = (
+    HotQuery(
+        "projects",
+        {"owner_code": _OID},
+        (("created_at", DESCENDING), ("_id", DESCENDING)),
+        "내 프로젝트 목록 첫 페이지",
+    ),
+    HotQuery(
+        "projects",
+        {
+            "$or": [
+                {"created_at": {"$lt": datetime(2030, 1, 1)}},
+                {"created_at": datetime(2030, 1, 1), "_id": {"$lt": ObjectId(_OID)}},
+            ]
+        },
+        (("created_at", DESCENDING), ("_id", DESCENDING)),
+        "프로젝트 목록 keyset 페이지",
+    ),
+    HotQuery(
+        "project_segments",
+        {"project_id": _OID, "segment_index": {"$gt": 0}},
+        (("segment_index", ASCENDING),),
+        "에디터/세그먼트 keyset 페이지",
+    ),
+    HotQuery(
+        "segments",
+        {"project_id": _OID, "$or": [{"segment_id": _OID}, {"segment_index": 0}]},
+        description="프리뷰 세그먼트 조회",
+    ),
+    HotQuery(
+        "segment_translations",
+        {"segment_id": {"$in": [_OID]}, "language_code": "en"},
+        description="세그먼트 페이지 번역 일괄 조회",
+    ),
+    HotQuery(
+        "editor_segments",
+        {"project_id": _OID, "language_code": "en", "segment_index": {"$gt": 0}},
+        (("segment_index", ASCENDING),),
+        "에디터 read model 페이지",
+    ),
+    HotQuery(
+        "project_targets",
+        {"project_id": _OID, "language_code": "en"},
+        description="프로젝트 타겟 언어 조회",
+    ),
+    HotQuery(
+        "jobs",
+        {"project_id": _OID, "target_lang": "en", "task": "full_pipeline"},
+        (("created_at", DESCENDING),),
+        "프로젝트 최신 파이프라인 job 조회",
+    ),
+    HotQuery(
+        "issues",
+        {"project_id": _OID, "language_code": "en"},
+        description="에디터 이슈 조회",
+    ),
+    HotQuery(
+        "issues",
+        {"segment_translation_id": {"$in": [_OID]}},
+        description="세그먼트 번역별 이슈 조회",
+    ),
+    HotQuery(
+        "user_voices",
+        {"user_id": _OID, "voice_sample_id": {"$in": [_OID]}},
+        description="내 라이브러리 추가 여부",
+    ),
+    HotQuery(
+        "voice_samples",
+        {"is_public": True},
+        (("created_at", DESCENDING),),
+        "공개 보이스 라이브러리 목록",
+    ),
+    HotQuery(
+        "credit_balances",
+        {"user_id": _OID},
+        description="크레딧 잔액 조회",
+    ),
+    HotQuery(
+        "assets",
+        {"project_id": _OID, "language_code": "en"},
+        (("created_at", DESCENDING),),
+        "프로젝트 에셋 목록",
+    ),
+    HotQuery(
+        "pipelines",
+        {"project_id": _OID},
+        description="파이프라인 상태 조회",
+    ),
+)
+
+
+@dataclass
+class IndexReport:
+    version: int = INDEX_REGISTRY_VERSION
+    created: List[str] = field(default_factory=list)
+    mismatched: List[str] = field(default_factory=list)
+    unexpected: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+
+def _index_differs(spec: IndexSpec, existing: Dict[str, Any]) -> bool:
+    existing_keys = tuple((key, int(direction)) for key, direction in existing["key"].items())
+    return existing_keys != spec.keys or bool(existing.get("unique")) != spec.unique
+
+
+async def reconcile_indexes(db: AsyncIOMotorDatabase) -> IndexReport:
+    """레지스트리와 실제 인덱스를 비교해 누락된 인덱스를 생성"""
+    report = IndexReport()
+    specs_by_collection: Dict[str, List[IndexSpec]] = {}
+    for spec in INDEX_REGISTRY:
+        specs_by_collection.setdefault(spec.collection, []).append(spec)
+
+    for collection_name, specs in specs_by_collection.items():
+        collection = db[collection_name]
+        existing = {
+            index["name"]: index async for index in collection.list_indexes()
+        }
+
+        missing = []
+        for spec in specs:
+            current = existing.get(spec.name)
+            if current is None:
+                missing.append(spec)
+            elif _index_differs(spec, current):
+                report.mismatched.append(f"{collection_name}.{spec.name}")
+
+        expected_names = {spec.name for spec in specs} | {"_id_"}
+        report.unexpected.extend(
+            f"{collection_name}.{name}"
+            for name in existing
+            if name not in expected_names
+        )
+
+        if not missing:
+            continue
+        try:
+            await collection.create_indexes([spec.model() for spec in missing])
+            report.created.extend(f"{collection_name}.{spec.name}" for spec in missing)
+        except Exception as exc:
+            logger.error(f"Index creation failed on {collection_name}: {exc}")
+            report.failed.extend(f"{collection_name}.{spec.name}" for spec in missing)
+
+    if report.created:
+        logger.info(f"Indexes created: {', '.join(report.created)}")
+    if report.mismatched:
+        logger.warning(
+            f"Indexes differ from registry (not modified): {', '.join(report.mismatched)}"
+        )
+    if report.unexpected:
+        logger.warning(
+            f"Indexes not in registry (not dropped): {', '.join(report.unexpected)}"
+        )
+
+    if not report.failed:
+        await db[SCHEMA_META_COLLECTION].update_one(
+            {"_id": INDEX_META_ID},
+            {
+                "$set": {
+                    "version": INDEX_REGISTRY_VERSION,
+                    "applied_at": datetime.now(),
+                    "unexpected": report.unexpected,
+                    "mismatched": report.mismatched,
+                }
+            },
+            upsert=True,
+        )
+    return report
+
+
+def find_collscan(plan: Dict[str, Any]) -> bool:
+    """explain 결과의 winningPlan에 COLLSCAN 단계가 있는지 확인"""
+    stack = [plan.get("queryPlanner", {}).get("winningPlan", plan)]
+    while stack:
+        stage = stack.pop()
+        if not isinstance(stage, dict):
+            continue
+        if stage.get("stage") == "COLLSCAN":
+            return True
+        for key in ("inputStage", "queryPlan"):
+            if key in stage:
+                stack.append(stage[key])
+        stack.extend(stage.get("inputStages", []))
+    return False
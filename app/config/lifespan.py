@@ -1,16 +1,59 @@
 from fastapi import FastAPI
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from app.config.db import ensure_db_connection, ensure_indexes
+from app.config.db import (
+    database,
+    ensure_db_connection,
+    ensure_indexes,
+    run_migrations,
+)
+from app.config.redis import close_async_redis
+from app.api.events import event_bus
+from app.api.llm import close_llm_backend, warm_up_llm_backend
+from app.api.metrics.service import start_metrics_reporter, stop_metrics_reporter
+from app.api.project.deletion import (
+    resume_project_deletions,
+    stop_project_deletions,
+)
+from app.api.segment.bulk_translate import stop_project_translations
+from app.api.translate.glossary_index import warm_up_glossary
+from app.api.translate.suggestion_job import stop_project_suggestions
+from app.api.cache import (
+    start_cache_invalidation_listener,
+    stop_cache_invalidation_listener,
+)
 
 # from app.api.translate.service import vector_search
 
 logger = logging.getLogger(__name__)
 
 
+async def _prepare_database() -> None:
+    await ensure_indexes()
+    await run_migrations()
+    # 이전 프로세스에서 끝나지 않은 프로젝트 삭제 job 재개
+    await resume_project_deletions(database)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await ensure_db_connection()
-    await ensure_indexes()
-    # Glossary warmup disabled
+    # 인덱스 생성/백필은 기동을 막지 않도록 백그라운드에서 수행
+    index_task = asyncio.create_task(_prepare_database(), name="db-prepare")
+    glossary_task = asyncio.create_task(warm_up_glossary(), name="glossary-warmup")
+    llm_task = asyncio.create_task(warm_up_llm_backend(), name="llm-warmup")
+    start_metrics_reporter()
+    start_cache_invalidation_listener()
     yield
+    for task in (index_task, llm_task, glossary_task):
+        if not task.done():
+            task.cancel()
+    await stop_project_deletions()
+    await stop_project_translations()
+    await stop_project_suggestions()
+    await stop_metrics_reporter()
+    await stop_cache_invalidation_listener()
+    await close_llm_backend()
+    await event_bus.stop()
+    await close_async_redis()
@@ -0,0 +1,117 @@
+"""
+참조 ID 백필 (ObjectId → 문자열)
+
+REFERENCE_FIELDS(app/utils/ids.py)에 등록된 참조 필드 중 ObjectId로 저장된 값을
+배치 단위로 문자열로 바꿉니다. 멱등이므로 여러 번 실행해도 안전하며,
+API 시작 시 백그라운드로 실행되고 수동으로도 실행할 수 있습니다.
+
+실행:
+    python -m app.config.migrations            # 백필
+    python -m app.config.migrations --dry-run  # 대상 문서 수만 확인
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from app.utils.ids import REFERENCE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_ID_MIGRATION_VERSION = 1
+SCHEMA_META_COLLECTION = "schema_meta"
+REFERENCE_ID_META_ID = "reference_ids"
+BACKFILL_BATCH_SIZE = 500
+# 배치 사이 대기 (운영 DB 부하 완화)
+BACKFILL_BATCH_PAUSE = 0.05
+
+
+async def count_legacy_refs(db: AsyncIOMotorDatabase) -> Dict[str, int]:
+    """컬렉션.필드별 ObjectId로 남아있는 참조 수"""
+    counts: Dict[str, int] = {}
+    for collection_name, fields in REFERENCE_FIELDS.items():
+        for field in fields:
+            counts[f"{collection_name}.{field}"] = await db[
+                collection_name
+            ].count_documents({field: {"$type": "objectId"}})
+    return counts
+
+
+async def _backfill_field(
+    db: AsyncIOMotorDatabase, collection_name: str, field: str, batch_size: int
+) -> int:
+    collection = db[collection_name]
+    converted = 0
+    while True:
+        docs = (
+            await collection.find({field: {"$type": "objectId"}}, {field: 1})
+            .limit(batch_size)
+            .to_list(batch_size)
+        )
+        if not docs:
+            return converted
+        # 다른 쓰기와 경합해도 아직 ObjectId인 경우에만 변경
+        operations = [
+            UpdateOne(
+                {"_id": doc["_id"], field: doc[field]},
+                {"$set": {field: str(doc[field])}},
+            )
+            for doc in docs
+        ]
+        result = await collection.bulk_write(operations, ordered=False)
+        converted += result.modified_count
+        await asyncio.sleep(BACKFILL_BATCH_PAUSE)
+
+
+async def backfill_reference_ids(
+    db: AsyncIOMotorDatabase, batch_size: int = BACKFILL_BATCH_SIZE
+) -> Dict[str, int]:
+    """ObjectId 참조를 문자열로 변환하고 컬렉션.필드별 변환 수를 반환"""
+    converted: Dict[str, int] = {}
+    for collection_name, fields in REFERENCE_FIELDS.items():
+        for field in fields:
+            count = await _backfill_field(db, collection_name, field, batch_size)
+            if count:
+                converted[f"{collection_name}.{field}"] = count
+                logger.info(
+                    f"Reference ids backfilled: {collection_name}.{field} ({count})"
+                )
+
+    await db[SCHEMA_META_COLLECTION].update_one(
+        {"_id": REFERENCE_ID_META_ID},
+        {
+            "$set": {
+                "version": REFERENCE_ID_MIGRATION_VERSION,
+                "completed_at": datetime.now(),
+                "converted": converted,
+            }
+        },
+        upsert=True,
+    )
+    return converted
+
+
+async def _main(dry_run: bool, batch_size: int) -> None:
+    from app.config.db import database
+
+    if dry_run:
+        counts = await count_legacy_refs(database)
+        for name, count in counts.items():
+            print(f"{name}: {count}")
+        return
+    converted = await backfill_reference_ids(database, batch_size)
+    print(f"converted: {converted or 'nothing to do'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="참조 ID 문자열 백필")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(args.dry_run, args.batch_size))
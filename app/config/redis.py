@@ -1,47 +1,129 @@
 # app/adapters/redis.py
 import asyncio
 from contextlib import asynccontextmanager
+from uuid import uuid4
+
 from redis import Redis
+from redis.asyncio import ConnectionPool, Redis as AsyncRedis
 from .env import settings
 
+# 프로세스 전역 asyncio 커넥션 풀 (이벤트 루프 위에서만 사용)
+_async_pool: ConnectionPool | None = None
+
+# 락 획득: SET NX PX 실패 시 남은 TTL(ms)을 같은 왕복으로 반환
+_ACQUIRE_LOCK_LUA = """
+if redis.call('set', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return {1, 0}
+end
+return {0, redis.call('pttl', KEYS[1])}
+"""
+
+# 락 해제: 토큰이 일치할 때만 삭제하고 대기자에게 해제 알림 발행
+_RELEASE_LOCK_LUA = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    redis.call('del', KEYS[1])
+    redis.call('publish', KEYS[2], ARGV[1])
+    return 1
+end
+return 0
+"""
+
 
 def get_redis() -> Redis:
+    """동기 클라이언트 (RQ 큐/워커 전용)"""
     return Redis.from_url(settings.REDIS_URL)
 
 
+def get_async_redis() -> AsyncRedis:
+    """공유 커넥션 풀을 사용하는 asyncio 클라이언트"""
+    global _async_pool
+    if _async_pool is None:
+        _async_pool = ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
+    return AsyncRedis(connection_pool=_async_pool)
+
+
+async def close_async_redis() -> None:
+    """lifespan 종료 시 공유 커넥션 풀 정리"""
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.disconnect()
+        _async_pool = None
+
+
 @asynccontextmanager
 async def distributed_lock(
     lock_name: str,
     timeout: int = 30,
-    retry_interval: float = 0.1,
-    max_retries: int = 100,
+    blocking_timeout: float = 10.0,
 ):
     """
     Redis 분산 락 (async context manager)
 
+    경합이 없으면 Lua 스크립트 1회 왕복으로 획득합니다.
+    경합 시에는 해제 채널을 구독해 두고 해제 알림(또는 기존 락의 TTL 만료)까지
+    대기하므로 폴링 없이 이벤트 루프를 블로킹하지 않습니다.
+    해제는 획득 시 발급한 토큰이 일치할 때만 수행되어,
+    만료 후 다른 holder가 잡은 락을 지우지 않습니다.
+
     Args:
         lock_name: 락 키 이름
         timeout: 락 만료 시간 (초)
-        retry_interval: 재시도 간격 (초)
-        max_retries: 최대 재시도 횟수
+        blocking_timeout: 락 획득 대기 최대 시간 (초)
     """
-    redis = get_redis()
+    redis = get_async_redis()
     lock_key = f"lock:{lock_name}"
-    acquired = False
+    release_channel = f"lock-released:{lock_name}"
+    token = uuid4().hex
+    ttl_ms = int(timeout * 1000)
+    acquire = redis.register_script(_ACQUIRE_LOCK_LUA)
+    release = redis.register_script(_RELEASE_LOCK_LUA)
 
-    try:
-        # 락 획득 시도
-        for _ in range(max_retries):
-            # NX: 키가 없을 때만 설정, EX: 만료 시간
-            if redis.set(lock_key, "1", nx=True, ex=timeout):
-                acquired = True
-                break
-            await asyncio.sleep(retry_interval)
+    acquired, pttl = await acquire(keys=[lock_key], args=[token, ttl_ms])
+
+    if not acquired:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + blocking_timeout
+        pubsub = redis.pubsub()
+        try:
+            # 구독을 먼저 건 뒤 재시도해야 그 사이의 해제 알림을 놓치지 않음
+            await pubsub.subscribe(release_channel)
+            while True:
+                acquired, pttl = await acquire(keys=[lock_key], args=[token, ttl_ms])
+                if acquired:
+                    break
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
 
-        if not acquired:
-            raise TimeoutError(f"Failed to acquire lock: {lock_name}")
+                # TTL 없는 키(-1) / 방금 사라진 키(-2)는 남은 대기시간 기준으로 처리
+                wait = remaining if pttl < 0 else min(remaining, pttl / 1000)
+                await _wait_for_release(pubsub, wait)
+        finally:
+            await pubsub.aclose()
 
+    if not acquired:
+        raise TimeoutError(f"Failed to acquire lock: {lock_name}")
+
+    try:
         yield
     finally:
-        if acquired:
-            redis.delete(lock_key)
+        await release(keys=[lock_key, release_channel], args=[token])
+
+
+async def _wait_for_release(pubsub, wait: float) -> None:
+    """해제 알림 메시지가 오거나 wait 초가 지날 때까지 대기"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        message = await pubsub.get_message(
+            ignore_subscribe_messages=True, timeout=remaining
+        )
+        if message and message.get("type") == "message":
+            return
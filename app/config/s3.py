@@ -16,22 +16,6 @@ session = boto3.Session(**session_kwargs, region_name=aws_region)
 s3 = session.client("s3")
 
 
-def drop_projects(project_id):
-    bucket = settings.S3_BUCKET
-    prefix = f"projects/{project_id}/"
-    paginator = s3.get_paginator("list_objects_v2")
-
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-        objects = page.get("Contents", [])
-        if not objects:
-            continue
-        delete_payload = {
-            "Objects": [{"Key": obj["Key"]} for obj in objects],
-            "Quiet": True,
-        }
-        s3.delete_objects(Bucket=bucket, Delete=delete_payload)
-
-
 def drop_voice_sample_keys(keys: list[str]):
     """지정된 S3 키 리스트를 삭제"""
     bucket = settings.S3_BUCKET
@@ -0,0 +1,103 @@
+"""
+프로세스 내 TTL 캐시 (read-through)
+
+자주 바뀌지 않는 참조 데이터(언어, 억양, 프로젝트 메타)를 메모리에서 제공합니다.
+쓰기 경로에서는 invalidate로 즉시 무효화하고, 다른 워커로의 전파는
+app/api/cache.py가 이벤트 버스로 처리합니다.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.utils.metrics import metrics_registry
+
+CACHE_REQUESTS = metrics_registry.counter(
+    "cache_requests_total", "Read-through cache lookups", ["cache", "result"]
+)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """TTL + 최대 크기(LRU 제거) 캐시, 동일 키 동시 로드는 한 번만 수행"""
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 1024):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+        # invalidate마다 증가 - 무효화 이전에 시작된 로드 결과는 저장하지 않음
+        self._generation = 0
+        cache_registry[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """key가 없으면 전체 무효화"""
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return value
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+
+        pending = self._loading.get(key)
+        while pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # 먼저 로드하던 요청이 취소된 경우 직접 로드
+                if not pending.cancelled():
+                    raise
+            pending = self._loading.get(key)
+
+        generation = self._generation
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # 대기자가 없을 때 "exception never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            if generation == self._generation:
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._loading.pop(key, None)
+
+
+# 이름 → 캐시 (워커 간 무효화 메시지 라우팅용)
+cache_registry: Dict[str, TTLCache] = {}
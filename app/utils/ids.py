@@ -0,0 +1,74 @@
+"""
+ID 표현 규칙
+
+- 각 컬렉션의 `_id`는 ObjectId
+- 다른 문서를 가리키는 참조 필드(project_id, segment_id 등)는 24자리 hex 문자열
+
+참조 필드를 한 가지 타입으로만 저장해야 $in/$lookup/동등 조회가
+타입 변환 없이 인덱스를 그대로 사용합니다.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+IdLike = Union[str, ObjectId]
+
+# 컬렉션별 참조 필드 (문자열로 저장)
+REFERENCE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "project_segments": ("project_id",),
+    "segment_translations": ("project_id", "segment_id"),
+    "segments": ("project_id",),
+    "project_targets": ("project_id",),
+    "jobs": ("project_id",),
+    "issues": ("project_id", "segment_id", "segment_translation_id"),
+    "assets": ("project_id",),
+    "pipelines": ("project_id",),
+}
+
+
+def to_object_id(value: IdLike) -> ObjectId:
+    """문서 `_id` 조회용 ObjectId (형식이 잘못되면 ValueError)"""
+    if isinstance(value, ObjectId):
+        return value
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError) as exc:
+        raise ValueError(f"invalid object id: {value!r}") from exc
+
+
+def to_ref(value: IdLike) -> str:
+    """참조 필드 저장/조회용 문자열 ID"""
+    return str(to_object_id(value))
+
+
+def normalize_ref_value(value: Any) -> Any:
+    """
+    참조 필드 값(또는 {"$in": [...]} 같은 연산자 조건)의 ObjectId를 문자열로 변환
+    """
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: normalize_ref_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [normalize_ref_value(item) for item in value]
+    return value
+
+
+def normalize_refs(doc: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """문서/필터의 참조 필드를 문자열로 정규화한 사본"""
+    normalized = dict(doc)
+    for field in fields:
+        if field in normalized:
+            normalized[field] = normalize_ref_value(normalized[field])
+    return normalized
+
+
+def try_object_id(value: Optional[IdLike]) -> Optional[ObjectId]:
+    if value is None:
+        return None
+    try:
+        return to_object_id(value)
+    except ValueError:
+        return None
@@ -0,0 +1,263 @@
+"""
+프로세스 내 메트릭 (Prometheus 텍스트 포맷 호환)
+
+카운터/게이지/히스토그램을 메모리에 누적하고, 직렬화 가능한 스냅샷으로
+내보내거나 여러 워커의 스냅샷을 합쳐 Prometheus 노출 포맷으로 렌더링합니다.
+"""
+
+import bisect
+import os
+import socket
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 워커(프로세스) 식별자 - 스냅샷 합산 시 키로 사용
+INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DURATION_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names: Tuple[str, ...] = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_name,
+            "help": self.documentation,
+            "labels": list(self.label_names),
+        }
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = [[list(key), value] for key, value in self._values.items()]
+        return {**self.describe(), "samples": samples}
+
+
+class Gauge(_Metric):
+    """값을 직접 설정하거나, 수집 시점에 콜백으로 계산하는 게이지"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        if self._collect is not None:
+            values = self._collect()
+        else:
+            with self._lock:
+                values = dict(self._values)
+        samples = [[list(key), value] for key, value in values.items()]
+        return {**self.describe(), "samples": samples}
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # key -> [버킷별 카운트(+Inf 포함), sum, count]
+        self._values: Dict[LabelValues, List[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._values[key] = entry
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = [
+                [list(key), {"buckets": list(counts), "sum": total, "count": count}]
+                for key, (counts, total, count) in self._values.items()
+            ]
+        return {**self.describe(), "buckets": list(self.buckets), "samples": samples}
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labels, collect))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 현재 값"""
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+
+def merge_snapshots(snapshots: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """여러 워커의 스냅샷을 합산 (카운터/히스토그램/게이지 모두 합)"""
+    merged: Dict[str, Any] = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.get(name)
+            if target is None:
+                target = {key: value for key, value in metric.items() if key != "samples"}
+                target["samples"] = {}
+                merged[name] = target
+            samples = target["samples"]
+            for label_values, value in metric["samples"]:
+                key = tuple(label_values)
+                if metric["type"] == "histogram":
+                    current = samples.get(key)
+                    if current is None:
+                        samples[key] = {
+                            "buckets": list(value["buckets"]),
+                            "sum": value["sum"],
+                            "count": value["count"],
+                        }
+                    else:
+                        current["buckets"] = [
+                            a + b for a, b in zip(current["buckets"], value["buckets"])
+                        ]
+                        current["sum"] += value["sum"]
+                        current["count"] += value["count"]
+                else:
+                    samples[key] = samples.get(key, 0) + value
+    return merged
+
+
+def sample_total(merged: Dict[str, Any], name: str, **labels: Any) -> float:
+    """합산 스냅샷에서 라벨 조건에 맞는 샘플 값(히스토그램은 count)의 합"""
+    metric = merged.get(name)
+    if not metric:
+        return 0
+    label_names = metric["labels"]
+    total = 0
+    for key, value in metric["samples"].items():
+        label_map = dict(zip(label_names, key))
+        if any(label_map.get(k) != str(v) for k, v in labels.items()):
+            continue
+        total += value["count"] if isinstance(value, dict) else value
+    return total
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(merged: Dict[str, Any]) -> str:
+    """합산 스냅샷을 Prometheus 텍스트 노출 포맷(0.0.4)으로 렌더링"""
+    lines: List[str] = []
+    for name in sorted(merged):
+        metric = merged[name]
+        label_names = metric["labels"]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for key, value in sorted(metric["samples"].items()):
+            if metric["type"] == "histogram":
+                cumulative = 0
+                bounds = list(metric["buckets"]) + ["+Inf"]
+                for bound, count in zip(bounds, value["buckets"]):
+                    cumulative += count
+                    le = f'le="{bound}"' if bound == "+Inf" else f'le="{_format_number(float(bound))}"'
+                    lines.append(
+                        f"{name}_bucket{_format_labels(label_names, key, le)} {cumulative}"
+                    )
+                labels = _format_labels(label_names, key)
+                lines.append(f"{name}_sum{labels} {_format_number(value['sum'])}")
+                lines.append(f"{name}_count{labels} {value['count']}")
+            else:
+                lines.append(
+                    f"{name}{_format_labels(label_names, key)} {_format_number(value)}"
+                )
+    return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 레지스트리
+metrics_registry = MetricsRegistry()
@@ -1,4 +1,5 @@
 import logging
+import os
 from app.api.jobs.service import start_job, start_jobs_for_targets
 from app.api.pipeline.models import PipelineStatus, PipelineUpdate
 from app.api.pipeline.service import update_pipeline_stage
@@ -9,8 +10,11 @@ from app.utils.job_utils import process_project_jobs
 
 logger = logging.getLogger(__name__)
 
-# 워커 전용 Mongo 클라이언트 (API와 분리)
-worker_db = make_db()
+# 워커 전용 Mongo 클라이언트 (API와 분리, 동시 작업이 적어 풀을 작게 유지)
+worker_db = make_db(
+    app_name="dupilot-worker",
+    maxPoolSize=int(os.getenv("WORKER_MONGO_MAX_POOL_SIZE", "10")),
+)
 project_service = ProjectService(worker_db)
 
 
@@ -1,8 +1,9 @@
-import json
 from typing import Any, Dict
 
 from redis.exceptions import RedisError
 
+from app.api.events.bus import event_bus
+from app.api.events.models import EventTopic
 from app.config.redis import get_redis
 
 DOWNLOAD_PROGRESS_PARTS = 2
@@ -14,10 +15,6 @@ FINALIZE_PROGRESS_START = 93
 FINALIZE_PROGRESS_DONE = 100
 
 
-def _progress_channel(project_id: str) -> str:
-    return f"uploads:{project_id}"
-
-
 redis_conn = get_redis()
 
 
@@ -32,7 +29,9 @@ def emit_progress(project_id: str, payload: Dict[str, Any]) -> None:
     if progress is not None:
         payload["progress"] = clamp(int(progress))
     try:
-        redis_conn.publish(_progress_channel(project_id), json.dumps(payload))
+        event_bus.publish_sync(
+            redis_conn, EventTopic.UPLOAD, project_id, "progress", payload
+        )
     except RedisError:
         pass
 
@@ -0,0 +1,162 @@
+"""
+LLM 호출 경로 벤치마크 (모델 비용 제외)
+
+번역(배칭 포함)/교정(용어집 검색 + JSON 파싱)/제안(스트리밍) 경로를 실제 서비스 함수로
+끝까지 실행하고, 모델 자리는 스텁 또는 로컬 대역 서버로 바꿔 우리 쪽 처리량만 측정합니다.
+
+실행:
+  python script/bench_llm.py --requests 500 --concurrency 50
+  python script/bench_llm.py --backend http --base-url http://127.0.0.1:8089
+  python script/bench_llm.py --latency-ms 300 --workloads translate
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.llm import LocalHttpBackend, StubBackend, set_llm_backend  # noqa: E402
+from app.api.segment.translate_service import translate_single_segment  # noqa: E402
+from app.api.suggesion.service import (  # noqa: E402
+    build_suggestion_prompt,
+    stream_suggestion,
+)
+from app.api.translate.glossary_index import glossary_engine  # noqa: E402
+from app.api.translate.rag import correct_with_rag  # noqa: E402
+
+SOURCES = [
+    "오늘은 새로운 기능을 소개해 드리겠습니다.",
+    "구독과 좋아요 부탁드립니다!",
+    "이 장면에서 주인공은 처음으로 진실을 알게 됩니다.",
+    "다음 영상에서 다시 만나요.",
+]
+
+
+def _source(i: int) -> str:
+    # 같은 원문만 반복되지 않도록 번호를 붙임 (배치 내 중복 제거 효과 배제)
+    return f"{SOURCES[i % len(SOURCES)]} ({i})"
+
+
+async def _translate(i: int) -> Optional[float]:
+    await translate_single_segment(_source(i), i, "en", src_lang="ko")
+    return None
+
+
+async def _correct(i: int) -> Optional[float]:
+    await correct_with_rag(_source(i), f"Draft translation number {i}.")
+    return None
+
+
+async def _suggest(i: int) -> Optional[float]:
+    """첫 조각까지 걸린 시간 반환"""
+    prompt = build_suggestion_prompt(
+        _source(i), f"Draft translation number {i}.", "더 짧게", "영어"
+    )
+    started = time.perf_counter()
+    first_token = None
+    async for _ in stream_suggestion(prompt):
+        if first_token is None:
+            first_token = time.perf_counter() - started
+    return first_token
+
+
+WORKLOADS: Dict[str, Callable[[int], Awaitable[Optional[float]]]] = {
+    "translate": _translate,
+    "correct": _correct,
+    "suggest": _suggest,
+}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run_workload(
+    name: str, requests: int, concurrency: int
+) -> Dict[str, float]:
+    call = WORKLOADS[name]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    first_tokens: List[float] = []
+    failures = 0
+
+    async def _one(i: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                first_token = await call(i)
+            except Exception as exc:
+                failures += 1
+                print(f"[{name}] request {i} failed: {exc}", file=sys.stderr)
+                return
+            latencies.append(time.perf_counter() - started)
+            if first_token is not None:
+                first_tokens.append(first_token)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    result = {
+        "workload": name,
+        "requests": requests,
+        "failures": failures,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+    }
+    if latencies:
+        result.update(
+            {
+                "p50_ms": round(statistics.median(latencies) * 1000, 2),
+                "p95_ms": round(_percentile(latencies, 0.95) * 1000, 2),
+                "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+            }
+        )
+    if first_tokens:
+        result["ttft_p50_ms"] = round(statistics.median(first_tokens) * 1000, 2)
+    return result
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark LLM call paths without model cost.")
+    parser.add_argument("--backend", choices=["stub", "http"], default="stub")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8089", help="--backend http 대역 서버")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="스텁 첫 조각 지연")
+    parser.add_argument("--chunk-latency-ms", type=float, default=0.0, help="스텁 조각 간 지연")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 한 줄씩 출력")
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.backend == "http":
+        backend = LocalHttpBackend(args.base_url)
+    else:
+        backend = StubBackend(args.latency_ms / 1000, args.chunk_latency_ms / 1000)
+    set_llm_backend(backend)
+    # 용어집 로드는 측정에서 제외
+    await asyncio.to_thread(glossary_engine.index)
+
+    try:
+        for name in args.workloads.split(","):
+            result = await run_workload(name.strip(), args.requests, args.concurrency)
+            if args.json:
+                print(json.dumps(result, ensure_ascii=False))
+            else:
+                print("  ".join(f"{key}={value}" for key, value in result.items()))
+    finally:
+        await backend.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -177,6 +177,8 @@ def main():
         emb = EMB.encode(texts, normalize_embeddings=True, convert_to_numpy=True)
         upsert_documents(db, "glossaries", glossary_entries, emb)
         build_index("glossary", glossary_entries, emb)
+        # API의 용어집 엔진이 메모리 매핑으로 읽는 임베딩 (base.jsonl 줄 순서)
+        np.save(f"{DATA}/base.npy", np.asarray(emb, dtype=np.float32))
     else:
         print("No glossary documents found; skipping glossary ingestion.")
 
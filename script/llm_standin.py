@@ -0,0 +1,82 @@
+"""
+로컬 LLM 대역 서버 (Gemini generateContent 형식)
+
+LLM_BACKEND=http 로 띄운 API/벤치마크가 Vertex 대신 이 서버를 호출합니다.
+응답은 app/api/llm/stub.py의 결정적 스텁과 같고, 지연은 인자로 조절합니다.
+실제 HTTP 왕복(직렬화, 커넥션 풀)까지 포함한 오버헤드를 잴 때 사용합니다.
+
+실행: python script/llm_standin.py --port 8089 --latency-ms 300 --chunk-latency-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+import uvicorn
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.llm.stub import split_chunks, stub_completion  # noqa: E402
+
+
+def _response(text: str) -> dict:
+    return {
+        "candidates": [
+            {"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP"}
+        ]
+    }
+
+
+def create_app(latency: float, chunk_latency: float) -> FastAPI:
+    app = FastAPI(title="LLM stand-in")
+
+    @app.post("/models/{target}")
+    async def generate(target: str, request: Request, x_llm_task: str = Header("")):
+        _, _, method = target.partition(":")
+        body = await request.json()
+        prompt = "".join(
+            part.get("text", "")
+            for content in body.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        chunks = split_chunks(stub_completion(x_llm_task, prompt))
+
+        if method == "generateContent":
+            await asyncio.sleep(latency + (len(chunks) - 1) * chunk_latency)
+            return JSONResponse(_response("".join(chunks)))
+        if method != "streamGenerateContent":
+            raise HTTPException(status_code=404, detail=f"Unknown method: {method}")
+
+        async def events():
+            await asyncio.sleep(latency)
+            for i, chunk in enumerate(chunks):
+                if i:
+                    await asyncio.sleep(chunk_latency)
+                yield f"data: {json.dumps(_response(chunk), ensure_ascii=False)}\r\n\r\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a local LLM stand-in server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="첫 조각까지 지연")
+    parser.add_argument("--chunk-latency-ms", type=float, default=0.0, help="조각 간 지연")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    uvicorn.run(
+        create_app(args.latency_ms / 1000, args.chunk_latency_ms / 1000),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
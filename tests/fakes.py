@@ -0,0 +1,340 @@
+"""
+테스트용 인메모리 Motor 대역 (DB/S3 없이 서비스 로직 검증)
+
+서비스 코드가 실제로 쓰는 연산만 구현합니다.
+- 조회: find(sort/skip/limit/to_list/async for), find_one, distinct, count_documents
+- 쓰기: insert_one/many, update_one/many, delete_one/many, find_one_and_update, bulk_write
+- 필터: 값 비교(점 표기), $in/$nin/$gt/$gte/$lt/$lte/$ne/$exists, $or/$and
+- 갱신: $set/$unset/$inc/$push/$setOnInsert/$currentDate
+
+FakeCollection.fail_ops에 bulk_write 연산 인덱스를 넣으면 해당 연산만 실패시키고
+나머지를 적용한 뒤 BulkWriteError를 발생시킵니다 (unordered 동작).
+"""
+
+import copy
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
+
+_MISSING = object()
+
+
+def _get(doc: Dict[str, Any], path: str) -> Any:
+    value: Any = doc
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _compare(value: Any, op: str, arg: Any) -> bool:
+    if op == "$exists":
+        return (value is not _MISSING) == bool(arg)
+    if value is _MISSING:
+        value = None
+    if op == "$in":
+        return value in arg
+    if op == "$nin":
+        return value not in arg
+    if op == "$ne":
+        return value != arg
+    if value is None:
+        return False
+    if op == "$gt":
+        return value > arg
+    if op == "$gte":
+        return value >= arg
+    if op == "$lt":
+        return value < arg
+    if op == "$lte":
+        return value <= arg
+    raise NotImplementedError(op)
+
+
+def matches(doc: Dict[str, Any], query: Optional[Dict[str, Any]]) -> bool:
+    for key, condition in (query or {}).items():
+        if key == "$or":
+            if not any(matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$and":
+            if not all(matches(doc, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict) and condition and all(
+            op.startswith("$") for op in condition
+        ):
+            value = _get(doc, key)
+            if not all(_compare(value, op, arg) for op, arg in condition.items()):
+                return False
+        else:
+            value = _get(doc, key)
+            if (None if value is _MISSING else value) != condition:
+                return False
+    return True
+
+
+def _project(doc: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not projection:
+        return copy.deepcopy(doc)
+    out: Dict[str, Any] = {"_id": doc["_id"]}
+    for path, include in projection.items():
+        if not include:
+            out.pop(path, None)
+            continue
+        value = _get(doc, path)
+        if value is _MISSING:
+            continue
+        target = out
+        parts = path.split(".")
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = copy.deepcopy(value)
+    return out
+
+
+def _apply_update(doc: Dict[str, Any], update: Dict[str, Any], inserting: bool) -> None:
+    for op, fields in update.items():
+        if op == "$setOnInsert" and not inserting:
+            continue
+        for path, value in fields.items():
+            parts = path.split(".")
+            target = doc
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            leaf = parts[-1]
+            if op in ("$set", "$setOnInsert"):
+                target[leaf] = copy.deepcopy(value)
+            elif op == "$unset":
+                target.pop(leaf, None)
+            elif op == "$inc":
+                target[leaf] = target.get(leaf, 0) + value
+            elif op == "$push":
+                target.setdefault(leaf, []).append(copy.deepcopy(value))
+            elif op == "$currentDate":
+                target[leaf] = datetime.now()
+            else:
+                raise NotImplementedError(op)
+
+
+def _upsert_seed(query: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: copy.deepcopy(value)
+        for key, value in query.items()
+        if not key.startswith("$") and not isinstance(value, dict)
+    }
+
+
+def _sort_key(doc: Dict[str, Any], field: str) -> tuple:
+    value = _get(doc, field)
+    return (0, 0) if value in (_MISSING, None) else (1, value)
+
+
+class FakeCursor:
+    def __init__(self, docs: List[Dict[str, Any]]):
+        self._docs = docs
+
+    def sort(self, key: Any, direction: int = 1) -> "FakeCursor":
+        keys = key if isinstance(key, list) else [(key, direction)]
+        for field, order in reversed(keys):
+            self._docs.sort(key=lambda doc: _sort_key(doc, field), reverse=order < 0)
+        return self
+
+    def skip(self, count: int) -> "FakeCursor":
+        self._docs = self._docs[count:]
+        return self
+
+    def limit(self, count: int) -> "FakeCursor":
+        if count:
+            self._docs = self._docs[:count]
+        return self
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        return list(self._docs if length is None else self._docs[:length])
+
+    def __aiter__(self):
+        self._iter = iter(self._docs)
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    def __init__(self, name: str):
+        self.name = name
+        self.docs: List[Dict[str, Any]] = []
+        self.fail_ops: set[int] = set()
+        # bulk_write 직전에 호출되는 훅 (경합 재현용)
+        self.before_bulk_write: Optional[Callable[[list], Any]] = None
+
+    def with_options(self, **kwargs: Any) -> "FakeCollection":
+        return self
+
+    # 조회 ---------------------------------------------------------------
+    def find(self, query: Optional[Dict[str, Any]] = None, projection=None) -> FakeCursor:
+        return FakeCursor([_project(doc, projection) for doc in self.docs if matches(doc, query)])
+
+    async def find_one(self, query: Optional[Dict[str, Any]] = None, projection=None, **kwargs):
+        for doc in self.docs:
+            if matches(doc, query):
+                return _project(doc, projection)
+        return None
+
+    async def distinct(self, field: str, query: Optional[Dict[str, Any]] = None) -> list:
+        values = []
+        for doc in self.docs:
+            value = _get(doc, field)
+            if matches(doc, query) and value is not _MISSING and value not in values:
+                values.append(value)
+        return values
+
+    async def count_documents(self, query: Dict[str, Any]) -> int:
+        return sum(1 for doc in self.docs if matches(doc, query))
+
+    # 쓰기 ---------------------------------------------------------------
+    async def insert_one(self, doc: Dict[str, Any]):
+        doc.setdefault("_id", ObjectId())
+        self.docs.append(copy.deepcopy(doc))
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def insert_many(self, docs: List[Dict[str, Any]], ordered: bool = True):
+        for doc in docs:
+            await self.insert_one(doc)
+        return SimpleNamespace(inserted_ids=[doc["_id"] for doc in docs])
+
+    def _update(self, query, update, upsert: bool, many: bool):
+        matched = [doc for doc in self.docs if matches(doc, query)]
+        if not many:
+            matched = matched[:1]
+        for doc in matched:
+            _apply_update(doc, update, inserting=False)
+        upserted_id = None
+        if not matched and upsert:
+            doc = _upsert_seed(query)
+            _apply_update(doc, update, inserting=True)
+            doc.setdefault("_id", ObjectId())
+            self.docs.append(doc)
+            upserted_id = doc["_id"]
+        return SimpleNamespace(
+            matched_count=len(matched), modified_count=len(matched), upserted_id=upserted_id
+        )
+
+    async def update_one(self, query, update, upsert: bool = False, **kwargs):
+        return self._update(query, update, upsert, many=False)
+
+    async def update_many(self, query, update, upsert: bool = False, **kwargs):
+        return self._update(query, update, upsert, many=True)
+
+    def _delete(self, query, many: bool):
+        deleted = 0
+        for doc in list(self.docs):
+            if matches(doc, query):
+                self.docs.remove(doc)
+                deleted += 1
+                if not many:
+                    break
+        return SimpleNamespace(deleted_count=deleted)
+
+    async def delete_one(self, query):
+        return self._delete(query, many=False)
+
+    async def delete_many(self, query):
+        return self._delete(query, many=True)
+
+    async def find_one_and_update(
+        self, query, update, projection=None, upsert: bool = False, return_document=False, **kwargs
+    ):
+        for doc in self.docs:
+            if matches(doc, query):
+                before = copy.deepcopy(doc)
+                _apply_update(doc, update, inserting=False)
+                return _project(doc if return_document else before, projection)
+        if not upsert:
+            return None
+        doc = _upsert_seed(query)
+        _apply_update(doc, update, inserting=True)
+        doc.setdefault("_id", ObjectId())
+        self.docs.append(doc)
+        return _project(doc, projection) if return_document else None
+
+    async def bulk_write(self, operations: list, ordered: bool = True):
+        if self.before_bulk_write is not None:
+            hook, self.before_bulk_write = self.before_bulk_write, None
+            await hook(operations)
+        errors = []
+        for index, op in enumerate(operations):
+            if index in self.fail_ops:
+                errors.append({"index": index, "code": 11000, "errmsg": "simulated failure"})
+                if ordered:
+                    break
+                continue
+            if isinstance(op, (UpdateOne, UpdateMany)):
+                self._update(op._filter, op._doc, bool(op._upsert), many=isinstance(op, UpdateMany))
+            elif isinstance(op, ReplaceOne):
+                self._delete(op._filter, many=False)
+                doc = copy.deepcopy(op._doc)
+                self.docs.append(doc)
+            elif isinstance(op, (DeleteOne, DeleteMany)):
+                self._delete(op._filter, many=isinstance(op, DeleteMany))
+            elif isinstance(op, InsertOne):
+                await self.insert_one(op._doc)
+            else:
+                raise NotImplementedError(type(op).__name__)
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": 0})
+        return SimpleNamespace(bulk_api_result={})
+
+
+class FakeDatabase(dict):
+    """db["name"] / db.get_collection("name") 모두 같은 FakeCollection 반환"""
+
+    def __missing__(self, name: str) -> FakeCollection:
+        collection = self[name] = FakeCollection(name)
+        return collection
+
+    def get_collection(self, name: str) -> FakeCollection:
+        return self[name]
+
+    def with_options(self, **kwargs: Any) -> "FakeDatabase":
+        return self
+
+
+class FakeS3:
+    """list_objects_v2 / delete_objects만 구현한 S3 대역"""
+
+    def __init__(self, keys: List[str], fail_deletes: int = 0):
+        self.keys = sorted(keys)
+        self.fail_deletes = fail_deletes
+        self.delete_calls: List[List[str]] = []
+
+    def list_objects_v2(self, Bucket: str, Prefix: str, MaxKeys: int, ContinuationToken=None):
+        # 토큰은 마지막으로 반환한 키 (삭제와 병행해도 페이지가 밀리지 않음)
+        keys = [
+            key
+            for key in self.keys
+            if key.startswith(Prefix) and (ContinuationToken is None or key > ContinuationToken)
+        ]
+        page = keys[:MaxKeys]
+        response: Dict[str, Any] = {
+            "Contents": [{"Key": key} for key in page],
+            "IsTruncated": len(keys) > MaxKeys,
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = page[-1]
+        return response
+
+    def delete_objects(self, Bucket: str, Delete: Dict[str, Any]):
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        self.delete_calls.append(keys)
+        if self.fail_deletes:
+            self.fail_deletes -= 1
+            return {"Errors": [{"Key": keys[0], "Message": "simulated failure"}]}
+        self.keys = [key for key in self.keys if key not in set(keys)]
+        return {}
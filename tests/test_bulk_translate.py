@@ -0,0 +1,102 @@
+"""
+프로젝트 전체 번역 청크 분할 / 백그라운드 작업 테스트
+
+실행: pytest tests/test_bulk_translate.py -v
+"""
+
+import asyncio
+
+from bson import ObjectId
+
+from app.api.events import event_bus
+from app.api.segment import bulk_translate
+from app.api.segment.bulk_translate import chunk_by_token_budget, estimate_tokens
+from fakes import FakeDatabase
+
+
+def _items(*texts):
+    return [{"seg_idx": index, "text": text} for index, text in enumerate(texts)]
+
+
+def test_chunks_respect_token_budget_and_keep_order():
+    items = _items("a" * 30, "b" * 30, "c" * 30, "d" * 300)
+    budget = estimate_tokens("a" * 30) * 2
+
+    chunks = chunk_by_token_budget(items, budget, max_items=10)
+
+    assert [[item["seg_idx"] for item in chunk] for chunk in chunks] == [
+        [0, 1],
+        [2],
+        [3],  # 예산을 넘는 단일 항목은 단독 청크
+    ]
+
+
+def test_chunks_respect_max_items():
+    chunks = chunk_by_token_budget(_items(*"abcde"), budget=10_000, max_items=2)
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def _run_job(monkeypatch, translate_chunk, db=None):
+    if db is None:
+        db = FakeDatabase()
+    project_id = str(ObjectId())
+    segments = [
+        {"_id": ObjectId(), "source_text": f"원문 {i}", "start": float(i), "end": i + 1.0}
+        for i in range(3)
+    ]
+    items = [{"seg_idx": i, "text": s["source_text"]} for i, s in enumerate(segments)]
+    events = []
+
+    async def _publish(topic, key, event, data):
+        events.append((event, data))
+
+    monkeypatch.setattr(event_bus, "publish", _publish)
+    monkeypatch.setattr(bulk_translate, "_translate_chunk", translate_chunk)
+    asyncio.run(
+        bulk_translate._run_project_translation(
+            db, project_id, "en", "ko", False, segments, [items[:2], items[2:]]
+        )
+    )
+    return db, project_id, events
+
+
+def test_job_saves_translations_and_publishes_progress_events(monkeypatch):
+    async def _translate(db, chunk, language_code, src_lang, use_memory):
+        if chunk[0]["seg_idx"] == 2:
+            raise RuntimeError("quota exceeded")
+        return [
+            {"seg_idx": item["seg_idx"], "translation": f"t{item['seg_idx']}"}
+            for item in chunk
+        ]
+
+    db, project_id, events = _run_job(monkeypatch, _translate)
+
+    saved = db["segment_translations"].docs
+    assert sorted(doc["target_text"] for doc in saved) == ["t0", "t1"]
+    assert {doc["project_id"] for doc in saved} == {project_id}
+    assert {event for event, _ in events} == {"bulk-translation"}
+    last = events[-1][1]
+    assert (last["eventType"], last["projectId"], last["targetLang"]) == (
+        "bulk-translation",
+        project_id,
+        "en",
+    )
+    assert (last["status"], last["progress"]) == ("completed", 100)
+    assert last["metadata"] == {"translated": 2, "failed": 1, "total": 3}
+
+
+def test_job_failure_publishes_failed_event(monkeypatch):
+    async def _translate(db, chunk, language_code, src_lang, use_memory):
+        return [{"seg_idx": item["seg_idx"], "translation": "t"} for item in chunk]
+
+    async def _broken_bulk_write(operations, ordered=True):
+        raise RuntimeError("write timeout")
+
+    db = FakeDatabase()
+    monkeypatch.setattr(db["segment_translations"], "bulk_write", _broken_bulk_write)
+    _, _, events = _run_job(monkeypatch, _translate, db)
+
+    last = events[-1][1]
+    assert last["status"] == "failed"
+    assert last["metadata"]["error"] == "write timeout"
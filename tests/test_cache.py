@@ -0,0 +1,57 @@
+"""
+TTL 캐시 테스트
+
+실행: pytest tests/test_cache.py -v
+"""
+
+import asyncio
+
+from app.utils.cache import TTLCache
+
+
+def test_concurrent_loads_share_one_query():
+    cache = TTLCache("test_single_flight", ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["ko", "en"]
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_load("list", loader) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(result == ["ko", "en"] for result in results)
+
+
+def test_invalidate_during_load_discards_stale_value():
+    cache = TTLCache("test_invalidate", ttl=60)
+
+    async def run():
+        async def loader():
+            cache.invalidate()  # 로드 중 쓰기 발생
+            return "stale"
+
+        value = await cache.get_or_load("key", loader)
+        return value, cache.get("key")
+
+    value, cached = asyncio.run(run())
+
+    assert value == "stale"
+    assert cached is None
+
+
+def test_expired_and_evicted_entries():
+    cache = TTLCache("test_expiry", ttl=0, maxsize=2)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+    cache.ttl = 60
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
@@ -0,0 +1,63 @@
+"""
+MongoDB 모니터링 리스너/클라이언트 옵션 테스트
+
+실행: pytest tests/test_db_monitoring.py -v
+"""
+
+from datetime import timedelta
+
+from pymongo import monitoring
+
+from app.config.db import available_compressors
+from app.config.db_monitoring import (
+    MONGO_COMMAND_DURATION,
+    MONGO_POOL_CHECKOUT_FAILURES,
+    CommandMetricsListener,
+    PoolMetricsListener,
+)
+
+ADDRESS = ("db.local", 27017)
+
+
+def test_command_latency_is_labelled_by_collection():
+    listener = CommandMetricsListener()
+    listener.started(
+        monitoring.CommandStartedEvent(
+            {"find": "project_segments", "filter": {}}, "dupilot", 7, ADDRESS, 1
+        )
+    )
+    listener.succeeded(
+        monitoring.CommandSucceededEvent(
+            timedelta(milliseconds=2), {"ok": 1}, "find", 7, ADDRESS, 1
+        )
+    )
+
+    samples = MONGO_COMMAND_DURATION.snapshot()["samples"]
+    assert ["project_segments", "find"] in [labels for labels, _ in samples]
+    assert listener._collections == {}
+
+
+def test_pool_listener_tracks_connections_and_failures():
+    listener = PoolMetricsListener()
+    listener.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 1))
+    listener.connection_checked_out(
+        monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.01)
+    )
+    assert listener.connection_counts() == {
+        ("db.local:27017", "open"): 1,
+        ("db.local:27017", "in_use"): 1,
+    }
+
+    listener.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+    listener.connection_check_out_failed(
+        monitoring.ConnectionCheckOutFailedEvent(ADDRESS, "timeout", 5.0)
+    )
+    assert listener.connection_counts()[("db.local:27017", "in_use")] == 0
+    assert (
+        MONGO_POOL_CHECKOUT_FAILURES.value(address="db.local:27017", reason="timeout")
+        >= 1
+    )
+
+
+def test_unavailable_compressors_are_dropped():
+    assert available_compressors("zlib, unknown") == ["zlib"]
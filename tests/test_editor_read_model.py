@@ -0,0 +1,115 @@
+"""
+에디터 read model 변환 테스트
+
+실행: pytest tests/test_editor_read_model.py -v
+"""
+
+import asyncio
+
+from bson import ObjectId
+
+from app.api.project.models import SegmentTranslationResponse
+from app.api.segment.read_model import (
+    EDITOR_MODEL_FIELD,
+    EDITOR_READ_MODEL_VERSION,
+    EDITOR_SEGMENTS_COLLECTION,
+    compose_editor_segments,
+    from_editor_document,
+    rebuild_editor_language,
+    refresh_editor_segments,
+    to_editor_document,
+    voice_replacements_by_speaker,
+)
+from fakes import FakeDatabase
+
+
+def _sources():
+    project_id = str(ObjectId())
+    segment = {
+        "_id": ObjectId(),
+        "project_id": project_id,
+        "segment_index": 0,
+        "speaker_tag": "A",
+        "start": 0.0,
+        "end": 1.0,
+        "source_text": "안녕하세요",
+    }
+    untranslated = {**segment, "_id": ObjectId(), "segment_index": 1}
+    translation = {
+        "_id": ObjectId(),
+        "segment_id": str(segment["_id"]),
+        "language_code": "en",
+        "start": 0.2,
+        "end": 1.1,
+        "target_text": "Hello",
+    }
+    issue = {
+        "_id": ObjectId(),
+        "segment_translation_id": str(translation["_id"]),
+        "issue_type": "tts_quality",
+        "severity": "low",
+    }
+    return [segment, untranslated], [translation], [issue]
+
+
+def test_compose_merges_translation_issues_and_voice_replacement():
+    segments, translations, issues = _sources()
+    replacements = voice_replacements_by_speaker(
+        {"A": {"replace_voice": {"voice_sample_id": "v1", "similarity": 0.8}}}
+    )
+
+    merged = compose_editor_segments(segments, translations, issues, replacements, "en")
+
+    # 번역이 없는 세그먼트는 제외
+    assert len(merged) == 1
+    item = merged[0]
+    assert item["id"] == segments[0]["_id"]
+    assert item["translation_id"] == translations[0]["_id"]
+    assert (item["start"], item["target_text"]) == (0.2, "Hello")
+    assert [issue["_id"] for issue in item["issues"]] == [issues[0]["_id"]]
+    assert item["voice_replacement"]["voice_sample_id"] == "v1"
+
+
+def test_stored_document_round_trips_to_same_response():
+    segments, translations, issues = _sources()
+    merged = compose_editor_segments(segments, translations, issues, {}, "en")[0]
+
+    doc = to_editor_document(merged)
+
+    assert doc["_id"] == translations[0]["_id"]
+    assert doc["segment_id"] == str(segments[0]["_id"])
+    assert SegmentTranslationResponse.model_validate(
+        from_editor_document(doc)
+    ) == SegmentTranslationResponse.model_validate(merged)
+
+
+def test_edit_during_rebuild_is_not_lost():
+    db = FakeDatabase()
+    project_oid = ObjectId()
+    project_id = str(project_oid)
+    db["projects"].docs.append({"_id": project_oid, EDITOR_MODEL_FIELD: {}})
+    segment_oids = [ObjectId() for _ in range(3)]
+    for index, oid in enumerate(segment_oids):
+        db["project_segments"].docs.append(
+            {"_id": oid, "project_id": project_id, "segment_index": index, "source_text": "원문"}
+        )
+        db["segment_translations"].docs.append(
+            {"_id": ObjectId(), "segment_id": str(oid), "language_code": "en", "target_text": "old"}
+        )
+    edited = str(segment_oids[0])
+
+    async def edit_while_copying(operations):
+        # 재구성이 이미 원본을 읽은 뒤, 저장하기 전에 편집 + 증분 반영이 들어옴
+        for doc in db["segment_translations"].docs:
+            if doc["segment_id"] == edited:
+                doc["target_text"] = "new"
+        await refresh_editor_segments(db, project_id, [edited], "en")
+
+    db[EDITOR_SEGMENTS_COLLECTION].before_bulk_write = edit_while_copying
+
+    count = asyncio.run(rebuild_editor_language(db, project_id, "en"))
+
+    assert count == 3
+    stored = {doc["segment_id"]: doc for doc in db[EDITOR_SEGMENTS_COLLECTION].docs}
+    assert stored[edited]["target_text"] == "new"
+    assert db["projects"].docs[0][EDITOR_MODEL_FIELD]["en"] == EDITOR_READ_MODEL_VERSION
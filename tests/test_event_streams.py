@@ -0,0 +1,42 @@
+"""
+SSE 엔드포인트 구독 수명 테스트
+
+응답 객체만 만들고 스트림이 시작되지 않은 경우(시작 전 연결 종료)에도
+이벤트 버스 구독이 남지 않아야 합니다.
+
+실행: pytest tests/test_event_streams.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from app.api.events import event_bus
+from app.api.events.models import EventTopic
+from app.api.events.router import stream_events
+from app.api.pipeline.router import pipeline_events
+from app.api.progress.router import progress_events
+from app.api.storage.routes import stream_events as upload_events
+from app.api.voice_samples.router import stream_voice_sample_status
+
+PROJECT_ID = "project_123"
+
+
+@pytest.mark.parametrize(
+    "open_stream",
+    [
+        lambda: stream_events(None, topics=[EventTopic.PROGRESS], keys=[PROJECT_ID]),
+        lambda: pipeline_events(PROJECT_ID, None),
+        lambda: progress_events(None, project_id=PROJECT_ID),
+        lambda: upload_events(PROJECT_ID, None),
+        lambda: stream_voice_sample_status("sample_1", None),
+    ],
+    ids=["events", "pipeline", "progress", "upload", "voice-sample"],
+)
+def test_stream_not_started_leaves_no_subscription(open_stream):
+    before = event_bus.subscriber_count()
+
+    response = asyncio.run(open_stream())
+    del response
+
+    assert event_bus.subscriber_count() == before
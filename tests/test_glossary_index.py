@@ -0,0 +1,124 @@
+"""
+용어집 검색 엔진 테스트
+
+실행: pytest tests/test_glossary_index.py -v
+"""
+
+import asyncio
+import json
+
+import numpy as np
+
+from app.api.translate import glossary_index
+from app.api.translate.glossary_index import GlossaryEngine, PatternMatcher
+
+ENTRIES = [
+    {"term": "GPU", "preferred": "그래픽 카드", "forbidden": ["지피유"], "aliases": []},
+    {"term": "Rosé", "preferred": "로제", "forbidden": ["로지"], "aliases": ["rose"]},
+    {"term": "CPU", "preferred": "프로세서", "forbidden": [], "aliases": []},
+]
+
+
+def _write(directory, entries, embeddings=None):
+    with (directory / "base.jsonl").open("w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    if embeddings is not None:
+        np.save(directory / "base.npy", np.asarray(embeddings, dtype=np.float32))
+
+
+def test_matcher_finds_overlapping_patterns_in_one_pass():
+    matcher = PatternMatcher([("가나", "a"), ("나다", "b"), ("가나다라", "c")])
+
+    assert sorted(matcher.iter_matches("x가나다라")) == [
+        (1, 3, "a"),
+        (1, 5, "c"),
+        (2, 4, "b"),
+    ]
+
+
+def test_latin_terms_match_case_insensitively_on_word_boundaries():
+    matcher = PatternMatcher([("rose", "rose")])
+
+    assert [m[:2] for m in matcher.iter_matches("ROSE, rosemary")] == [(0, 4)]
+
+
+def test_search_ranks_lexical_hits_and_fills_with_vector_neighbours(tmp_path):
+    # GPU와 CPU가 가깝고 Rosé는 먼 임베딩
+    _write(tmp_path, ENTRIES, [[1, 0], [0, 1], [0.9, 0.1]])
+    index = GlossaryEngine(tmp_path).index()
+
+    hits = index.search("그 GPU를 지피유라고 부르면 안 돼", top_k=2)
+
+    assert [hit.entry.term for hit in hits] == ["GPU", "CPU"]
+    assert {match.kind for match in hits[0].matches} == {"term", "forbidden"}
+
+
+def test_engine_reloads_when_files_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "app.api.translate.glossary_index.GLOSSARY_RELOAD_INTERVAL", 0
+    )
+    _write(tmp_path, ENTRIES[:1])
+    engine = GlossaryEngine(tmp_path)
+    assert not engine.index().search("rose")
+
+    _write(tmp_path, ENTRIES + [{"term": "padding", "preferred": "x"}])
+
+    assert [hit.entry.term for hit in engine.index().search("rose")] == ["Rosé"]
+
+
+def test_reload_inside_event_loop_returns_snapshot_then_swaps(tmp_path, monkeypatch):
+    monkeypatch.setattr(glossary_index, "GLOSSARY_RELOAD_INTERVAL", 0)
+    _write(tmp_path, ENTRIES[:1])
+    engine = GlossaryEngine(tmp_path)
+    first = engine.index()
+    _write(tmp_path, ENTRIES + [{"term": "padding", "preferred": "x"}])
+
+    async def run():
+        # 리로드는 백그라운드로 넘기고 기존 스냅샷을 바로 반환
+        assert engine.index() is first
+        await engine._refresh_task
+        return engine.index()
+
+    reloaded = asyncio.run(run())
+
+    assert reloaded is not first
+    assert [hit.entry.term for hit in reloaded.search("rose")] == ["Rosé"]
+
+
+def test_failed_reload_keeps_previous_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(glossary_index, "GLOSSARY_RELOAD_INTERVAL", 0)
+    _write(tmp_path, ENTRIES)
+    engine = GlossaryEngine(tmp_path)
+    first = engine.index()
+    _write(tmp_path, ENTRIES[:1])
+
+    def _broken_load(directory):
+        raise ValueError("embedding shape mismatch")
+
+    # OSError가 아닌 오류도 이전 인덱스로 계속 응답
+    monkeypatch.setattr(glossary_index, "load_glossary_index", _broken_load)
+
+    async def run():
+        engine.index()
+        await engine._refresh_task
+        return engine.index()
+
+    assert asyncio.run(run()) is first
+    assert engine.index() is first
+
+
+def test_detect_glossary_issues_applies_all_replacements_in_one_pass(
+    tmp_path, monkeypatch
+):
+    from app.api.translate import service
+
+    _write(tmp_path, ENTRIES)
+    monkeypatch.setattr(service, "glossary_engine", GlossaryEngine(tmp_path))
+
+    review = service.detect_glossary_issues("Rosé", "로지야, ROSE랑 로지 지피유")
+
+    # 금지어는 모든 위치에서 교정, 권장어가 들어간 항목은 대체어 치환 생략
+    assert review["suggestion"] == "로제야, ROSE랑 로제 그래픽 카드"
+    assert [issue["kind"] for issue in review["issues"]] == ["forbidden", "forbidden"]
+
@@ -0,0 +1,75 @@
+"""
+참조 ID 정규화 테스트
+
+실행: pytest tests/test_ids.py -v
+"""
+
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+from app.api.repositories import IssueRepository
+from app.api.segment.service import SegmentService
+from app.utils.ids import normalize_refs, to_ref
+from fakes import FakeDatabase
+
+
+class _FakeDb:
+    def get_collection(self, name):
+        return name
+
+
+def test_to_ref_accepts_object_id_and_string():
+    oid = ObjectId()
+
+    assert to_ref(oid) == str(oid)
+    assert to_ref(str(oid)) == str(oid)
+    with pytest.raises(ValueError):
+        to_ref("not-an-id")
+
+
+def test_normalize_refs_only_touches_reference_fields():
+    oid = ObjectId()
+
+    doc = normalize_refs({"_id": oid, "project_id": oid}, ["project_id"])
+
+    assert doc == {"_id": oid, "project_id": str(oid)}
+
+
+def test_repository_normalizes_nested_filters():
+    oid = ObjectId()
+    repository = IssueRepository(_FakeDb())
+
+    query = repository.normalize(
+        {
+            "project_id": {"$in": [oid]},
+            "$or": [{"segment_translation_id": oid}, {"resolved": False}],
+        }
+    )
+
+    assert query == {
+        "project_id": {"$in": [str(oid)]},
+        "$or": [{"segment_translation_id": str(oid)}, {"resolved": False}],
+    }
+
+
+def test_create_or_update_translation_stores_project_id_as_string():
+    db = FakeDatabase()
+    project_id = ObjectId()
+    segment_id = str(ObjectId())
+    db["projects"].docs.append({"_id": project_id, "title": "p"})
+    db["project_segments"].docs.append(
+        {"_id": ObjectId(segment_id), "project_id": str(project_id), "segment_index": 0}
+    )
+    service = SegmentService(db)
+
+    async def run():
+        await service.create_or_update_translation(segment_id, "en", "a", str(project_id))
+        await service.create_or_update_translation(segment_id, "en", "b", project_id)
+
+    asyncio.run(run())
+
+    [stored] = db["segment_translations"].docs
+    assert stored["target_text"] == "b"
+    assert stored["project_id"] == str(project_id)
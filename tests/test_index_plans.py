@@ -0,0 +1,73 @@
+"""
+핫 쿼리 실행 계획 테스트
+
+INDEX_REGISTRY로 인덱스를 만든 빈 테스트 DB에서 HOT_QUERIES를 explain하여
+COLLSCAN이 나오면 실패합니다. (MongoDB가 없으면 skip)
+
+실행: pytest tests/test_index_plans.py -v
+"""
+
+import asyncio
+import os
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from app.config.indexes import HOT_QUERIES, find_collscan, reconcile_indexes
+
+MONGO_URL = os.getenv("MONGO_URL_DEV", "mongodb://localhost:27017")
+TEST_DB_NAME = "dupilot_index_test"
+
+
+@pytest.fixture(scope="module")
+def mongo():
+    client = MongoClient(MONGO_URL, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        pytest.skip("MongoDB not available")
+
+    async def _reconcile():
+        async_client = AsyncIOMotorClient(MONGO_URL)
+        try:
+            return await reconcile_indexes(async_client[TEST_DB_NAME])
+        finally:
+            async_client.close()
+
+    report = asyncio.run(_reconcile())
+    assert not report.failed
+    yield client[TEST_DB_NAME]
+    client.drop_database(TEST_DB_NAME)
+    client.close()
+
+
+@pytest.mark.parametrize(
+    "query", HOT_QUERIES, ids=[f"{q.collection}:{q.description}" for q in HOT_QUERIES]
+)
+def test_hot_query_uses_index(mongo, query):
+    cursor = mongo[query.collection].find(query.filter)
+    if query.sort:
+        cursor = cursor.sort(list(query.sort))
+
+    plan = cursor.explain()
+
+    assert not find_collscan(plan), f"COLLSCAN on {query.collection}: {query.filter}"
+
+
+def test_find_collscan_nested_stages():
+    plan = {
+        "queryPlanner": {
+            "winningPlan": {
+                "stage": "SORT",
+                "inputStage": {
+                    "stage": "OR",
+                    "inputStages": [{"stage": "IXSCAN"}, {"stage": "COLLSCAN"}],
+                },
+            }
+        }
+    }
+
+    assert find_collscan(plan)
+    assert not find_collscan({"queryPlanner": {"winningPlan": {"stage": "IXSCAN"}}})
@@ -0,0 +1,134 @@
+"""
+LLM 백엔드 추상화 테스트 (스텁 / 로컬 대역 서버)
+
+실행: pytest tests/test_llm_backend.py -v
+"""
+
+import asyncio
+import importlib.util
+import os
+
+import httpx
+import pytest
+
+from app.api.llm import (
+    LLMBackend,
+    LLMRequest,
+    LocalHttpBackend,
+    StubBackend,
+    set_llm_backend,
+)
+from app.api.segment.translate_service import (
+    TRANSLATION_PROMPT_VERSION,
+    LLMTranslator,
+    translation_memory_version,
+)
+from app.api.suggesion.service import build_suggestion_prompt, stream_suggestion
+from app.api.translate.rag import RAGCorrector
+
+_STANDIN_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "script", "llm_standin.py"
+)
+
+
+def _load_standin():
+    spec = importlib.util.spec_from_file_location("llm_standin", _STANDIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_translator_parses_stub_response():
+    translator = LLMTranslator(StubBackend())
+    items = [{"seg_idx": 4, "text": "안녕\n하세요"}, {"seg_idx": 9, "text": "감사합니다"}]
+
+    result = asyncio.run(translator.translate_batch_async(items, "en", "ko"))
+
+    assert result == [
+        {"seg_idx": 4, "translation": "[en] 안녕\n하세요"},
+        {"seg_idx": 9, "translation": "[en] 감사합니다"},
+    ]
+
+
+def test_backend_without_generate_or_stream_cannot_be_created():
+    class Incomplete(LLMBackend):
+        async def _generate(self, request):
+            return ""
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+class _VertexNamedStub(StubBackend):
+    name = "vertex"
+    default_model = "gemini-test"
+
+
+def test_translation_memory_version_follows_active_backend(monkeypatch):
+    # 환경변수가 vertex여도 실제로 교체된 백엔드가 스텁이면 메모리에 저장하지 않음
+    monkeypatch.setenv("LLM_BACKEND", "vertex")
+    monkeypatch.delenv("MT_BACKEND", raising=False)
+    try:
+        set_llm_backend(StubBackend())
+        assert translation_memory_version() is None
+
+        set_llm_backend(_VertexNamedStub())
+        assert translation_memory_version() == f"gemini-test:p{TRANSLATION_PROMPT_VERSION}"
+    finally:
+        set_llm_backend(None)
+
+
+def test_correct_batch_round_trips_through_stub():
+    set_llm_backend(StubBackend())
+    try:
+        items = [
+            {"id": "a", "source": "원문", "draft": "draft one"},
+            {"id": "b", "source": "원문 2", "draft": "draft two"},
+        ]
+        results = asyncio.run(RAGCorrector().correct_batch(items))
+    finally:
+        set_llm_backend(None)
+
+    assert {key: value["corrected_text"] for key, value in results.items()} == {
+        "a": "draft one",
+        "b": "draft two",
+    }
+
+
+def test_suggestion_stream_strips_quotes_across_chunks():
+    # 스텁은 16자 단위로 나눠 보내므로 따옴표가 별도 조각으로 끝나도 제거되어야 함
+    set_llm_backend(StubBackend(chunk_latency=0.001))
+    prompt = build_suggestion_prompt("원문", '"Short and sweet, see you soon"', "짧게", "영어")
+
+    async def collect():
+        return [chunk async for chunk in stream_suggestion(prompt)]
+
+    try:
+        chunks = asyncio.run(collect())
+    finally:
+        set_llm_backend(None)
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == "Short and sweet, see you soon"
+
+
+def test_local_http_backend_against_standin_server():
+    app = _load_standin().create_app(latency=0, chunk_latency=0)
+
+    async def run():
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://standin"
+        )
+        backend = LocalHttpBackend("http://standin", client=client)
+        try:
+            request = LLMRequest(task="correct", prompt="[SOURCE]\n원문\n\n[DRAFT]\n초안")
+            text = await backend.generate(request)
+            chunks = [chunk async for chunk in backend.stream(request)]
+        finally:
+            await backend.aclose()
+        return text, chunks
+
+    text, chunks = asyncio.run(run())
+
+    assert '"corrected_text": "초안"' in text
+    assert "".join(chunks) == text
@@ -0,0 +1,118 @@
+"""
+메트릭 집계/렌더링 테스트
+
+실행: pytest tests/test_metrics.py -v
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from app.api.jobs import service as job_service
+from app.api.jobs.models import JobUpdateStatus
+from app.utils.metrics import (
+    MetricsRegistry,
+    merge_snapshots,
+    render_prometheus,
+    sample_total,
+)
+from fakes import FakeDatabase
+
+
+def _registry_with_samples(events: int, latency: float) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    delivered = registry.counter("events_total", "events", ["topic"])
+    latency_hist = registry.histogram(
+        "latency_seconds", "latency", ["topic"], buckets=(0.1, 1.0)
+    )
+    for _ in range(events):
+        delivered.inc(topic="progress")
+        latency_hist.observe(latency, topic="progress")
+    return registry
+
+
+def test_merge_snapshots_sums_workers():
+    worker_a = _registry_with_samples(events=3, latency=0.05).snapshot()
+    worker_b = _registry_with_samples(events=2, latency=0.5).snapshot()
+
+    merged = merge_snapshots([worker_a, worker_b])
+
+    assert sample_total(merged, "events_total", topic="progress") == 5
+    assert sample_total(merged, "latency_seconds", topic="progress") == 5
+    histogram = merged["latency_seconds"]["samples"][("progress",)]
+    assert histogram["buckets"] == [3, 2, 0]
+
+
+def test_render_prometheus_cumulative_buckets():
+    merged = merge_snapshots([_registry_with_samples(events=2, latency=0.5).snapshot()])
+
+    text = render_prometheus(merged)
+
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{topic="progress",le="0.1"} 0' in text
+    assert 'latency_seconds_bucket{topic="progress",le="1"} 2' in text
+    assert 'latency_seconds_bucket{topic="progress",le="+Inf"} 2' in text
+    assert 'events_total{topic="progress"} 2' in text
+
+
+def test_gauge_collect_callback():
+    registry = MetricsRegistry()
+    registry.gauge(
+        "subscribers", "subs", ["topic", "key"], collect=lambda: {("progress", "p1"): 2}
+    )
+
+    merged = merge_snapshots([registry.snapshot(), registry.snapshot()])
+
+    assert sample_total(merged, "subscribers", key="p1") == 4
+
+
+@pytest.fixture
+def kst_host(monkeypatch):
+    # 로컬 시각이 UTC와 다른 호스트 (datetime.now()와 utcnow()가 9시간 차이)
+    monkeypatch.setenv("TZ", "Asia/Seoul")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _histogram_sum(metric, **labels):
+    key = [str(labels[name]) for name in metric.label_names]
+    for sample_key, sample in metric.snapshot()["samples"]:
+        if sample_key == key:
+            return sample["sum"]
+    return None
+
+
+def test_job_durations_use_one_clock(kst_host):
+    db = FakeDatabase()
+    job_oid = ObjectId()
+    created_at = datetime.utcnow() - timedelta(seconds=90)
+    db[job_service.JOB_COLLECTION].docs.append(
+        {
+            "_id": job_oid,
+            "project_id": str(ObjectId()),
+            "task": "clock-test",
+            "status": "queued",
+            "callback_url": "http://localhost/callback",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "history": [
+                {"status": "queued", "ts": created_at, "message": "job created"}
+            ],
+        }
+    )
+
+    asyncio.run(
+        job_service.update_job_status(db, str(job_oid), JobUpdateStatus(status="done"))
+    )
+
+    total = _histogram_sum(job_service.JOB_DURATION, task="clock-test", status="done")
+    stage = _histogram_sum(
+        job_service.JOB_STAGE_DURATION, task="clock-test", stage="done"
+    )
+    assert total == pytest.approx(90, abs=5)
+    assert stage == pytest.approx(90, abs=5)
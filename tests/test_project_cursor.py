@@ -0,0 +1,82 @@
+"""
+프로젝트 목록 keyset 커서 테스트
+
+실행: pytest tests/test_project_cursor.py -v
+"""
+
+import asyncio
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from app.api.project.service import (
+    ProjectService,
+    decode_project_cursor,
+    encode_project_cursor,
+)
+from fakes import FakeDatabase
+
+
+def test_cursor_round_trips():
+    doc = {"_id": ObjectId(), "created_at": datetime(2025, 3, 1, 12, 30, 15, 123000)}
+
+    assert decode_project_cursor(encode_project_cursor(doc)) == (
+        doc["created_at"],
+        doc["_id"],
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!!",
+        base64.urlsafe_b64encode(b"no-separator").decode(),
+        base64.urlsafe_b64encode(b"2025-01-01T00:00:00|not-an-oid").decode(),
+        base64.urlsafe_b64encode(f"yesterday|{ObjectId()}".encode()).decode(),
+    ],
+)
+def test_malformed_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_project_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_pages_with_equal_created_at_are_not_skipped_or_repeated():
+    db = FakeDatabase()
+    same_time = datetime(2025, 1, 1, 9, 0, 0)
+    # 7개 중 5개가 같은 created_at (페이지 경계가 동률 구간 안에 걸리도록)
+    created = [same_time] * 5 + [same_time - timedelta(days=1)] * 2
+    db["projects"].docs = [
+        {
+            "_id": ObjectId(),
+            "title": f"p{index}",
+            "status": "done",
+            "owner_code": "u1",
+            "created_at": created_at,
+        }
+        for index, created_at in enumerate(created)
+    ]
+    service = ProjectService(db)
+
+    async def collect_pages():
+        seen, pages, cursor = [], 0, None
+        while True:
+            projects, cursor = await service.get_project_paging(
+                user_id="u1", limit=2, cursor=cursor
+            )
+            seen.extend(str(project.id) for project in projects)
+            pages += 1
+            if cursor is None:
+                return seen, pages
+
+    seen, pages = asyncio.run(collect_pages())
+
+    expected = sorted(
+        db["projects"].docs, key=lambda doc: (doc["created_at"], doc["_id"]), reverse=True
+    )
+    assert seen == [str(doc["_id"]) for doc in expected]
+    assert pages == 4
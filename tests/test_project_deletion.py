@@ -0,0 +1,205 @@
+"""
+프로젝트 삭제 cascade job 테스트 (인메모리 DB/S3 대역)
+
+실행: pytest tests/test_project_deletion.py -v
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from app.api.events import event_bus
+from app.api.project import deletion
+from app.api.project.models import ProjectDeletionStatus
+from fakes import FakeDatabase, FakeS3
+
+OTHER_PROJECT = str(ObjectId())
+
+
+@pytest.fixture
+def events(monkeypatch):
+    published = []
+
+    async def _publish(topic, key, event, data):
+        published.append((event, data))
+
+    monkeypatch.setattr(event_bus, "publish", _publish)
+    return published
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    monkeypatch.setattr(deletion, "SEGMENT_DELETE_BATCH_SIZE", 2)
+    monkeypatch.setattr(deletion, "S3_DELETE_BATCH_SIZE", 2)
+
+
+def _seed(project_id: str, s3_keys: int = 5, segments: int = 5):
+    db = FakeDatabase()
+    db["projects"].docs.append({"_id": ObjectId(project_id), "title": "p"})
+    for owner in (project_id, OTHER_PROJECT):
+        for index in range(segments):
+            segment_oid = ObjectId()
+            db["project_segments"].docs.append(
+                {"_id": segment_oid, "project_id": owner, "segment_index": index}
+            )
+            db["segment_translations"].docs.append(
+                {"_id": ObjectId(), "segment_id": str(segment_oid), "language_code": "en"}
+            )
+        for name in deletion.CASCADE_COLLECTIONS:
+            db[name].docs.append({"_id": ObjectId(), "project_id": owner})
+    s3 = FakeS3(
+        [f"projects/{project_id}/asset-{i}" for i in range(s3_keys)]
+        + [f"projects/{OTHER_PROJECT}/asset-0"]
+    )
+    return db, s3
+
+
+async def _wait_for_jobs():
+    await asyncio.gather(*list(deletion._running.values()))
+
+
+def _remaining(db, project_id):
+    counts = {
+        name: sum(1 for doc in db[name].docs if doc.get("project_id") == project_id)
+        for name in ("project_segments", *deletion.CASCADE_COLLECTIONS)
+    }
+    counts["segment_translations"] = len(db["segment_translations"].docs)
+    return counts
+
+
+def test_deletes_in_batches_and_step_order(monkeypatch, events, small_batches):
+    project_id = str(ObjectId())
+    db, s3 = _seed(project_id)
+    monkeypatch.setattr(deletion, "s3", s3)
+    segment_batches = []
+    delete_segments = db["project_segments"].delete_many
+
+    async def _record_batch(query):
+        segment_batches.append(len(query["_id"]["$in"]))
+        return await delete_segments(query)
+
+    monkeypatch.setattr(db["project_segments"], "delete_many", _record_batch)
+
+    async def run():
+        job = await deletion.request_project_deletion(db, project_id)
+        await _wait_for_jobs()
+        return job
+
+    job = asyncio.run(run())
+
+    assert job["status"] == ProjectDeletionStatus.QUEUED
+    assert db["projects"].docs == []
+    assert segment_batches == [2, 2, 1]
+    assert [len(keys) for keys in s3.delete_calls] == [2, 2, 1]
+    assert s3.keys == [f"projects/{OTHER_PROJECT}/asset-0"]
+    # 다른 프로젝트의 데이터는 그대로
+    assert set(_remaining(db, project_id).values()) == {0, 5}
+    assert _remaining(db, OTHER_PROJECT)["project_segments"] == 5
+
+    steps = [data["step"] for event, data in events if event == "project_deletion" and "step" in data]
+    assert steps == list(deletion.DELETION_STEPS)
+    stored = db[deletion.PROJECT_DELETION_COLLECTION].docs[0]
+    assert stored["status"] == ProjectDeletionStatus.COMPLETED
+    assert stored["progress"] == 100
+    assert stored["steps"]["s3"] == 5 and stored["steps"]["project_segments"] == 5
+
+
+def test_failed_step_keeps_progress_and_retry_completes(monkeypatch, events):
+    project_id = str(ObjectId())
+    db, s3 = _seed(project_id)
+    monkeypatch.setattr(deletion, "s3", s3)
+    delete_jobs = db["jobs"].delete_many
+    calls = {"jobs": 0}
+
+    async def _flaky(query):
+        calls["jobs"] += 1
+        if calls["jobs"] == 1:
+            raise RuntimeError("connection reset")
+        return await delete_jobs(query)
+
+    monkeypatch.setattr(db["jobs"], "delete_many", _flaky)
+
+    async def first_attempt():
+        await deletion.request_project_deletion(db, project_id)
+        await _wait_for_jobs()
+
+    asyncio.run(first_attempt())
+
+    stored = db[deletion.PROJECT_DELETION_COLLECTION].docs[0]
+    assert stored["status"] == ProjectDeletionStatus.FAILED
+    assert stored["error"] == "connection reset"
+    done = list(deletion.DELETION_STEPS[: deletion.DELETION_STEPS.index("jobs")])
+    assert list(stored["steps"]) == done
+    assert events[-1][1]["status"] == ProjectDeletionStatus.FAILED
+
+    # 프로젝트 문서는 이미 지워졌어도 실패한 job은 다시 요청할 수 있음
+    async def retry():
+        job = await deletion.request_project_deletion(db, project_id)
+        await _wait_for_jobs()
+        return job
+
+    assert asyncio.run(retry()) is not None
+    stored = db[deletion.PROJECT_DELETION_COLLECTION].docs[0]
+    assert stored["status"] == ProjectDeletionStatus.COMPLETED
+    assert set(_remaining(db, project_id).values()) == {0, 5}
+
+
+def _running_job(project_id: str, lease_until: datetime, steps: dict):
+    return {
+        "_id": project_id,
+        "status": ProjectDeletionStatus.RUNNING,
+        "progress": 30,
+        "steps": steps,
+        "lease_until": lease_until,
+    }
+
+
+def test_resume_skips_completed_steps(monkeypatch, events):
+    project_id = str(ObjectId())
+    db, s3 = _seed(project_id)
+    db["projects"].docs.clear()
+    monkeypatch.setattr(deletion, "s3", s3)
+    # 이전 워커가 S3/세그먼트 단계까지 마치고 죽은 상태
+    finished = {"s3": 5, "project_segments": 5}
+    db[deletion.PROJECT_DELETION_COLLECTION].docs.append(
+        _running_job(project_id, datetime.now() - timedelta(minutes=1), finished)
+    )
+
+    async def run():
+        resumed = await deletion.resume_project_deletions(db)
+        await _wait_for_jobs()
+        return resumed
+
+    assert asyncio.run(run()) == 1
+
+    stored = db[deletion.PROJECT_DELETION_COLLECTION].docs[0]
+    assert stored["status"] == ProjectDeletionStatus.COMPLETED
+    assert stored["steps"]["s3"] == 5
+    assert s3.delete_calls == []  # 완료된 단계는 다시 수행하지 않음
+    assert _remaining(db, project_id)["project_segments"] == 5
+    assert all(_remaining(db, project_id)[name] == 0 for name in deletion.CASCADE_COLLECTIONS)
+
+
+def test_live_lease_is_not_taken_over_but_expired_lease_is(monkeypatch, events):
+    project_id = str(ObjectId())
+    db, s3 = _seed(project_id)
+    monkeypatch.setattr(deletion, "s3", s3)
+    deletions = db[deletion.PROJECT_DELETION_COLLECTION]
+    deletions.docs.append(
+        _running_job(project_id, datetime.now() + timedelta(minutes=3), {})
+    )
+
+    # 다른 워커가 lease를 갖고 있으면 아무것도 하지 않음
+    asyncio.run(deletion._run_deletion(db, project_id))
+    assert deletions.docs[0]["status"] == ProjectDeletionStatus.RUNNING
+    assert s3.delete_calls == []
+    assert _remaining(db, project_id)["jobs"] == 1
+
+    # lease가 만료되면 이어받아 끝까지 수행
+    deletions.docs[0]["lease_until"] = datetime.now() - timedelta(seconds=1)
+    asyncio.run(deletion._run_deletion(db, project_id))
+    assert deletions.docs[0]["status"] == ProjectDeletionStatus.COMPLETED
+    assert deletions.docs[0]["lease_until"] > datetime.now()
+    assert all(_remaining(db, project_id)[name] == 0 for name in deletion.CASCADE_COLLECTIONS)
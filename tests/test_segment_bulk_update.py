@@ -0,0 +1,121 @@
+"""
+세그먼트 일괄 업데이트 (변경 필드 비교 + unordered bulk_write) 테스트
+
+실행: pytest tests/test_segment_bulk_update.py -v
+"""
+
+import asyncio
+
+from bson import ObjectId
+
+from app.api.segment.model import SegmentUpdateData
+from app.api.segment.segment_service import SegmentService
+from fakes import FakeDatabase
+
+
+def _seed():
+    db = FakeDatabase()
+    project_id = ObjectId()
+    db["projects"].docs.append({"_id": project_id, "title": "p"})
+    segment_ids = [ObjectId() for _ in range(3)]
+    db["project_segments"].docs = [
+        {"_id": oid, "project_id": str(project_id), "source_text": f"원문 {i}"}
+        for i, oid in enumerate(segment_ids)
+    ]
+    # 세 번째 세그먼트는 아직 번역이 없음
+    db["segment_translations"].docs = [
+        {
+            "_id": ObjectId(),
+            "segment_id": str(oid),
+            "language_code": "en",
+            "target_text": f"text {i}",
+            "start": 0.0,
+            "end": 1.0,
+        }
+        for i, oid in enumerate(segment_ids[:2])
+    ]
+    return db, str(project_id), [str(oid) for oid in segment_ids]
+
+
+def _translation(db, segment_id):
+    return next(
+        doc for doc in db["segment_translations"].docs if doc["segment_id"] == segment_id
+    )
+
+
+def test_classifies_each_item_in_request_order():
+    db, project_id, (changed, same, untranslated) = _seed()
+    missing = str(ObjectId())
+    request = [
+        SegmentUpdateData(id=same, target_text="text 1", start=0.0),
+        SegmentUpdateData(id="not-an-id", target_text="x"),
+        SegmentUpdateData(id=changed, target_text="new text", source_text="원문 0"),
+        SegmentUpdateData(id=missing, target_text="x"),
+        SegmentUpdateData(id=untranslated, target_text="created"),
+        SegmentUpdateData(id=changed, start=2.0, end=1.0),
+    ]
+
+    response = asyncio.run(
+        SegmentService(db).update_segments_bulk(project_id, "en", request)
+    )
+
+    assert [(item.id, item.status) for item in response.results] == [
+        (same, "unchanged"),
+        ("not-an-id", "invalid"),
+        # 같은 세그먼트의 뒤 항목이 start > end라 invalid로 덮어씀
+        (changed, "invalid"),
+        (missing, "not_found"),
+        (untranslated, "updated"),
+    ]
+    assert response.updated_count == 1
+    # 값이 같은 항목은 쓰기를 하지 않음
+    assert "updated_at" not in _translation(db, same)
+    assert _translation(db, changed)["target_text"] == "text 0"
+    created = _translation(db, untranslated)
+    assert (created["language_code"], created["target_text"]) == ("en", "created")
+
+
+def test_only_changed_fields_are_written():
+    db, project_id, (changed, same, _) = _seed()
+    request = [
+        SegmentUpdateData(id=changed, target_text="new text", source_text="원문 0"),
+        SegmentUpdateData(id=same, source_text="고친 원문"),
+    ]
+
+    response = asyncio.run(
+        SegmentService(db).update_segments_bulk(project_id, "en", request)
+    )
+
+    assert [item.status for item in response.results] == ["updated", "updated"]
+    segments = {str(doc["_id"]): doc for doc in db["project_segments"].docs}
+    # 원문이 같으면 project_segments는 건드리지 않음
+    assert "updated_at" not in segments[changed]
+    assert segments[same]["source_text"] == "고친 원문"
+    assert _translation(db, changed)["target_text"] == "new text"
+    assert "updated_at" not in _translation(db, same)
+
+
+def test_partial_bulk_write_error_marks_only_failed_items():
+    db, project_id, (first, second, third) = _seed()
+    # 번역 bulk_write의 두 번째 연산(second)만 실패
+    db["segment_translations"].fail_ops = {1}
+    request = [
+        SegmentUpdateData(id=first, target_text="a"),
+        SegmentUpdateData(id=second, target_text="b"),
+        SegmentUpdateData(id=third, target_text="c"),
+    ]
+
+    response = asyncio.run(
+        SegmentService(db).update_segments_bulk(project_id, "en", request)
+    )
+
+    assert [(item.id, item.status) for item in response.results] == [
+        (first, "updated"),
+        (second, "failed"),
+        (third, "updated"),
+    ]
+    assert response.results[1].error == "simulated failure"
+    assert not response.success
+    assert response.updated_count == 2
+    assert _translation(db, first)["target_text"] == "a"
+    assert _translation(db, second)["target_text"] == "text 1"
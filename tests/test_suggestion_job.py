@@ -0,0 +1,147 @@
+"""
+프로젝트 용어 교정 제안 job 테스트 (인메모리 DB 대역)
+
+실행: pytest tests/test_suggestion_job.py -v
+"""
+
+import asyncio
+import json
+
+import pytest
+from bson import ObjectId
+
+from app.api.events import event_bus
+from app.api.translate import suggestion_job
+from app.api.translate.glossary_index import GlossaryEngine
+from fakes import FakeDatabase
+
+ENTRIES = [
+    {"term": "GPU", "preferred": "그래픽 카드", "forbidden": ["지피유"], "aliases": []},
+    {"term": "Rosé", "preferred": "로제", "forbidden": ["로지"], "aliases": ["rose"]},
+]
+
+
+class FakeCorrector:
+    """배치마다 정해진 결과를 돌려주고, fail_ids가 들어 있는 배치는 실패"""
+
+    def __init__(self, corrections, fail_ids=()):
+        self.corrections = corrections
+        self.fail_ids = set(fail_ids)
+        self.batches = []
+
+    async def correct_batch(self, items):
+        self.batches.append([item["id"] for item in items])
+        if self.fail_ids & {item["id"] for item in items}:
+            raise RuntimeError("model overloaded")
+        return {
+            item["id"]: {"corrected_text": self.corrections[item["id"]], "message": "용어"}
+            for item in items
+            if item["id"] in self.corrections
+        }
+
+
+@pytest.fixture
+def events(monkeypatch):
+    published = []
+
+    async def _publish(topic, key, event, data):
+        published.append((event, data))
+
+    monkeypatch.setattr(event_bus, "publish", _publish)
+    return published
+
+
+@pytest.fixture
+def glossary(tmp_path, monkeypatch):
+    with (tmp_path / "base.jsonl").open("w", encoding="utf-8") as f:
+        for entry in ENTRIES:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    monkeypatch.setattr(suggestion_job, "glossary_engine", GlossaryEngine(tmp_path))
+
+
+def _seed():
+    db = FakeDatabase()
+    project_id = str(ObjectId())
+    texts = [
+        ("my GPU", "내 지피유"),
+        ("hello", "안녕"),
+        ("Rosé", ""),
+        ("rose garden", "로지 정원"),
+        ("GPU again", "그래픽 카드 다시"),
+    ]
+    db["segments"].docs = [
+        {
+            "_id": ObjectId(),
+            "project_id": project_id,
+            "segment_text": source,
+            "translate_context": draft,
+        }
+        for source, draft in texts
+    ]
+    ids = [str(doc["_id"]) for doc in db["segments"].docs]
+    return db, project_id, ids
+
+
+def _run(db, project_id, corrector, monkeypatch):
+    monkeypatch.setattr(suggestion_job, "_get_corrector", lambda: corrector)
+    monkeypatch.setattr(suggestion_job, "SUGGESTION_BATCH_SIZE", 1)
+
+    async def run():
+        started = await suggestion_job.start_project_suggestion(db, project_id)
+        await asyncio.gather(*list(suggestion_job._running.values()))
+        return started
+
+    return asyncio.run(run())
+
+
+def test_select_candidates_sends_only_segments_with_glossary_hits(glossary):
+    segments = [
+        {"_id": 1, "segment_text": "my GPU", "translate_context": "내 지피유"},
+        {"_id": 2, "segment_text": "hello", "translate_context": "안녕"},
+        {"_id": 3, "segment_text": "Rosé", "translate_context": ""},
+    ]
+
+    candidates = suggestion_job.select_candidates(segments)
+
+    assert [item["id"] for item in candidates] == ["1"]
+
+
+def test_job_saves_issues_and_publishes_progress(glossary, events, monkeypatch):
+    db, project_id, ids = _seed()
+    # 세 번째 후보는 이미 권장어를 써서 그대로 돌려줌 → 이슈 없음
+    corrector = FakeCorrector(
+        {ids[0]: "내 그래픽 카드", ids[3]: "로제 정원", ids[4]: "그래픽 카드 다시"},
+        fail_ids={ids[3]},
+    )
+
+    started = _run(db, project_id, corrector, monkeypatch)
+
+    assert (started["status"], started["candidate_segments"]) == ("queued", 3)
+    assert sorted(corrector.batches) == sorted([[ids[0]], [ids[3]], [ids[4]]])
+    saved = db["issues"].docs
+    assert [(doc["segment_id"], doc["recommend_text"]) for doc in saved] == [
+        (ids[0], "내 그래픽 카드")
+    ]
+    assert {event for event, _ in events} == {"glossary-suggestion"}
+    last = events[-1][1]
+    assert (last["eventType"], last["projectId"]) == ("glossary-suggestion", project_id)
+    assert (last["status"], last["progress"]) == ("completed", 100)
+    assert last["metadata"] == {"total": 3, "checked": 2, "failed": 1, "issues": 1}
+
+
+def test_insert_failure_publishes_failed_event(glossary, events, monkeypatch):
+    db, project_id, ids = _seed()
+
+    async def _broken_insert_many(docs, ordered=True):
+        raise RuntimeError("write timeout")
+
+    monkeypatch.setattr(db["issues"], "insert_many", _broken_insert_many)
+    corrector = FakeCorrector({ids[0]: "내 그래픽 카드"})
+
+    _run(db, project_id, corrector, monkeypatch)
+
+    # 다른 배치가 끝난 뒤 마지막 이벤트로 실패를 알림
+    last = events[-1][1]
+    assert last["status"] == "failed"
+    assert last["metadata"]["error"] == "write timeout"
+    assert suggestion_job._running == {}
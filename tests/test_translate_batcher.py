@@ -0,0 +1,66 @@
+"""
+번역 마이크로 배칭 테스트
+
+실행: pytest tests/test_translate_batcher.py -v
+"""
+
+import asyncio
+
+from app.api.segment.translate_batcher import TranslationBatcher
+
+
+class _FakeTranslate:
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    async def __call__(self, items, target_lang, src_lang):
+        self.calls.append((src_lang, target_lang, [item["text"] for item in items]))
+        if self.fail:
+            raise RuntimeError("quota exceeded")
+        return [
+            {"seg_idx": item["seg_idx"], "translation": f"{target_lang}:{item['text']}"}
+            for item in items
+        ]
+
+
+def test_concurrent_requests_share_one_call_per_language_pair():
+    translate = _FakeTranslate()
+    batcher = TranslationBatcher(translate, window=0.05, max_items=10)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.translate("a", "en", "ko"),
+            batcher.translate("b", "en", "ko"),
+            batcher.translate("a", "en", "ko"),
+            batcher.translate("a", "ja", "ko"),
+        )
+
+    results = asyncio.run(run())
+
+    assert results == ["en:a", "en:b", "en:a", "ja:a"]
+    # 같은 언어 쌍은 한 번, 중복 원문은 한 번만 전송
+    assert sorted(translate.calls) == [
+        ("ko", "en", ["a", "b"]),
+        ("ko", "ja", ["a"]),
+    ]
+
+
+def test_full_batch_flushes_before_window_and_errors_propagate():
+    translate = _FakeTranslate(fail=True)
+    batcher = TranslationBatcher(translate, window=60, max_items=2)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                batcher.translate("a", "en"),
+                batcher.translate("b", "en"),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+
+    results = asyncio.run(run())
+
+    assert len(translate.calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
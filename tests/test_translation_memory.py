@@ -0,0 +1,31 @@
+"""
+번역 메모리 키/조회 테스트
+
+실행: pytest tests/test_translation_memory.py -v
+"""
+
+import asyncio
+
+from app.api.segment.translation_memory import (
+    TRANSLATION_MEMORY_CACHE,
+    lookup_translations,
+    memory_key,
+)
+
+
+def test_key_ignores_whitespace_but_not_case_or_version():
+    base = memory_key("Thank you", "ko", "en", "m:p1")
+
+    assert memory_key(" Thank　 you\n", "ko", "en", "m:p1") == base
+    assert memory_key("thank you", "ko", "en", "m:p1") != base
+    assert memory_key("Thank you", "ko", "en", "m:p2") != base
+    assert memory_key("Thank you", None, "en", "m:p1").startswith("auto:en:")
+
+
+def test_cached_entries_are_served_without_db():
+    TRANSLATION_MEMORY_CACHE.set(memory_key("안녕", "ko", "en", "v"), "Hello")
+
+    # 모두 LRU에 있으면 DB를 건드리지 않음
+    hits = asyncio.run(lookup_translations(None, ["안녕"], "ko", "en", "v"))
+
+    assert hits == {"안녕": "Hello"}